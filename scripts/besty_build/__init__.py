@@ -0,0 +1,6 @@
+"""
+Shared build helpers for the Python content generators in scripts/.
+The generate-*.py scripts import from here (scripts/ is on sys.path when
+they run), so each stage lives in its own small module. From scripts/,
+``python3 -m besty_build`` lists the stages and runs any one of them.
+"""
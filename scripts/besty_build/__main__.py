@@ -0,0 +1,74 @@
+"""
+One entry point for the build stages. Run from scripts/:
+
+    python3 -m besty_build                        list the stages
+    python3 -m besty_build catalog --jobs 4       run one stage; its options follow
+    python3 -m besty_build images --help
+
+Only the chosen stage's module is imported, so listing the stages or
+running a cheap one doesn't pay for the others' imports. Startup times are
+checked against a budget by ``python3 -m besty_build bench-startup``.
+"""
+
+import importlib
+import sys
+
+# name -> (module, entry point, summary)
+STAGES = {
+    "catalog": (".generators", "main_catalog", "Leitpunkt scenarios with Redemittel choices"),
+    "all-59": (".generators", "main_all_59", "Aufgabe and Leitpunkte only, for the AI trainer"),
+    "complete": (".generators", "main_complete", "complete dialogues + templated ones"),
+    "batch-1": (".generators", "main_batch_1", "the complete natural dialogues written so far"),
+    "shards": (".shards", "main", "live catalog index + per-scenario shards for the app"),
+    "search": (".search", "main", "full-text search index over the scenarios"),
+    "prompts": (".prompts", "main", "precompiled per-scenario tutor prompts"),
+    "strtable": (".strtable", "main", "string-table encoded catalog and its size report"),
+    "catdiff": (".catdiff", "main", "delta patches between catalog versions"),
+    "quiz": (".quiz", "main", "Klett quiz HTML → themes/"),
+    "audio": (".audio", "main", "MP3 frame index for the Hören tracks"),
+    "images": (".images", "main", "image manifest for public/"),
+    "prerender": (".prerender", "main", "pre-rendered catalog listing HTML with the index inlined"),
+    "precache": (".precache", "main", "service-worker precache manifest with tier budgets"),
+    "einbuergerung": (".einbuergerung", "main", "Einbürgerungstest shards and mock exams"),
+    "contentdb": (".contentdb", "main", "SQLite content database with full-text search"),
+    "watch": (".watch", "main", "rebuild what a saved file affects"),
+    "dedup": (".dedup", "main", "near-duplicates and drift across scenario sources"),
+    "loader": (".loader", "main", "report on corrupt data files"),
+    "batchgen": (".batchgen", "main", "offline batch generation of dialogue steps"),
+    "stubchat": (".stubchat", "main", "local /chat/completions stand-in"),
+    "synthetic": (".synthetic", "main", "seeded synthetic catalogs for load testing"),
+    "bench-pipeline": (".bench.pipeline", "main", "generator and pipeline benchmarks"),
+    "bench-parallel": (".bench.parallel", "main", "scaling of --jobs"),
+    "bench-model": (".bench.model", "main", "slotted scenario objects vs dicts"),
+    "bench-search": (".bench.search", "main", "search query latency"),
+    "bench-streaming": (".bench.streaming", "main", "streaming writer RSS and throughput"),
+    "bench-contentdb": (".bench.contentdb", "main", "content database build and lookup latency"),
+    "bench-startup": (".bench.startup", "main", "startup time of this entry point"),
+}
+
+
+def usage():
+    width = max(map(len, STAGES))
+    lines = ["usage: python3 -m besty_build STAGE [options]", "", "stages:"]
+    lines += [f"  {name:<{width}}  {summary}" for name, (_, _, summary) in STAGES.items()]
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] in ("-h", "--help"):
+        print(usage())
+        return 0
+    name, rest = argv[0], argv[1:]
+    if name not in STAGES:
+        print(f"❌ Unknown stage {name!r}\n\n{usage()}", file=sys.stderr)
+        return 2
+    module, entry, _ = STAGES[name]
+    # The stage parses sys.argv itself, as when it runs as python3 -m besty_build.<module>
+    sys.argv = [f"besty_build {name}", *rest]
+    getattr(importlib.import_module(module, "besty_build"), entry)()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
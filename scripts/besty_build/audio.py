@@ -0,0 +1,340 @@
+"""
+MP3 frame index for the Hören tracks.
+
+Walks the MPEG audio frame headers of every public/audio/hoeren/*.mp3 (no
+decoder, no dependencies) and merges per track into
+public/data/dtz/hoeren-tests.json:
+
+    size, sha256        the file as served
+    durationSec         exact: audio frames × samples per frame, minus the
+                        encoder delay/padding from the LAME/Lavc tag
+    bitrate             average kbit/s over the audio frames (vbr: whether it varies)
+    sampleRate, channels, frames
+    audioStart          byte offset of the first audio frame (after ID3 and the Xing/Info frame)
+    seekInterval, seek  byte offset of the frame playing at 0, 1, 2 … seconds
+
+Items with a ``startTime`` also get ``startByte``, so the player can fetch
+a Teil with ``Range: bytes=<startByte>-`` instead of downloading the audio
+before it. Tracks whose size, mtime or content hash are unchanged are taken
+from the build cache without parsing them again.
+
+hoeren-tests.json is written in the same layout prettier gives it.
+
+    python3 -m besty_build.audio
+    python3 -m besty_build.audio --jobs 2
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import time
+from pathlib import Path
+
+from .incremental import BuildManifest, content_hash, write_artifact
+from .parallel import ordered_map
+from .paths import DATA_DIR, PUBLIC_DIR, relpath
+
+AUDIO_DIR = PUBLIC_DIR / "audio" / "hoeren"
+HOEREN_TESTS = DATA_DIR / "dtz" / "hoeren-tests.json"
+TRACK_GLOB = "MEz_DTZ_Track_*.mp3"
+SEEK_INTERVAL = 1
+PRINT_WIDTH = 80
+
+# kbit/s by [MPEG-1?][layer][index]; index 0 is "free", 15 invalid
+_BITRATES = {
+    (True, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+# Hz by version bits (3 = MPEG-1, 2 = MPEG-2, 0 = MPEG-2.5)
+_SAMPLE_RATES = {3: (44100, 48000, 32000), 2: (22050, 24000, 16000), 0: (11025, 12000, 8000)}
+_LAME_ENCODERS = (b"LAME", b"Lavc", b"Lavf", b"L3.9")
+
+
+class Mp3FormatError(ValueError):
+    """A file without a run of valid MPEG audio frames."""
+
+
+class FrameHeader:
+    __slots__ = ("mpeg1", "layer", "bitrate", "sample_rate", "channels", "length", "samples", "side_info")
+
+    def __init__(self, mpeg1, layer, bitrate, sample_rate, channels, length, samples, side_info):
+        self.mpeg1 = mpeg1
+        self.layer = layer
+        self.bitrate = bitrate  # kbit/s
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.length = length  # bytes, header included
+        self.samples = samples  # per frame
+        self.side_info = side_info  # bytes between the (CRC-less) header and the main data
+
+
+def parse_header(buf, pos):
+    """The FrameHeader starting at ``pos``, or None if there is no valid one."""
+    if pos + 4 > len(buf) or buf[pos] != 0xFF or buf[pos + 1] & 0xE0 != 0xE0:
+        return None
+    b1, b2, b3 = buf[pos + 1], buf[pos + 2], buf[pos + 3]
+    version = (b1 >> 3) & 3
+    layer = 4 - ((b1 >> 1) & 3)
+    bitrate_index = b2 >> 4
+    rate_index = (b2 >> 2) & 3
+    if version == 1 or layer == 4 or bitrate_index in (0, 15) or rate_index == 3:
+        return None
+    mpeg1 = version == 3
+    bitrate = _BITRATES[mpeg1, layer][bitrate_index]
+    sample_rate = _SAMPLE_RATES[version][rate_index]
+    padding = (b2 >> 1) & 1
+    channels = 1 if b3 >> 6 == 3 else 2
+    if layer == 1:
+        samples = 384
+        length = (12000 * bitrate // sample_rate + padding) * 4
+    else:
+        samples = 1152 if mpeg1 or layer == 2 else 576
+        length = samples // 8 * 1000 * bitrate // sample_rate + padding
+    if layer == 3:
+        side_info = (32 if channels == 2 else 17) if mpeg1 else (17 if channels == 2 else 9)
+    else:
+        side_info = 0
+    return FrameHeader(mpeg1, layer, bitrate, sample_rate, channels, length, samples, side_info)
+
+
+def id3v2_size(buf):
+    """Bytes taken by a leading ID3v2 tag (0 if there is none)."""
+    if len(buf) < 10 or buf[:3] != b"ID3":
+        return 0
+    size = (buf[6] & 0x7F) << 21 | (buf[7] & 0x7F) << 14 | (buf[8] & 0x7F) << 7 | (buf[9] & 0x7F)
+    footer = 10 if buf[5] & 0x10 else 0
+    return 10 + size + footer
+
+
+def audio_end(buf):
+    """End of the frame data: before a trailing ID3v1 tag."""
+    end = len(buf)
+    if end >= 128 and buf[end - 128:end - 125] == b"TAG":
+        end -= 128
+    return end
+
+
+def xing_info(buf, pos, header):
+    """
+    ``(is_tag_frame, delay, padding)`` for the frame at ``pos``: whether it is
+    a Xing/Info metadata frame, and the encoder delay and padding (samples)
+    from its LAME-style extension.
+    """
+    tag = pos + 4 + header.side_info
+    if bytes(buf[tag:tag + 4]) not in (b"Xing", b"Info"):
+        return False, 0, 0
+    flags = int.from_bytes(buf[tag + 4:tag + 8], "big")
+    ext = tag + 8 + 4 * bool(flags & 1) + 4 * bool(flags & 2) + 100 * bool(flags & 4) + 4 * bool(flags & 8)
+    if bytes(buf[ext:ext + 4]) not in _LAME_ENCODERS or ext + 24 > pos + header.length:
+        return True, 0, 0
+    packed = int.from_bytes(buf[ext + 21:ext + 24], "big")
+    return True, packed >> 12, packed & 0xFFF
+
+
+def sync(buf, pos, end):
+    """Offset of the next frame at or after ``pos`` that is followed by another valid frame."""
+    while True:
+        pos = buf.find(b"\xff", pos, end)
+        if pos < 0:
+            return -1
+        header = parse_header(buf, pos)
+        if header and (pos + header.length >= end or parse_header(buf, pos + header.length)):
+            return pos
+        pos += 1
+
+
+def index_frames(buf, interval=SEEK_INTERVAL):
+    """Duration, bitrate and seek table of the MP3 in ``buf`` (bytes or mmap)."""
+    end = audio_end(buf)
+    pos = sync(buf, id3v2_size(buf), end)
+    if pos < 0:
+        raise Mp3FormatError("no MPEG audio frames found")
+    first = parse_header(buf, pos)
+    is_tag, delay, padding = xing_info(buf, pos, first)
+    if is_tag:
+        pos += first.length
+
+    audio_start = pos
+    frames = samples = audio_bytes = 0
+    bitrates = set()
+    seek = []
+    next_mark = 0  # sample position of the next seek table entry
+    step = interval * first.sample_rate
+    while pos < end:
+        header = parse_header(buf, pos)
+        if header is None or pos + header.length > end:
+            resync = sync(buf, pos + 1, end)
+            if resync < 0:
+                break
+            pos = resync
+            continue
+        while samples + header.samples > next_mark:
+            seek.append(pos)
+            next_mark += step
+        frames += 1
+        samples += header.samples
+        audio_bytes += header.length
+        bitrates.add(header.bitrate)
+        pos += header.length
+
+    if not frames:
+        raise Mp3FormatError("no MPEG audio frames found")
+    duration = max(0, samples - delay - padding) / first.sample_rate
+    return {
+        "durationSec": round(duration, 3),
+        "bitrate": round(audio_bytes * 8 / (samples / first.sample_rate) / 1000, 1),
+        "vbr": len(bitrates) > 1,
+        "sampleRate": first.sample_rate,
+        "channels": first.channels,
+        "frames": frames,
+        "audioStart": audio_start,
+        "seekInterval": interval,
+        "seek": seek,
+    }
+
+
+def file_digest(path):
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        return hashlib.sha256(buf).hexdigest()
+
+
+def index_file(path):
+    """Frame index of one track plus its size and hash; runs in a worker."""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        info = index_frames(buf)
+        return dict({"size": len(buf), "sha256": hashlib.sha256(buf).hexdigest()}, **info)
+
+
+def start_byte(info, seconds):
+    """Byte offset to start a Range request from to play from ``seconds``."""
+    slot = int(seconds // info["seekInterval"])
+    return info["seek"][min(slot, len(info["seek"]) - 1)]
+
+
+def merge(tests, tracks):
+    """Add ``audio`` per test and ``startByte`` per timed item; returns the referenced tracks without an index."""
+    missing = set()
+    for test in tests.values():
+        audio = {}
+        for part in test.get("parts", []):
+            names = list(part.get("tracks", {}).values()) + [item["track"] for item in part.get("items", [])
+                                                            if "track" in item]
+            for name in names:
+                if name in tracks:
+                    audio[name] = tracks[name]
+                else:
+                    missing.add(name)
+            for item in part.get("items", []):
+                if "startTime" in item and item.get("track") in tracks:
+                    item["startByte"] = start_byte(tracks[item["track"]], item["startTime"])
+                else:
+                    item.pop("startByte", None)
+        test["audio"] = dict(sorted(audio.items()))
+    return sorted(missing)
+
+
+def _scalar(value):
+    return json.dumps(value, ensure_ascii=False)
+
+
+def format_json(value, indent=0, prefix=0):
+    """
+    JSON text laid out like prettier's: objects expanded, arrays of scalars on
+    one line when they fit in PRINT_WIDTH, long number arrays filled.
+    ``prefix`` is the width of the ``"key": `` before the value.
+    """
+    pad = " " * (indent + 2)
+    if isinstance(value, dict):
+        if not value:
+            return "{}"
+        items = [f"{pad}{_scalar(k)}: {format_json(v, indent + 2, len(_scalar(k)) + 2)}" for k, v in value.items()]
+        return "{\n" + ",\n".join(items) + "\n" + " " * indent + "}"
+    if isinstance(value, list):
+        if not value:
+            return "[]"
+        if all(not isinstance(v, (dict, list)) for v in value):
+            flat = "[" + ", ".join(_scalar(v) for v in value) + "]"
+            if indent + prefix + len(flat) + 1 <= PRINT_WIDTH:
+                return flat
+            if all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in value):
+                lines, line = [], ""
+                for v in value:
+                    word = _scalar(v) + ","
+                    if line and len(pad) + len(line) + 1 + len(word) > PRINT_WIDTH:
+                        lines.append(line)
+                        line = word
+                    else:
+                        line = f"{line} {word}" if line else word
+                lines.append(line[:-1])
+                return "[\n" + "\n".join(pad + line for line in lines) + "\n" + " " * indent + "]"
+        items = [pad + format_json(v, indent + 2) for v in value]
+        return "[\n" + ",\n".join(items) + "\n" + " " * indent + "]"
+    return _scalar(value)
+
+
+def track_files(audio_dir=AUDIO_DIR):
+    return sorted(Path(audio_dir).glob(TRACK_GLOB))
+
+
+def build(audio_dir=AUDIO_DIR, tests_path=HOEREN_TESTS, jobs=1, force=False, manifest=None):
+    """Index every track (unchanged ones from cache) and merge into ``tests_path``."""
+    manifest = manifest or BuildManifest()
+    recipe = content_hash("audio", Path(__file__).read_text(encoding="utf-8"))
+    paths = track_files(audio_dir)
+
+    keys, records, missing = [], [], []
+    for path in paths:
+        digest = manifest.stat_digest(path) or file_digest(path)
+        manifest.record(path, digest, {})
+        key = content_hash(recipe, digest)
+        keys.append(key)
+        records.append(None if force else manifest.get_fragment(key))
+        if records[-1] is None:
+            missing.append(path)
+
+    parsed = iter(ordered_map(index_file, missing, jobs))
+    tracks = {}
+    for path, key, record in zip(paths, keys, records):
+        if record is None:
+            info = next(parsed)
+            manifest.put_fragment(key, "", info)
+            record = {"summary": info}
+        tracks[path.name] = record["summary"]
+
+    with open(tests_path, encoding="utf-8") as f:
+        tests = json.load(f)
+    unindexed = merge(tests, tracks)
+    text = format_json(tests) + "\n"
+    written = write_artifact(manifest, Path(tests_path), text.encode("utf-8"),
+                             {name: key for name, key in zip(tracks, keys)}, force, publish=True)
+    manifest.save()
+    return tracks, len(missing), unindexed, written
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--audio-dir", default=str(AUDIO_DIR))
+    parser.add_argument("--tests", default=str(HOEREN_TESTS))
+    parser.add_argument("--jobs", type=int, default=1, metavar="N", help="parse with N processes (0 = one per CPU)")
+    parser.add_argument("--force", action="store_true", help="parse every track even if unchanged")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    tracks, parsed, unindexed, written = build(args.audio_dir, args.tests, jobs=args.jobs, force=args.force)
+    elapsed = time.perf_counter() - start
+    print(f"✅ {len(tracks)} tracks in {elapsed * 1000:.0f} ms ({parsed} parsed, {len(tracks) - parsed} unchanged)")
+    for name, info in tracks.items():
+        print(f"   {name}: {info['durationSec']:.3f} s, {info['bitrate']} kbit/s{' VBR' if info['vbr'] else ''}, "
+              f"{info['sampleRate']} Hz, {info['frames']} frames, {len(info['seek'])} seek points")
+    for name in unindexed:
+        print(f"⚠️  {name} is referenced but not in {relpath(args.audio_dir)}")
+    print(f"📝 {relpath(args.tests)}: {'written' if written else 'unchanged'}")
+
+
+if __name__ == "__main__":
+    main()
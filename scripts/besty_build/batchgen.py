@@ -0,0 +1,357 @@
+"""
+Offline batch generation of dialogue steps.
+
+Fills ``dialogue`` (greeting, steps, closing) for every scenario by calling a
+chat-completion endpoint, instead of shipping hand-written dialogues for a
+few scenarios and generic templates for the rest.
+
+* pluggable client: anything with ``async complete(messages, model) -> str``;
+  OpenAIChatClient talks to any OpenAI-compatible /chat/completions URL
+* bounded concurrency (asyncio.Semaphore) with retry + exponential backoff
+  on 429/5xx/timeouts and malformed completions, honouring Retry-After
+  (seconds or an HTTP date); ``attempts`` bounds the paid requests per
+  scenario
+* on-disk response cache keyed by (scenario hash, prompt, model), so the
+  same request is never paid for twice
+* checkpoint file (JSON lines, one per finished scenario) so an interrupted
+  run resumes where it stopped
+
+Run from scripts/:
+
+    OPENAI_API_KEY=... python3 -m besty_build.batchgen --concurrency 4
+    python3 -m besty_build.batchgen --stub      # local stand-in server, no key needed
+"""
+
+import argparse
+import asyncio
+import email.utils
+import json
+import os
+import random
+import time
+import urllib.error
+import urllib.request
+
+from .generators import OUTPUTS, SHARD_DIRS
+from .incremental import content_hash, scenario_id
+from .output import add_output_args, emit_catalog
+from .loader import load_json
+from .paths import CACHE_DIR, SPRECHEN_DIR
+from .store import atomic_write
+
+DEFAULT_MODEL = "gpt-4o-mini"
+DEFAULT_BASE_URL = "https://api.openai.com/v1"
+CHOICE_KINDS = ("positive", "negative", "question", "suggestion")
+
+SYSTEM_PROMPT = """Du schreibst Übungsdialoge für die DTZ-Prüfung, Sprechen Teil 3 (gemeinsam etwas planen), Niveau B1.
+Regeln:
+- Einfache, kurze Sätze (maximal 12 Wörter pro Satz), alltägliche Wörter, Perfekt statt Präteritum.
+- Zwei Personen (A und B) duzen sich und planen gemeinsam.
+- Zu JEDEM Leitpunkt genau ein Schritt, in der Reihenfolge der Leitpunkte.
+- Jeder Schritt hat vier Antwortmöglichkeiten für den Lerner: positive (zustimmen), negative (ablehnen mit Grund), question (nachfragen), suggestion (Gegenvorschlag).
+- Nutze typische Redemittel: "Wie wäre es, wenn ...?", "Ich schlage vor, dass ...", "Was meinst du?".
+Antworte NUR mit JSON in dieser Form:
+{"greeting": "...", "steps": [{"speaker": "A", "text": "...", "choices": {"positive": "...", "negative": "...", "question": "...", "suggestion": "..."}}], "closing": "..."}"""
+
+
+class ChatError(Exception):
+    """A completion request failed for good."""
+
+
+class RetryableChatError(ChatError):
+    """Rate limit, server error or timeout; worth trying again."""
+
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value, now=None):
+    """
+    Seconds to wait from a Retry-After header (delay-seconds or HTTP-date),
+    or None when it is missing or unreadable and backoff should decide.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        parsed = email.utils.parsedate_tz(value)
+        when = email.utils.mktime_tz(parsed) if parsed else None
+    except (TypeError, ValueError, OverflowError):
+        when = None
+    if when is None:
+        return None
+    return max(0.0, when - (time.time() if now is None else now))
+
+
+class OpenAIChatClient:
+    """Minimal OpenAI-compatible client (stdlib only; requests run in threads)."""
+
+    def __init__(self, base_url=DEFAULT_BASE_URL, api_key=None, timeout=60):
+        self.url = base_url.rstrip("/") + "/chat/completions"
+        self.api_key = api_key
+        self.timeout = timeout
+
+    async def complete(self, messages, model):
+        return await asyncio.to_thread(self._post, messages, model)
+
+    def _post(self, messages, model):
+        body = json.dumps({
+            "model": model,
+            "messages": messages,
+            "temperature": 0.7,
+            "response_format": {"type": "json_object"},
+        }).encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        request = urllib.request.Request(self.url, data=body, headers=headers, method="POST")
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                data = json.load(response)
+        except urllib.error.HTTPError as err:
+            if err.code == 429 or err.code >= 500:
+                raise RetryableChatError(f"HTTP {err.code}", parse_retry_after(err.headers.get("Retry-After")))
+            raise ChatError(f"HTTP {err.code}: {err.read()[:200]!r}")
+        except (urllib.error.URLError, TimeoutError) as err:
+            raise RetryableChatError(str(err))
+        return data["choices"][0]["message"]["content"]
+
+
+async def with_retries(call, attempts=5, base_delay=0.5, max_delay=20.0):
+    """Await ``call()``, retrying RetryableChatError with jittered exponential backoff."""
+    for attempt in range(attempts):
+        try:
+            return await call()
+        except RetryableChatError as err:
+            if attempt == attempts - 1:
+                raise ChatError(f"giving up after {attempts} attempts: {err}")
+            delay = err.retry_after if err.retry_after is not None else min(max_delay, base_delay * 2 ** attempt)
+            await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+
+
+def build_messages(scenario):
+    leitpunkte = "\n".join(f"{i}. {punkt}" for i, punkt in enumerate(scenario["leitpunkte"], start=1))
+    user = (f"Thema: {scenario['theme']}\n"
+            f"Aufgabe: {scenario['aufgabe']}\n"
+            f"Leitpunkte:\n{leitpunkte}")
+    return [{"role": "system", "content": SYSTEM_PROMPT}, {"role": "user", "content": user}]
+
+
+def scenario_hash(scenario):
+    """Hash of the fields the prompt is built from."""
+    return content_hash({key: scenario.get(key) for key in ("id", "title", "theme", "aufgabe", "leitpunkte")})
+
+
+def parse_dialogue(text, scenario):
+    """Validate a completion; raises ValueError if it doesn't fit the catalog schema."""
+    dialogue = json.loads(text)
+    steps = dialogue.get("steps")
+    if not isinstance(steps, list) or len(steps) != len(scenario["leitpunkte"]):
+        raise ValueError(f"expected {len(scenario['leitpunkte'])} steps")
+    for step in steps:
+        if not step.get("text") or step.get("speaker") not in ("A", "B"):
+            raise ValueError("step without speaker/text")
+        if any(not step.get("choices", {}).get(kind) for kind in CHOICE_KINDS):
+            raise ValueError("step without all four choices")
+    return {
+        "greeting": dialogue.get("greeting", ""),
+        "steps": [{"speaker": s["speaker"], "text": s["text"],
+                   "choices": {kind: s["choices"][kind] for kind in CHOICE_KINDS}} for s in steps],
+        "closing": dialogue.get("closing", ""),
+    }
+
+
+class ResponseCache:
+    """Raw completions on disk, keyed by (scenario hash, prompt, model)."""
+
+    def __init__(self, directory=CACHE_DIR / "llm-cache"):
+        self.directory = directory
+
+    def key(self, scenario, messages, model):
+        return content_hash(scenario_hash(scenario), messages, model)
+
+    def get(self, key):
+        try:
+            with open(self.directory / f"{key}.json", encoding="utf-8") as f:
+                return json.load(f)["content"]
+        except FileNotFoundError:
+            return None
+
+    def put(self, key, content):
+        record = json.dumps({"content": content}, ensure_ascii=False)
+        atomic_write(self.directory / f"{key}.json", record.encode("utf-8"))
+
+
+class Checkpoint:
+    """Finished scenarios, one JSON line each, appended as they complete."""
+
+    def __init__(self, path=CACHE_DIR / "batchgen-checkpoint.jsonl"):
+        self.path = path
+        self.done = {}
+        if not path.exists():
+            return
+        data = path.read_bytes()
+        for line in data.splitlines():
+            try:
+                entry = json.loads(line)
+                self.done[entry["id"]] = entry
+            except (ValueError, KeyError, TypeError):
+                continue  # a torn or corrupt line: that scenario is simply redone
+        if data and not data.endswith(b"\n"):
+            # A crash mid-append left an unterminated last line; cut it off so
+            # add() starts on a line of its own (a complete entry only lacks its newline)
+            end = len(data) if self._complete(data.rsplit(b"\n", 1)[-1]) else data.rfind(b"\n") + 1
+            with open(path, "r+b") as f:
+                f.truncate(end)
+                f.seek(end)
+                if end == len(data):
+                    f.write(b"\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    @staticmethod
+    def _complete(line):
+        try:
+            return "id" in json.loads(line)
+        except (ValueError, TypeError):
+            return False
+
+    def get(self, sid, key):
+        entry = self.done.get(sid)
+        return entry["dialogue"] if entry and entry["key"] == key else None
+
+    def add(self, sid, key, dialogue):
+        entry = {"id": sid, "key": key, "dialogue": dialogue}
+        self.done[sid] = entry
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class BatchStats:
+    def __init__(self):
+        self.resumed = 0
+        self.cached = 0
+        self.requested = 0
+        self.failed = []
+
+
+async def generate_dialogues(scenarios, client, model=DEFAULT_MODEL, concurrency=4,
+                             cache=None, checkpoint=None, attempts=5):
+    """
+    Return ``({scenario_id: dialogue}, BatchStats)`` for ``scenarios``.
+
+    Scenarios already in the checkpoint are skipped, cached completions are
+    reused, and at most ``concurrency`` requests are in flight at once.
+    Each scenario makes at most ``attempts`` requests: failed requests and
+    malformed completions share one retry budget. A scenario that still
+    fails after all of them is reported in ``stats.failed`` and left out of
+    the result.
+    """
+    cache = cache or ResponseCache()
+    checkpoint = checkpoint or Checkpoint()
+    semaphore = asyncio.Semaphore(concurrency)
+    stats = BatchStats()
+    results = {}
+
+    async def one(scenario):
+        sid = scenario_id(scenario)
+        messages = build_messages(scenario)
+        key = cache.key(scenario, messages, model)
+        done = checkpoint.get(sid, key)
+        if done is not None:
+            stats.resumed += 1
+            results[sid] = done
+            return
+
+        content = cache.get(key)
+        dialogue = None
+        if content is not None:
+            try:
+                dialogue = parse_dialogue(content, scenario)
+                stats.cached += 1
+            except (ValueError, KeyError, TypeError, AttributeError):
+                pass  # a bad cache entry is replaced below
+
+        async def request():
+            # The semaphore is released before with_retries backs off
+            async with semaphore:
+                stats.requested += 1
+                text = await client.complete(messages, model)
+            try:
+                return text, parse_dialogue(text, scenario)
+            except (ValueError, KeyError, TypeError, AttributeError) as err:
+                raise RetryableChatError(f"malformed completion: {err}")  # never cached
+
+        if dialogue is None:
+            try:
+                content, dialogue = await with_retries(request, attempts)
+            except ChatError as err:
+                raise ChatError(f"scenario {sid}: {err}")
+            cache.put(key, content)
+        checkpoint.add(sid, key, dialogue)
+        results[sid] = dialogue
+
+    async def guarded(scenario):
+        try:
+            await one(scenario)
+        except ChatError as err:
+            stats.failed.append((scenario_id(scenario), str(err)))
+
+    await asyncio.gather(*(guarded(scenario) for scenario in scenarios))
+    return results, stats
+
+
+def with_dialogues(scenarios, dialogues):
+    """Scenarios in their original order, each with its generated dialogue."""
+    return [dict(s, dialogue=dialogues[scenario_id(s)]) for s in scenarios if scenario_id(s) in dialogues]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--input", default=str(SPRECHEN_DIR / "dialogues-catalog.json"),
+                        help="catalog with the scenarios to fill (aufgabe + leitpunkte)")
+    parser.add_argument("--model", default=DEFAULT_MODEL)
+    parser.add_argument("--base-url", default=os.environ.get("OPENAI_BASE_URL", DEFAULT_BASE_URL))
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--limit", type=int, help="only the first N scenarios")
+    parser.add_argument("--stub", action="store_true", help="run against a local stand-in server")
+    add_output_args(parser, OUTPUTS["batchgen"], SHARD_DIRS["batchgen"])
+    args = parser.parse_args()
+
+    catalog = load_json(args.input)
+    scenarios = catalog["scenarios"][:args.limit]
+
+    server = None
+    if args.stub:
+        from .stubchat import start_stub_server
+        server = start_stub_server()
+        args.base_url = f"http://127.0.0.1:{server.server_port}/v1"
+    client = OpenAIChatClient(args.base_url, os.environ.get("OPENAI_API_KEY"))
+
+    try:
+        dialogues, stats = asyncio.run(generate_dialogues(scenarios, client, args.model, args.concurrency))
+    finally:
+        if server:
+            server.shutdown()
+
+    print(f"🤖 {len(dialogues)}/{len(scenarios)} dialogues: {stats.resumed} resumed, "
+          f"{stats.cached} from cache, {stats.requested} requests")
+    for sid, error in stats.failed:
+        print(f"❌ Scenario {sid}: {error}")
+
+    filled = with_dialogues(scenarios, dialogues)
+    meta = dict(catalog["meta"], total_scenarios=len(filled), complete_dialogues=len(filled),
+                generator=f"batchgen ({args.model})")
+    for output_path, result in emit_catalog(args, meta, filled):
+        print(f"📝 Saved to: {output_path} ({result.summary()})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmarks for the build stages. Run from scripts/, e.g.
+
+    python3 -m besty_build.bench.streaming --count 20000
+"""
+
+import itertools
+import resource
+import sys
+
+from ..loader import load_json
+from ..paths import SPRECHEN_DIR
+
+
+def load_seed_scenarios():
+    return load_json(SPRECHEN_DIR / "dialogues-catalog.json")["scenarios"]
+
+
+def scenario_variants(count):
+    """
+    Yield ``count`` expanded scenarios derived from the real catalog: one per
+    leitpunkt rotation, each with a dialogue step per leitpunkt. Lazy, so the
+    variants themselves never pile up in memory.
+    """
+    seeds = load_seed_scenarios()
+    for number, (seed, rotation) in enumerate(itertools.islice(
+            ((seed, rotation) for rotation in itertools.count() for seed in seeds), count), start=1):
+        leitpunkte = seed["leitpunkte"]
+        shift = rotation % len(leitpunkte)
+        leitpunkte = leitpunkte[shift:] + leitpunkte[:shift]
+        yield {
+            "id": str(number),
+            "number": number,
+            "title": seed["title"],
+            "theme": seed["theme"],
+            "aufgabe": seed["aufgabe"],
+            "leitpunkte": leitpunkte,
+            "dialogue": {
+                "greeting": "Hallo! Wie geht's? Schön, dass wir Zeit haben, das zusammen zu planen.",
+                "steps": [
+                    {
+                        "speaker": "AB"[i % 2],
+                        "text": f"Also, lass uns überlegen: {punkt} Was meinst du?",
+                        "choices": {
+                            "positive": "Ja, das ist eine gute Idee! Das finde ich auch wichtig.",
+                            "negative": "Hmm, ich weiß nicht. Vielleicht sollten wir etwas anderes machen?",
+                            "question": f"{punkt} Hast du schon eine Idee?",
+                            "suggestion": "Ich würde vorschlagen, dass wir das so machen. Was denkst du?",
+                        },
+                    }
+                    for i, punkt in enumerate(leitpunkte)
+                ],
+                "closing": "Perfekt! Ich denke, wir haben jetzt einen guten Plan. Das wird bestimmt gut!",
+            },
+        }
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
@@ -0,0 +1,144 @@
+"""
+Content database build and query benchmarks.
+
+Build: a full build, a no-op rebuild and a rebuild after one source file
+changed (its recorded hash is cleared, so exactly that file reloads).
+
+Queries: a fixed lookup mix, each timed as one indexed read against the
+database and as what a server does without it (parse the JSON file, then
+filter). Both must return the same rows. Every SQL lookup's query plan is
+checked so that none scans a whole table.
+
+    python3 -m besty_build.bench.contentdb
+    python3 -m besty_build.bench.contentdb --repeat 500
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+
+from .. import contentdb
+from ..paths import CACHE_DIR, relpath
+
+OUTPUT = CACHE_DIR / "bench" / "contentdb" / "content.sqlite"
+
+
+def _json(kind, path=None):
+    return json.loads((path or contentdb.SOURCES[kind]).read_text(encoding="utf-8"))
+
+
+def _theme_path(theme):
+    return contentdb.THEMES_DIR / f"{theme}.json"
+
+
+# label -> (sql, parameters, JSON equivalent returning the same rows)
+QUERIES = {
+    "scenario by id": (
+        "SELECT id, title, aufgabe FROM scenarios WHERE id = ?", ("27",),
+        lambda: [(s["id"], s["title"], s["aufgabe"]) for s in _json("scenarios")["scenarios"] if s["id"] == "27"],
+    ),
+    "scenarios by theme": (
+        "SELECT id, title FROM scenarios WHERE theme = ? ORDER BY number", ("Freizeit & Sport",),
+        lambda: [(s["id"], s["title"]) for s in _json("scenarios")["scenarios"] if s["theme"] == "Freizeit & Sport"],
+    ),
+    "einbürgerung by Bundesland": (
+        "SELECT id, question FROM einbuergerung_questions WHERE bundesland = ? ORDER BY id", ("Bayern",),
+        lambda: sorted((q["id"], q["question"]) for q in _json("einbuergerung")["questions"]
+                       if q.get("bundesland") == "Bayern"),
+    ),
+    "einbürgerung by category": (
+        "SELECT id FROM einbuergerung_questions WHERE category = ? ORDER BY id", ("Politik in der Demokratie",),
+        lambda: sorted((q["id"],) for q in _json("einbuergerung")["questions"]
+                       if q["category"] == "Politik in der Demokratie"),
+    ),
+    "quiz questions of a theme": (
+        "SELECT id, question FROM quiz_questions WHERE theme = ? ORDER BY id", ("wohnen",),
+        lambda: sorted((q["id"], q["question"]) for q in _json("quiz", _theme_path("wohnen"))["questions"]),
+    ),
+    "schreiben by category": (
+        "SELECT id, title FROM schreiben_prompts WHERE category = ? ORDER BY id", ("Beschwerde",),
+        lambda: sorted((p["id"], p["title"]) for register in ("formal", "informal")
+                       for p in _json("schreiben").get(register, []) if p["category"] == "Beschwerde"),
+    ),
+}
+
+SEARCHES = [("Wohnung", {}), ("Bundestag Wahl", {}), ("Arzt Termin", {}), ("Geb", {"prefix": True})]
+
+
+def median_p95(samples):
+    ordered = sorted(samples)
+    return statistics.median(ordered) * 1000, ordered[int(len(ordered) * 0.95)] * 1000
+
+
+def timed(fn, repeat):
+    result = fn()  # warm the page cache
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return result, median_p95(samples)
+
+
+def uses_index(db, sql, params):
+    """Query plan lines that scan a table without an index (empty when all lookups are indexed)."""
+    plan = [row[-1] for row in db.execute("EXPLAIN QUERY PLAN " + sql, params)]
+    return [line for line in plan if line.startswith("SCAN") and " USING " not in line]
+
+
+def time_builds():
+    results = {}
+    start = time.perf_counter()
+    contentdb.build(OUTPUT, force=True)
+    results["full build"] = time.perf_counter() - start
+    start = time.perf_counter()
+    contentdb.build(OUTPUT)
+    results["no-op rebuild"] = time.perf_counter() - start
+    changed = relpath(contentdb.SOURCES["einbuergerung"])
+    with contentdb.sqlite3.connect(OUTPUT) as db:
+        db.execute("UPDATE sources SET sha256 = '' WHERE path = ?", (changed,))
+    start = time.perf_counter()
+    result = contentdb.build(OUTPUT)
+    results[f"one file changed ({len(result.loaded)} reloaded)"] = time.perf_counter() - start
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    for label, seconds in time_builds().items():
+        print(f"⏱️  {label:<32} {seconds * 1000:7.1f} ms")
+    print(f"📦 {relpath(OUTPUT)}: {OUTPUT.stat().st_size / 1024:.0f} KB")
+
+    db = contentdb.connect(OUTPUT)
+    print(f"\n{'lookup':<28} {'rows':>5} {'sqlite median/p95':>20} {'json median/p95':>20} {'speedup':>8}")
+    failed = 0
+    for label, (sql, params, from_json) in QUERIES.items():
+        rows, (median, p95) = timed(lambda: db.execute(sql, params).fetchall(), args.repeat)
+        expected, (json_median, json_p95) = timed(from_json, max(args.repeat // 10, 5))
+        scans = uses_index(db, sql, params)
+        flag = ""
+        if rows != expected:
+            flag = "  ❌ rows differ from the JSON"
+        elif scans:
+            flag = "  ❌ " + "; ".join(scans)
+        failed += bool(flag)
+        print(f"{label:<28} {len(rows):>5} {median:>8.3f}/{p95:.3f} ms {json_median:>8.2f}/{json_p95:.2f} ms "
+              f"{json_median / median:>7.0f}×{flag}")
+
+    print(f"\n{'search':<28} {'hits':>5} {'median':>9} {'p95':>9}")
+    for query, options in SEARCHES:
+        hits, (median, p95) = timed(lambda: contentdb.search(db, query, **options), args.repeat)
+        label = query + (" (prefix)" if options.get("prefix") else "")
+        print(f"{label:<28} {len(hits):>5} {median:>7.3f}ms {p95:>7.3f}ms")
+    if failed:
+        sys.exit(1)
+    print("\n✅ Every lookup matches the JSON and reads through an index")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Memory per scenario and serialization throughput: scenarios as nested
+dicts vs. the slotted model.Scenario / DialogueStep / ChoiceSet objects.
+
+Both hold the same scenario variants (see scenario_variants(); the string
+values are the same objects in both, so the difference is the containers).
+Each representation is built in a fresh subprocess with tracemalloc
+running, then encoded scenario by scenario the way the build does
+(jsonstream.encode_scenario: json's encoder for dicts, to_json() for
+objects), indented and compact. The output hashes must match. The
+build time of the objects includes converting them from the dict
+variants.
+
+    python3 -m besty_build.bench.model --count 100000
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from ..jsonstream import encode_scenario
+from ..model import Scenario
+from . import scenario_variants
+
+MODES = ("dict", "slots")
+
+
+def build(mode, count):
+    if mode == "dict":
+        return list(scenario_variants(count))
+    return [Scenario.from_dict(variant) for variant in scenario_variants(count)]
+
+
+def time_encode(scenarios, compact):
+    """``(seconds, bytes, sha256)`` of encoding every scenario."""
+    digest = hashlib.sha256()
+    size = 0
+    start = time.perf_counter()
+    for scenario in scenarios:
+        data = encode_scenario(scenario, compact).encode("utf-8")
+        digest.update(data)
+        size += len(data)
+    return time.perf_counter() - start, size, digest.hexdigest()
+
+
+def run_worker(mode, count):
+    tracemalloc.start()
+    start = time.perf_counter()
+    scenarios = build(mode, count)
+    built = time.perf_counter() - start
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    results = {"mode": mode, "count": count, "build_s": round(built, 3),
+               "bytes_per_scenario": round(memory / count)}
+    for label, compact in (("indent", False), ("compact", True)):
+        seconds, size, digest = time_encode(scenarios, compact)
+        results[label] = {"seconds": round(seconds, 3), "scenarios_per_s": round(count / seconds),
+                          "mb_per_s": round(size / seconds / 1e6, 1), "sha256": digest}
+    return results
+
+
+def run_mode(mode, count):
+    out = subprocess.run(
+        [sys.executable, "-m", "besty_build.bench.model", "--worker", mode, "--count", str(count)],
+        check=True, capture_output=True, text=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    )
+    return json.loads(out.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=100000)
+    parser.add_argument("--worker", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_worker(args.worker, args.count)))
+        return
+
+    results = {mode: run_mode(mode, args.count) for mode in MODES}
+    print(f"{args.count} scenarios")
+    print(f"{'mode':<6} {'bytes/scenario':>15} {'build':>8} {'indent':>16} {'compact':>16}")
+    for mode, r in results.items():
+        print(f"{mode:<6} {r['bytes_per_scenario']:>15} {r['build_s']:>7.2f}s "
+              f"{r['indent']['scenarios_per_s']:>9}/s {r['indent']['mb_per_s']:>4} MB/s "
+              f"{r['compact']['scenarios_per_s']:>9}/s {r['compact']['mb_per_s']:>4} MB/s")
+
+    dicts, slots = results["dict"], results["slots"]
+    print(f"slots: {slots['bytes_per_scenario'] / dicts['bytes_per_scenario']:.0%} of the dict memory, "
+          f"encoding {slots['indent']['scenarios_per_s'] / dicts['indent']['scenarios_per_s']:.1f}× (indented), "
+          f"{slots['compact']['scenarios_per_s'] / dicts['compact']['scenarios_per_s']:.1f}× (compact)")
+    for label in ("indent", "compact"):
+        if dicts[label]["sha256"] != slots[label]["sha256"]:
+            print(f"❌ {label} output differs between dicts and slots")
+            sys.exit(1)
+    print("✅ Identical output for both representations")
+
+
+if __name__ == "__main__":
+    main()
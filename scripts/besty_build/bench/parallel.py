@@ -0,0 +1,66 @@
+"""
+Scaling of --jobs: expand + serialize N scenario variants with 1, 2, 4, ...
+workers and check that every run produces the same bytes as the serial one.
+
+The expander stands in for the heavier expansion the generators are
+growing into (redemittel substitution, validation, per-locale rendering).
+
+    python3 -m besty_build.bench.parallel --count 5000 --jobs 1 2 4 8
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+from functools import partial
+
+from ..incremental import expand_and_encode, assemble_catalog
+from ..parallel import ordered_map
+from . import scenario_variants
+
+LOCALES = ("de", "en", "ar", "tr", "uk", "fa")
+
+
+def heavy_expand(source):
+    scenario = dict(source)
+    rendered = {}
+    for locale in LOCALES:
+        steps = []
+        for step in source["dialogue"]["steps"]:
+            choices = {kind: f"[{locale}] {text}".replace("  ", " ") for kind, text in step["choices"].items()}
+            steps.append(dict(step, choices=choices))
+        # Validation pass: the rendered dialogue must survive a JSON round trip
+        rendered[locale] = json.loads(json.dumps(steps, ensure_ascii=False))
+    scenario["locales"] = rendered
+    return scenario
+
+
+def run(sources, jobs):
+    start = time.perf_counter()
+    encoded = ordered_map(partial(expand_and_encode, heavy_expand), sources, jobs)
+    text = assemble_catalog({"version": "bench"}, [fragment for fragment, _ in encoded])
+    elapsed = time.perf_counter() - start
+    return elapsed, hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--jobs", type=int, nargs="+", default=[1, 2, 4, os.cpu_count() or 1])
+    args = parser.parse_args()
+
+    sources = list(scenario_variants(args.count))
+    print(f"{args.count} scenarios, {os.cpu_count()} CPU(s)")
+    print(f"{'jobs':>5} {'seconds':>8} {'speedup':>8}  output")
+
+    baseline_time, baseline_digest = run(sources, 1)
+    print(f"{1:>5} {baseline_time:>8.3f} {1.0:>7.2f}x  {baseline_digest[:12]}")
+    for jobs in sorted(set(args.jobs) - {1}):
+        elapsed, digest = run(sources, jobs)
+        same = "identical" if digest == baseline_digest else "DIFFERENT"
+        print(f"{jobs:>5} {elapsed:>8.3f} {baseline_time / elapsed:>7.2f}x  {digest[:12]} {same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+"""
+Benchmark suite for the catalog generators.
+
+Times the generator functions themselves (create_all_59_scenarios,
+generate_catalog, generate_simplified_catalog), and parsing
+data/scenario-sources.json on its own, and then the pipeline stages at
+growing catalog sizes, each size in a fresh subprocess so peak RSS is its
+own. The generators memoize the parsed sources (generators._reload), so
+every timed call starts with that cache cleared: the figures include the
+parse, as they did when the scenarios were Python literals.
+
+    construct          build N source scenarios (create_all_59_scenarios, renumbered)
+    expand             expand_scenario() over them (what generate_catalog does)
+    serialize_indent   the catalog text, indented (jsonstream.iter_catalog)
+    serialize_compact  the same without whitespace
+    write              write the indented bytes to disk and fsync
+
+plus peak RSS and output bytes, raw and gzip, for both serializations.
+Results are written as JSON; with --baseline every metric is compared
+against an earlier results file and the run fails on regressions.
+
+    python3 -m besty_build.bench.pipeline --counts 59 1000 10000 100000
+    python3 -m besty_build.bench.pipeline --baseline ../.besty-build/bench/baseline.json
+"""
+
+import argparse
+import gzip
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+from ..paths import CACHE_DIR
+from .. import generators
+from ..jsonstream import iter_catalog
+from ..store import atomic_write
+from . import peak_rss_mb
+
+DEFAULT_OUTPUT = CACHE_DIR / "bench" / "pipeline.json"
+DEFAULT_COUNTS = (59, 1000, 10000, 100000)
+META = {"version": "bench", "level": "B1"}
+
+# Time differences below this are noise, whatever the ratio
+MIN_SECONDS = 0.005
+
+
+def best_of(fn, repeat):
+    """``(seconds, result)`` of the fastest of ``repeat`` calls."""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def cold(fn):
+    """``fn`` with the generators' parsed-sources cache cleared before each call."""
+    def call():
+        generators._cache.clear()
+        return fn()
+    return call
+
+
+def time_builders(repeat=5):
+    """Each generator function at its native size, and the sources parse by itself."""
+    results = {}
+    for name, fn in (("load_scenario_sources", lambda: generators.scenario_sources("all-59")),
+                     ("create_all_59_scenarios", generators.create_all_59_scenarios),
+                     ("generate_catalog", generators.generate_catalog),
+                     ("generate_simplified_catalog", generators.generate_simplified_catalog)):
+        seconds, built = best_of(cold(fn), repeat)
+        results[name] = {"seconds": round(seconds, 6), "scenarios": len(built["scenarios"])}
+    return results
+
+
+def construct(count):
+    """``count`` source scenarios from repeated create_all_59_scenarios() calls."""
+    build = cold(generators.create_all_59_scenarios)
+    sources = []
+    while len(sources) < count:
+        for scenario in build()["scenarios"]:
+            if len(sources) == count:
+                break
+            number = len(sources) + 1
+            sources.append(dict(scenario, id=str(number), number=number))
+    return sources
+
+
+def _sizes(data):
+    return len(data), len(gzip.compress(data, 6, mtime=0))
+
+
+def run_worker(count):
+    expand = generators.expand_scenario
+    results = {"count": count}
+
+    start = time.perf_counter()
+    sources = construct(count)
+    results["construct_s"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    scenarios = [expand(source) for source in sources]
+    results["expand_s"] = time.perf_counter() - start
+    del sources
+
+    # Same bytes as json.dumps of the catalog dict; expand() returns model.Scenario objects
+    start = time.perf_counter()
+    compact = "".join(iter_catalog(META, scenarios, compact=True)).encode("utf-8")
+    results["serialize_compact_s"] = time.perf_counter() - start
+    results["bytes_compact"], results["gzip_compact"] = _sizes(compact)
+    del compact
+
+    start = time.perf_counter()
+    indent = "".join(iter_catalog(META, scenarios)).encode("utf-8")
+    results["serialize_indent_s"] = time.perf_counter() - start
+    results["bytes_indent"], results["gzip_indent"] = _sizes(indent)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        with open(os.path.join(tmp, "catalog.json"), "wb") as f:
+            f.write(indent)
+            f.flush()
+            os.fsync(f.fileno())
+        results["write_s"] = time.perf_counter() - start
+
+    results["peak_rss_mb"] = round(peak_rss_mb(), 1)
+    return {key: round(value, 6) if isinstance(value, float) else value for key, value in results.items()}
+
+
+def run_scale(count):
+    out = subprocess.run(
+        [sys.executable, "-m", "besty_build.bench.pipeline", "--worker", str(count)],
+        check=True, capture_output=True, text=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    )
+    return json.loads(out.stdout)
+
+
+def _metrics(results):
+    """Flat ``{name: value}`` of everything comparable in a results document."""
+    flat = {f"builders.{name}.seconds": entry["seconds"] for name, entry in results["builders"].items()}
+    for count, scale in results["scales"].items():
+        flat.update({f"{count}.{key}": value for key, value in scale.items() if key != "count"})
+    return flat
+
+
+def compare(results, baseline, tolerance):
+    """``[(metric, old, new, change)]`` for metrics worse than ``tolerance`` (relative)."""
+    old_metrics, new_metrics = _metrics(baseline), _metrics(results)
+    regressions = []
+    for name, new in new_metrics.items():
+        old = old_metrics.get(name)
+        if not old:
+            continue
+        if name.endswith(("_s", "seconds")) and new - old < MIN_SECONDS:
+            continue
+        change = new / old - 1
+        if change > tolerance:
+            regressions.append((name, old, new, change))
+    return regressions
+
+
+def print_results(results):
+    for name, entry in results["builders"].items():
+        print(f"⏱️  {name}(): {entry['seconds'] * 1000:.2f} ms ({entry['scenarios']} scenarios)")
+    print(f"\n{'count':>7} {'construct':>10} {'expand':>9} {'indent':>9} {'compact':>9} {'write':>8} "
+          f"{'peak RSS':>9} {'bytes':>12} {'gzip':>10} {'compact':>12} {'gzip':>10}")
+    for count, r in results["scales"].items():
+        print(f"{count:>7} {r['construct_s']:>9.3f}s {r['expand_s']:>8.3f}s {r['serialize_indent_s']:>8.3f}s "
+              f"{r['serialize_compact_s']:>8.3f}s {r['write_s']:>7.3f}s {r['peak_rss_mb']:>7.1f}MB "
+              f"{r['bytes_indent']:>12} {r['gzip_indent']:>10} {r['bytes_compact']:>12} {r['gzip_compact']:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--counts", type=int, nargs="+", default=list(DEFAULT_COUNTS))
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT))
+    parser.add_argument("--baseline", help="earlier results file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="allowed relative slowdown/growth")
+    parser.add_argument("--worker", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_worker(args.worker)))
+        return
+
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "builders": time_builders(),
+        "scales": {str(count): run_scale(count) for count in args.counts},
+    }
+    print_results(results)
+
+    atomic_write(args.output, json.dumps(results, indent=2).encode("utf-8"))
+    print(f"\n📝 Saved to: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        for name, old, new, change in regressions:
+            print(f"❌ {name}: {old} → {new} (+{change:.0%})")
+        if regressions:
+            sys.exit(1)
+        print(f"✅ No regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
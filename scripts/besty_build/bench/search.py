@@ -0,0 +1,70 @@
+"""
+Query latency of the search index at catalog scale: build the index over N
+scenario variants, load it through SearchIndex and time a fixed query mix
+(single terms, AND queries, phrases, type-ahead prefixes).
+
+    python3 -m besty_build.bench.search --count 10000
+"""
+
+import argparse
+import json
+import statistics
+import time
+
+from ..search import SearchIndex, build_index
+from . import scenario_variants
+
+QUERIES = [
+    ("Gäste", {}),
+    ("Einladungen", {}),
+    ("Hausfest Essen", {}),
+    ("Nachbarn Sommerfest planen", {}),
+    ('"Essen und Trinken"', {}),
+    ('"gute Idee" Party', {}),
+    ("Geb", {"prefix": True}),
+    ("Kurs anmel", {"prefix": True}),
+]
+
+
+def time_query(index, query, options, repeat):
+    index.search(query, **options)  # first call may fill a cache
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        hits = index.search(query, **options)
+        samples.append(time.perf_counter() - start)
+    return samples, hits
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--budget-ms", type=float, default=1.0)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    data = build_index(scenario_variants(args.count))
+    built = time.perf_counter() - start
+    size = len(json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+    start = time.perf_counter()
+    index = SearchIndex(data)
+    loaded = time.perf_counter() - start
+    print(f"{args.count} scenarios, {len(data['postings'])} terms, {size / 1e6:.1f} MB; "
+          f"build {built:.2f} s, load {loaded:.2f} s")
+
+    print(f"{'query':<30} {'hits':>5} {'median':>9} {'p95':>9}")
+    slow = 0
+    for query, options in QUERIES:
+        samples, hits = time_query(index, query, options, args.repeat)
+        median = statistics.median(samples) * 1000
+        p95 = sorted(samples)[int(len(samples) * 0.95)] * 1000
+        label = query + (" (prefix)" if options.get("prefix") else "")
+        flag = "" if p95 < args.budget_ms else "  over budget"
+        slow += bool(flag)
+        print(f"{label:<30} {len(hits):>5} {median:>7.3f}ms {p95:>7.3f}ms{flag}")
+    print(f"{len(QUERIES) - slow}/{len(QUERIES)} queries under {args.budget_ms} ms (p95)")
+
+
+if __name__ == "__main__":
+    main()
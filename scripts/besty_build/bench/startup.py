@@ -0,0 +1,79 @@
+"""
+Startup time of ``python3 -m besty_build``, against a budget.
+
+Each case runs in a fresh interpreter ``--repeat`` times and the median is
+compared with the bare interpreter (``python3 -c pass``), so the budget is
+what besty_build adds on top, not what the machine's Python costs:
+
+    list       python3 -m besty_build (no stage: list them)          25 ms
+    catalog    python3 -m besty_build catalog, nothing changed        120 ms
+    all-59     python3 -m besty_build all-59, nothing changed         100 ms
+
+The single-stage cases write to .besty-build/bench/startup/ and are run
+once before timing, so they measure a no-op rebuild: imports, loading the
+scenario sources and the build cache, and checking every output.
+
+    python3 -m besty_build bench-startup
+    python3 -m besty_build bench-startup --repeat 50
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from ..paths import CACHE_DIR
+
+OUTPUT_DIR = CACHE_DIR / "bench" / "startup"
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _stage(name):
+    out = OUTPUT_DIR / name
+    return ["-m", "besty_build", name, "--output", str(out / "catalog.json"), "--shard-dir", str(out / "shards")]
+
+
+# name -> (interpreter arguments, budget in ms over the bare interpreter)
+CASES = {
+    "list": (["-m", "besty_build"], 25),
+    "catalog": (_stage("catalog"), 120),
+    "all-59": (_stage("all-59"), 100),
+}
+
+
+# Measure the setup people run: .pyc files written on the first run and reused
+ENV = {key: value for key, value in os.environ.items() if key != "PYTHONDONTWRITEBYTECODE"}
+
+
+def run(args):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, *args], cwd=SCRIPTS_DIR, env=ENV, check=True, stdout=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def median_ms(args, repeat):
+    run(args)  # warm the page cache, .pyc files and the build cache
+    return statistics.median(run(args) for _ in range(repeat)) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    base = median_ms(["-c", "pass"], args.repeat)
+    print(f"⏱️  bare interpreter: {base:.1f} ms (median of {args.repeat})")
+    over = 0
+    for name, (case, budget) in CASES.items():
+        added = median_ms(case, args.repeat) - base
+        flag = "✅" if added <= budget else "❌"
+        over += added > budget
+        print(f"{flag} {name:<8} +{added:6.1f} ms (budget {budget} ms)")
+    if over:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
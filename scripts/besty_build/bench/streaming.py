@@ -0,0 +1,74 @@
+"""
+Peak RSS and throughput: json.dump of a fully built catalog dict (what the
+generators used to do) vs. the streaming writer in indented and compact
+mode. Every mode runs in a fresh subprocess so peak RSS is not shared.
+
+    python3 -m besty_build.bench.streaming --count 20000 50000
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from ..jsonstream import dump_catalog
+from . import peak_rss_mb, scenario_variants
+
+MODES = ("json.dump", "stream", "stream-compact")
+META = {"version": "bench", "level": "B1"}
+
+
+def run_worker(mode, count, out_path):
+    start = time.perf_counter()
+    if mode == "json.dump":
+        catalog = {"meta": META, "scenarios": list(scenario_variants(count))}
+        with open(out_path, "w", encoding="utf-8") as f:
+            json.dump(catalog, f, ensure_ascii=False, indent=2)
+    else:
+        dump_catalog(out_path, META, scenario_variants(count), compact=mode == "stream-compact")
+    elapsed = time.perf_counter() - start
+    return {
+        "mode": mode,
+        "count": count,
+        "seconds": round(elapsed, 3),
+        "scenarios_per_s": round(count / elapsed),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "bytes": os.path.getsize(out_path),
+    }
+
+
+def run_mode(mode, count):
+    with tempfile.TemporaryDirectory() as tmp:
+        out = subprocess.run(
+            [sys.executable, "-m", "besty_build.bench.streaming", "--worker", mode,
+             "--count", str(count), "--out", os.path.join(tmp, "catalog.json")],
+            check=True, capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+        )
+    return json.loads(out.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--worker", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--out", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_worker(args.worker, args.count[0], args.out)))
+        return
+
+    print(f"{'scenarios':>10} {'mode':<15} {'seconds':>8} {'scen/s':>9} {'peak RSS':>10} {'bytes':>12}")
+    for count in args.count:
+        for mode in MODES:
+            r = run_mode(mode, count)
+            print(f"{count:>10} {mode:<15} {r['seconds']:>8} {r['scenarios_per_s']:>9} "
+                  f"{r['peak_rss_mb']:>8}MB {r['bytes']:>12}")
+
+
+if __name__ == "__main__":
+    main()
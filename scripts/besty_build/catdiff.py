@@ -0,0 +1,243 @@
+"""
+Delta patches between catalog versions.
+
+A client that cached dialogues-catalog.json at version N should not have to
+download the whole file again for version N+1. diff_catalogs() compares
+two catalogs keyed by scenario id and returns a patch holding only what
+changed:
+
+    {
+      "format": "besty-catalog-patch/1",
+      "from": "<version hash of the old catalog>",
+      "to": "<version hash of the new catalog>",
+      "ops": [
+        {"op": "replace", "path": "/meta/version", "value": "6.0-OFFICIAL"},
+        {"op": "remove", "path": "/scenarios/12"},
+        {"op": "add", "path": "/scenarios/60", "value": {...}},
+        {"op": "replace", "path": "/scenarios/7/leitpunkte", "value": [...]}
+      ],
+      "order": ["1", "2", ...]     # only when the scenario order changed
+    }
+
+Ops follow JSON Patch (RFC 6902) except that ``/scenarios/<id>`` addresses
+a scenario by its id instead of its array index, so ops don't shift when
+scenarios are inserted or removed. Unchanged scenarios are skipped by
+comparing one hash each, so the diff is linear in the catalog size.
+apply_patch() checks both hashes; a client whose cached hash doesn't match
+``from`` falls back to the full catalog.
+
+    python3 -m besty_build.catdiff ../public/data/sprechen/dialogues-catalog-OLD.json
+    python3 -m besty_build.catdiff OLD.json --new NEW.json --patch-dir ../public/data/sprechen/patches
+"""
+
+import argparse
+import copy
+import json
+from pathlib import Path
+
+from .incremental import BuildManifest, content_hash, scenario_id, write_artifact
+from .loader import load_json
+from .paths import SPRECHEN_DIR, relpath
+
+FORMAT = "besty-catalog-patch/1"
+
+
+class PatchError(ValueError):
+    """A patch doesn't apply to the given catalog."""
+
+
+def _index(catalog):
+    """``({id: scenario}, {id: hash})`` in catalog order; ids must be unique."""
+    scenarios, hashes = {}, {}
+    for scenario in catalog["scenarios"]:
+        sid = scenario_id(scenario)
+        if sid in scenarios:
+            raise ValueError(f"duplicate scenario id {sid!r}")
+        scenarios[sid] = scenario
+        hashes[sid] = content_hash(scenario)
+    return scenarios, hashes
+
+
+def _version_hash(meta, hashes):
+    return content_hash(meta, list(hashes.items()))
+
+
+def version_hash(catalog):
+    """Hash identifying a catalog version (meta, scenario contents and order)."""
+    return _version_hash(catalog["meta"], _index(catalog)[1])
+
+
+def _escape(token):
+    return str(token).replace("~", "~0").replace("/", "~1")
+
+
+def _unescape(token):
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+def diff_values(old, new, path=""):
+    """
+    JSON Patch ops turning ``old`` into ``new``. Objects are diffed key by
+    key; lists of equal length element by element, other lists and scalars
+    are replaced as a whole.
+    """
+    if old == new:
+        return []
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops = [{"op": "remove", "path": f"{path}/{_escape(key)}"} for key in old if key not in new]
+        for key, value in new.items():
+            if key not in old:
+                ops.append({"op": "add", "path": f"{path}/{_escape(key)}", "value": value})
+            else:
+                ops.extend(diff_values(old[key], value, f"{path}/{_escape(key)}"))
+        return ops
+    if isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        ops = []
+        for i, (a, b) in enumerate(zip(old, new)):
+            ops.extend(diff_values(a, b, f"{path}/{i}"))
+        return ops
+    return [{"op": "replace", "path": path, "value": new}]
+
+
+def _smaller(ops, path, value):
+    """``ops``, or a single replace of ``path`` if that encodes shorter."""
+    whole = [{"op": "replace", "path": path, "value": value}]
+    if len(json.dumps(whole, ensure_ascii=False)) < len(json.dumps(ops, ensure_ascii=False)):
+        return whole
+    return ops
+
+
+def diff_catalogs(old, new):
+    old_scenarios, old_hashes = _index(old)
+    new_scenarios, new_hashes = _index(new)
+
+    ops = _smaller(diff_values(old["meta"], new["meta"], "/meta"), "/meta", new["meta"])
+    for sid in old_scenarios:
+        if sid not in new_scenarios:
+            ops.append({"op": "remove", "path": f"/scenarios/{_escape(sid)}"})
+    for sid, scenario in new_scenarios.items():
+        path = f"/scenarios/{_escape(sid)}"
+        if sid not in old_scenarios:
+            ops.append({"op": "add", "path": path, "value": scenario})
+        elif old_hashes[sid] != new_hashes[sid]:
+            ops.extend(_smaller(diff_values(old_scenarios[sid], scenario, path), path, scenario))
+
+    patch = {
+        "format": FORMAT,
+        "from": _version_hash(old["meta"], old_hashes),
+        "to": _version_hash(new["meta"], new_hashes),
+        "ops": ops,
+    }
+    # Without "order": kept scenarios stay in place, added ones go last
+    implied = [sid for sid in old_scenarios if sid in new_scenarios]
+    implied += [sid for sid in new_scenarios if sid not in old_scenarios]
+    if implied != list(new_scenarios):
+        patch["order"] = list(new_scenarios)
+    return patch
+
+
+def _walk(document, tokens):
+    """Parent container and final key for a JSON pointer below ``document``."""
+    parent = document
+    for token in tokens[:-1]:
+        parent = parent[int(token) if isinstance(parent, list) else token]
+    last = tokens[-1]
+    return parent, int(last) if isinstance(parent, list) else last
+
+
+def apply_patch(catalog, patch):
+    """New catalog from ``catalog`` + ``patch``; PatchError if the versions don't match."""
+    if patch.get("format") != FORMAT:
+        raise PatchError(f"not a {FORMAT} document")
+    if version_hash(catalog) != patch["from"]:
+        raise PatchError("patch was made for a different catalog version")
+
+    meta = copy.deepcopy(catalog["meta"])
+    scenarios = {scenario_id(s): copy.deepcopy(s) for s in catalog["scenarios"]}
+    order = list(scenarios)
+    root = {"meta": meta}
+
+    for op in patch["ops"]:
+        tokens = [_unescape(token) for token in op["path"].split("/")[1:]]
+        try:
+            if tokens[0] == "scenarios":
+                sid = tokens[1]
+                if len(tokens) == 2:
+                    if op["op"] == "remove":
+                        del scenarios[sid]
+                    else:
+                        if sid not in scenarios:
+                            order.append(sid)
+                        scenarios[sid] = copy.deepcopy(op["value"])
+                    continue
+                container, rest = scenarios, tokens[1:]
+            else:
+                container, rest = root, tokens
+            if len(rest) == 1:
+                if op["op"] == "remove":
+                    del container[rest[0]]
+                else:
+                    container[rest[0]] = copy.deepcopy(op["value"])
+                continue
+            parent, key = _walk(container[rest[0]], rest[1:])
+            if op["op"] == "remove":
+                del parent[key]
+            else:
+                parent[key] = copy.deepcopy(op["value"])
+        except (KeyError, IndexError, ValueError, TypeError) as err:
+            raise PatchError(f"cannot apply {op['op']} {op['path']}: {err!r}")
+
+    order = patch.get("order") or [sid for sid in dict.fromkeys(order) if sid in scenarios]
+    try:
+        result = {"meta": root["meta"], "scenarios": [scenarios[sid] for sid in order]}
+    except KeyError as err:
+        raise PatchError(f"order names unknown scenario {err}")
+    if version_hash(result) != patch["to"]:
+        raise PatchError("patched catalog doesn't match the target version")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("old", nargs="+", help="earlier catalog versions")
+    parser.add_argument("--new", default=str(SPRECHEN_DIR / "dialogues-catalog.json"))
+    parser.add_argument("--patch-dir", help="write one <from-hash>.json patch per old version here")
+    args = parser.parse_args()
+
+    new = load_json(args.new)
+    new_size = len(json.dumps(new, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+    manifest = None
+    if args.patch_dir:
+        Path(args.patch_dir).mkdir(parents=True, exist_ok=True)
+        manifest = BuildManifest()
+    print(f"📦 {relpath(args.new)}: version {new['meta'].get('version')} ({version_hash(new)[:12]})")
+
+    for path in args.old:
+        old = load_json(path)
+        patch = diff_catalogs(old, new)
+        apply_patch(old, patch)  # fails loudly rather than shipping a broken patch
+        data = json.dumps(patch, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        kinds = {}
+        for op in patch["ops"]:
+            kinds[op["op"]] = kinds.get(op["op"], 0) + 1
+        counts = ", ".join(f"{n} {kind}" for kind, n in sorted(kinds.items())) or "no changes"
+        print(f"   from {old['meta'].get('version')} ({patch['from'][:12]}): {counts}; "
+              f"{len(data)} B patch vs {new_size} B full ({len(data) / new_size:.0%})")
+        if not manifest:
+            continue
+        target = Path(args.patch_dir) / f"{patch['from']}.json"
+        if len(data) >= new_size:
+            # Not worth it: without a patch for its hash a client loads the full file
+            manifest.forget(target)
+            target.unlink(missing_ok=True)
+            print(f"⚠️  No patch from {old['meta'].get('version')}: not smaller than the full catalog")
+            continue
+        write_artifact(manifest, target, data, {})
+        print(f"📝 Saved to: {relpath(target)}")
+
+    if manifest:
+        manifest.save()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,412 @@
+"""
+SQLite content database with full-text search over all learning data.
+
+Compiles the JSON content files into one indexed SQLite file
+(server/content.sqlite), so a server-side feature answers a lookup with
+one indexed read instead of parsing megabytes of JSON:
+
+    scenarios                 sprechen/dialogues-catalog.json
+    redemittel                sprechen/redemittel.json
+    quiz_themes, quiz_questions   themes/<theme>.json
+    einbuergerung_questions   einbuergerungstest/questions.json
+    schreiben_prompts         schreiben/email-prompts.json
+    lesen_exercises           data/lesen-exercises.json
+    bild_beschreiben          data/bild-beschreiben.json
+    search                    FTS5 over all of the above (kind, ref, title, body)
+
+Lists and nested objects are stored as JSON text. Listing queries are served
+by covering indexes (scenarios by theme, Einbürgerungstest questions by
+category and Bundesland, Schreiben prompts by category, Bild-beschreiben
+images by theme, Lesen exercises by Teil); quiz questions are clustered by
+theme in their primary key. The search table folds umlauts (unicode61
+remove_diacritics) and keeps 2- and 3-character prefix indexes for
+type-ahead.
+
+Rebuilds are incremental: every row carries the source file it came from,
+and only files whose hash changed (size and mtime unchanged means
+unchanged, via .besty-build/contentdb/) are deleted and reloaded, all in one
+transaction, so readers see either the old or the new content. A change
+to this module or the schema rebuilds everything.
+
+    python3 -m besty_build.contentdb
+    python3 -m besty_build.contentdb --query "Wohnung Miete"
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import re
+import sqlite3
+import time
+from pathlib import Path
+
+from .incremental import BuildManifest, content_hash
+from .loader import load_json
+from .paths import CACHE_DIR, DATA_DIR, ROOT, SPRECHEN_DIR, relpath
+
+DEFAULT_OUTPUT = ROOT / "server" / "content.sqlite"
+# Own digest cache: the catalog and the theme files are other stages' outputs,
+# and their entries in the build manifest belong to those stages
+DIGEST_CACHE = CACHE_DIR / "contentdb" / "manifest.json"
+SCHEMA_VERSION = 1
+
+THEMES_DIR = DATA_DIR / "themes"
+SOURCES = {
+    "scenarios": SPRECHEN_DIR / "dialogues-catalog.json",
+    "redemittel": SPRECHEN_DIR / "redemittel.json",
+    "einbuergerung": DATA_DIR / "einbuergerungstest" / "questions.json",
+    "schreiben": DATA_DIR / "schreiben" / "email-prompts.json",
+    "lesen": ROOT / "data" / "lesen-exercises.json",
+    "bild": ROOT / "data" / "bild-beschreiben.json",
+}
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL) WITHOUT ROWID;
+CREATE TABLE sources (path TEXT PRIMARY KEY, kind TEXT NOT NULL, sha256 TEXT NOT NULL) WITHOUT ROWID;
+
+CREATE TABLE scenarios (
+    id TEXT PRIMARY KEY, number INTEGER NOT NULL, title TEXT NOT NULL, theme TEXT NOT NULL,
+    aufgabe TEXT NOT NULL, leitpunkte TEXT NOT NULL, body TEXT NOT NULL, source TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX scenarios_by_theme ON scenarios (theme, number, id, title);
+
+CREATE TABLE redemittel (
+    section TEXT, category TEXT, position INTEGER, template TEXT NOT NULL, source TEXT NOT NULL,
+    PRIMARY KEY (section, category, position)
+) WITHOUT ROWID;
+
+CREATE TABLE quiz_themes (
+    id TEXT PRIMARY KEY, name TEXT NOT NULL, description TEXT, question_count INTEGER NOT NULL,
+    source TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE quiz_questions (
+    theme TEXT, id INTEGER, type TEXT NOT NULL, question TEXT NOT NULL, options TEXT NOT NULL,
+    correct_answer INTEGER, source TEXT NOT NULL,
+    PRIMARY KEY (theme, id)
+) WITHOUT ROWID;
+
+CREATE TABLE einbuergerung_questions (
+    id INTEGER PRIMARY KEY, type TEXT NOT NULL, category TEXT NOT NULL, bundesland TEXT,
+    question TEXT NOT NULL, options TEXT NOT NULL, correct_answer INTEGER NOT NULL,
+    original_num TEXT, image TEXT, source TEXT NOT NULL
+);
+CREATE INDEX einbuergerung_by_category ON einbuergerung_questions (category, id);
+CREATE INDEX einbuergerung_by_bundesland ON einbuergerung_questions (bundesland, id);
+
+CREATE TABLE schreiben_prompts (
+    id TEXT PRIMARY KEY, register TEXT NOT NULL, category TEXT NOT NULL, level TEXT, title TEXT NOT NULL,
+    situation TEXT NOT NULL, recipient TEXT, content_points TEXT NOT NULL, hints TEXT NOT NULL,
+    source TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX schreiben_by_category ON schreiben_prompts (category, register, id, title);
+
+CREATE TABLE lesen_exercises (
+    id TEXT PRIMARY KEY, teil TEXT NOT NULL, type TEXT NOT NULL, title TEXT NOT NULL,
+    body TEXT NOT NULL, source TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX lesen_by_teil ON lesen_exercises (teil, id, type, title);
+
+CREATE TABLE bild_beschreiben (
+    id TEXT PRIMARY KEY, theme TEXT NOT NULL, category TEXT, file TEXT NOT NULL, title TEXT NOT NULL,
+    alt TEXT, description TEXT, duration INTEGER, questions TEXT NOT NULL,
+    additional_questions TEXT NOT NULL, source TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX bild_by_theme ON bild_beschreiben (theme, id, title, file);
+
+CREATE VIRTUAL TABLE search USING fts5(
+    kind UNINDEXED, ref UNINDEXED, source UNINDEXED, title, body,
+    tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'
+);
+"""
+
+CONTENT_TABLES = ("scenarios", "redemittel", "quiz_themes", "quiz_questions", "einbuergerung_questions",
+                  "schreiben_prompts", "lesen_exercises", "bild_beschreiben", "search")
+
+_TAG = re.compile(r"<[^>]+>")
+
+
+def file_digest(path):
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        return hashlib.sha256(buf).hexdigest()
+
+
+def _json(value):
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+def _text(*parts):
+    """Search body: the string parts (lists flattened), HTML tags removed."""
+    words = []
+    for part in parts:
+        if isinstance(part, list):
+            words.extend(str(item) for item in part)
+        elif part is not None:
+            words.append(str(part))
+    return _TAG.sub(" ", " ".join(words))
+
+
+# Each loader turns one parsed file into {table: [row, ...]} (rows without
+# the trailing source column) plus its search documents (kind, ref, title, body).
+
+def load_scenarios(data):
+    rows, docs = [], []
+    for s in data["scenarios"]:
+        rows.append((str(s["id"]), s["number"], s["title"], s["theme"], s["aufgabe"],
+                     _json(s["leitpunkte"]), _json(s)))
+        docs.append(("scenario", str(s["id"]), s["title"], _text(s["theme"], s["aufgabe"], s["leitpunkte"])))
+    return {"scenarios": rows}, docs
+
+
+def load_redemittel(data):
+    rows, docs = [], []
+    for section, categories in data.items():
+        for category, templates in categories.items():
+            for position, template in enumerate(templates):
+                rows.append((section, category, position, template))
+                docs.append(("redemittel", f"{section}/{category}/{position}", category, template))
+    return {"redemittel": rows}, docs
+
+
+def load_quiz_theme(data):
+    theme = data["id"]
+    rows, docs = [], []
+    for q in data["questions"]:
+        rows.append((theme, q["id"], q["type"], q["question"], _json(q["options"]), q.get("correctAnswer")))
+        docs.append(("quiz", f"{theme}/{q['id']}", data["name"], _text(q["question"], q["options"])))
+    themes = [(theme, data["name"], data.get("description"), data.get("questionCount", len(rows)))]
+    return {"quiz_themes": themes, "quiz_questions": rows}, docs
+
+
+def load_einbuergerung(data):
+    rows, docs = [], []
+    for q in data["questions"]:
+        rows.append((q["id"], q["type"], q["category"], q.get("bundesland"), q["question"], _json(q["options"]),
+                     q["correctAnswer"], q.get("originalNum"), q.get("image")))
+        docs.append(("einbuergerung", str(q["id"]), q["category"], _text(q["question"], q["options"])))
+    return {"einbuergerung_questions": rows}, docs
+
+
+def load_schreiben(data):
+    rows, docs = [], []
+    for register in ("formal", "informal"):
+        for p in data.get(register, []):
+            rows.append((p["id"], register, p["category"], p.get("level"), p["title"], p["situation"],
+                         p.get("recipient"), _json(p["contentPoints"]), _json(p["hints"])))
+            docs.append(("schreiben", p["id"], p["title"], _text(p["situation"], p["contentPoints"], p["hints"])))
+    return {"schreiben_prompts": rows}, docs
+
+
+def _lesen_text(exercise):
+    parts = [exercise.get("instruction"), exercise.get("text")]
+    parts += [t.get("title", "") + " " + t.get("content", "") for t in exercise.get("texts", [])]
+    parts += [item.get("text", "") for item in exercise.get("situations", []) + exercise.get("questions", [])]
+    parts += [option for q in exercise.get("questions", []) for option in q.get("options", [])]
+    return _text(*parts)
+
+
+def load_lesen(data):
+    rows, docs = [], []
+    for teil, section in data.items():
+        for e in section["exercises"]:
+            rows.append((e["id"], teil, e["type"], e["title"], _json(e)))
+            docs.append(("lesen", e["id"], e["title"], _lesen_text(e)))
+    return {"lesen_exercises": rows}, docs
+
+
+def load_bild(data):
+    rows, docs = [], []
+    for theme, images in data["themes"].items():
+        for b in images:
+            extra = b.get("additionalQuestions", [])
+            rows.append((b["id"], theme, b.get("category"), b["file"], b["title"], b.get("alt"), b.get("description"),
+                         b.get("duration"), _json(b.get("questions", [])), _json(extra)))
+            docs.append(("bild", b["id"], b["title"],
+                         _text(b.get("alt"), b.get("description"), b.get("questions", []),
+                               [f"{q['question']} {q.get('answer', '')}" for q in extra])))
+    return {"bild_beschreiben": rows}, docs
+
+
+LOADERS = {
+    "scenarios": load_scenarios,
+    "redemittel": load_redemittel,
+    "quiz": load_quiz_theme,
+    "einbuergerung": load_einbuergerung,
+    "schreiben": load_schreiben,
+    "lesen": load_lesen,
+    "bild": load_bild,
+}
+
+
+def theme_files(themes_dir=THEMES_DIR):
+    # index.json and its hashed copies list the themes; each theme file has the questions
+    return sorted(p for p in Path(themes_dir).glob("*.json") if p.name.split(".")[0] != "index")
+
+
+def source_files():
+    """``[(kind, path)]`` of every content file."""
+    files = [(kind, path) for kind, path in SOURCES.items()]
+    files += [("quiz", path) for path in theme_files()]
+    return files
+
+
+def _columns(db, table):
+    return len(db.execute(f"SELECT * FROM {table} LIMIT 0").description)
+
+
+def create_schema(db, recipe):
+    for (name,) in db.execute("SELECT name FROM sqlite_master WHERE type IN ('table', 'view') "
+                              "AND name NOT LIKE 'sqlite_%' AND name NOT LIKE 'search_%'").fetchall():
+        db.execute(f"DROP TABLE IF EXISTS {name}")
+    # executescript() would commit the open transaction first
+    for statement in _statements(SCHEMA):
+        db.execute(statement)
+    db.execute("INSERT INTO meta VALUES ('recipe', ?)", (recipe,))
+    db.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+
+def _statements(script):
+    return [statement.strip() for statement in script.split(";") if statement.strip()]
+
+
+def _current_recipe(db):
+    if db.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+        return None
+    try:
+        row = db.execute("SELECT value FROM meta WHERE key = 'recipe'").fetchone()
+    except sqlite3.OperationalError:  # no meta table: a new file
+        return None
+    return row and row[0]
+
+
+def delete_source(db, source):
+    for table in CONTENT_TABLES:
+        db.execute(f"DELETE FROM {table} WHERE source = ?", (source,))
+    db.execute("DELETE FROM sources WHERE path = ?", (source,))
+
+
+def insert_source(db, kind, source, digest, data):
+    tables, docs = LOADERS[kind](data)
+    for table, rows in tables.items():
+        marks = ", ".join("?" * _columns(db, table))
+        db.executemany(f"INSERT INTO {table} VALUES ({marks})", [row + (source,) for row in rows])
+    db.executemany("INSERT INTO search (kind, ref, source, title, body) VALUES (?, ?, ?, ?, ?)",
+                   [(doc_kind, ref, source, title, body) for doc_kind, ref, title, body in docs])
+    db.execute("INSERT INTO sources VALUES (?, ?, ?)", (source, kind, digest))
+
+
+class BuildResult:
+    def __init__(self, loaded, removed, unchanged, rebuilt_all):
+        self.loaded = loaded
+        self.removed = removed
+        self.unchanged = unchanged
+        self.rebuilt_all = rebuilt_all
+
+
+def build(output=DEFAULT_OUTPUT, force=False, manifest=None):
+    """Bring ``output`` up to date with the content files; returns BuildResult."""
+    manifest = manifest or BuildManifest(DIGEST_CACHE)
+    recipe = content_hash("contentdb", SCHEMA_VERSION, Path(__file__).read_text(encoding="utf-8"))
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+
+    db = sqlite3.connect(output, isolation_level=None)
+    try:
+        db.execute("BEGIN IMMEDIATE")
+        rebuilt_all = force or _current_recipe(db) != recipe
+        if rebuilt_all:
+            create_schema(db, recipe)
+        known = dict(db.execute("SELECT path, sha256 FROM sources"))
+
+        loaded, unchanged, seen = [], 0, set()
+        for kind, path in source_files():
+            source = relpath(path)
+            seen.add(source)
+            digest = manifest.stat_digest(path) or file_digest(path)
+            manifest.record(path, digest, {})
+            if known.get(source) == digest:
+                unchanged += 1
+                continue
+            data = load_json(path)
+            delete_source(db, source)
+            insert_source(db, kind, source, digest, data)
+            loaded.append(source)
+        removed = sorted(known.keys() - seen)
+        for source in removed:
+            delete_source(db, source)
+        if loaded or removed:
+            db.execute("INSERT INTO search (search) VALUES ('optimize')")
+        db.execute("COMMIT")
+    except BaseException:
+        if db.in_transaction:
+            db.execute("ROLLBACK")
+        raise
+    finally:
+        db.close()
+    if loaded or removed:
+        with sqlite3.connect(output) as db:
+            db.execute("PRAGMA optimize")
+    manifest.save()
+    return BuildResult(loaded, removed, unchanged, rebuilt_all)
+
+
+def connect(path=DEFAULT_OUTPUT):
+    """Read-only connection to a built database."""
+    return sqlite3.connect(f"file:{Path(path).resolve()}?mode=ro", uri=True)
+
+
+def match_expression(query, prefix=False):
+    """User text → FTS5 query: every word must match (quoted, so no FTS syntax leaks through)."""
+    words = re.findall(r"\w+", query)
+    return " ".join('"%s"%s' % (word, "*" if prefix else "") for word in words)
+
+
+def search(db, query, kind=None, limit=10, prefix=False):
+    """``[(kind, ref, title, snippet)]`` best first (bm25, title hits weighted 3×)."""
+    expression = match_expression(query, prefix)
+    if not expression:
+        return []
+    sql = ("SELECT kind, ref, title, snippet(search, 4, '[', ']', '…', 8) FROM search "
+           "WHERE search MATCH ?" + (" AND kind = ?" if kind else "") +
+           " ORDER BY bm25(search, 0, 0, 0, 3.0, 1.0) LIMIT ?")
+    return db.execute(sql, (expression, kind, limit) if kind else (expression, limit)).fetchall()
+
+
+def table_counts(db):
+    return {table: db.execute(f"SELECT count(*) FROM {table}").fetchone()[0] for table in CONTENT_TABLES}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT))
+    parser.add_argument("--force", action="store_true", help="rebuild every table from scratch")
+    parser.add_argument("--query", help="search the built database instead of building it")
+    parser.add_argument("--kind", help="restrict --query to one kind (scenario, quiz, einbuergerung, ...)")
+    parser.add_argument("--prefix", action="store_true", help="treat each query word as a prefix")
+    args = parser.parse_args()
+
+    if args.query:
+        db = connect(args.output)
+        start = time.perf_counter()
+        hits = search(db, args.query, args.kind, prefix=args.prefix)
+        elapsed = time.perf_counter() - start
+        print(f"🔎 {len(hits)} hit(s) in {elapsed * 1000:.2f} ms")
+        for kind, ref, title, snippet in hits:
+            print(f"   {kind:<13} {ref:<22} {title}: {snippet}")
+        return
+
+    start = time.perf_counter()
+    result = build(args.output, args.force)
+    elapsed = time.perf_counter() - start
+    with connect(args.output) as db:
+        counts = table_counts(db)
+    what = "rebuilt from scratch" if result.rebuilt_all else "updated"
+    print(f"✅ {relpath(args.output)} {what} in {elapsed * 1000:.0f} ms: {len(result.loaded)} file(s) loaded, "
+          f"{result.unchanged} unchanged, {len(result.removed)} removed")
+    for source in result.loaded:
+        print(f"   📥 {source}")
+    print("📦 " + ", ".join(f"{table} {count}" for table, count in counts.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+"""
+Near-duplicate and drift detection across the scenario sources.
+
+Every scenario source (see sources.py) is split into records:
+
+* one ``scenario`` record per scenario: title + aufgabe + Leitpunkte
+* one ``line`` record per dialogue string (greeting, step text, choices,
+  examiner prompts, closing)
+
+Each record is shingled into character 5-grams of its folded text and
+summarized by a MinHash signature. Locality-sensitive hashing (the signature
+cut into bands, records sharing any band bucket become candidates) finds
+similar pairs without comparing all pairs; candidates above the Jaccard
+threshold are merged into clusters.
+
+The report lists
+
+* drift: a scenario id whose copies in different sources disagree, with the
+  fields that differ and whether the copies are still near-duplicates
+* duplicates: clusters of scenarios under different ids, and dialogue
+  lines repeated across scenarios (templated filler)
+
+    python3 -m besty_build.dedup
+    python3 -m besty_build.dedup --threshold 0.6 --json /tmp/dedup.json
+"""
+
+import argparse
+import json
+import random
+import re
+import zlib
+from collections import defaultdict
+
+from .incremental import scenario_id
+from .search import fold
+from .sources import all_sources
+from .store import atomic_write
+
+NUM_PERM = 64
+SHINGLE = 5
+DEFAULT_THRESHOLD = 0.7
+
+_PRIME = (1 << 61) - 1
+_SPACES = re.compile(r"\s+")
+# Dialogue keys of the different generations of the catalog schema
+_DIALOGUE_KEYS = ("dialogue", "greeting", "steps", "closing", "dialogueFlow")
+_DRIFT_FIELDS = ("title", "theme", "aufgabe", "leitpunkte")
+# Enum-like values inside dialogues, not text
+_LABEL_KEYS = ("speaker", "category")
+
+
+class Record:
+    __slots__ = ("source", "id", "kind", "path", "text")
+
+    def __init__(self, source, id, kind, path, text):
+        self.source = source
+        self.id = id  # scenario id
+        self.kind = kind  # "scenario" or "line"
+        self.path = path  # where in the scenario a line came from
+        self.text = text
+
+    def label(self):
+        where = f" {self.path}" if self.path else ""
+        return f"{self.source} #{self.id}{where}"
+
+
+def scenario_text(scenario):
+    return " | ".join([scenario.get("title", ""), scenario.get("aufgabe", "")] + list(scenario.get("leitpunkte", [])))
+
+
+def _lines(value, path):
+    if isinstance(value, str):
+        yield path, value
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            if key not in _LABEL_KEYS:
+                yield from _lines(item, f"{path}/{key}")
+    elif isinstance(value, list):
+        for i, item in enumerate(value):
+            yield from _lines(item, f"{path}/{i}")
+
+
+def iter_records(sources):
+    for source, scenarios in sources.items():
+        for scenario in scenarios:
+            sid = scenario_id(scenario)
+            yield Record(source, sid, "scenario", "", scenario_text(scenario))
+            for key in _DIALOGUE_KEYS:
+                for path, text in _lines(scenario.get(key), key):
+                    yield Record(source, sid, "line", path, text)
+
+
+def shingles(text, k=SHINGLE):
+    """CRC32 hashes of the character k-grams of the folded, space-normalized text."""
+    text = _SPACES.sub(" ", fold(text)).strip()
+    if len(text) <= k:
+        return {zlib.crc32(text.encode("utf-8"))}
+    return {zlib.crc32(text[i:i + k].encode("utf-8")) for i in range(len(text) - k + 1)}
+
+
+class MinHasher:
+    """NUM_PERM universal hash functions (a*x + b) mod p, seeded for stable signatures."""
+
+    def __init__(self, num_perm=NUM_PERM, seed=1):
+        rng = random.Random(seed)
+        self.params = [(rng.randrange(1, _PRIME), rng.randrange(0, _PRIME)) for _ in range(num_perm)]
+
+    def signature(self, hashes):
+        return tuple(min((a * x + b) % _PRIME for x in hashes) for a, b in self.params)
+
+
+def similarity(sig_a, sig_b):
+    """Estimated Jaccard similarity of two signatures."""
+    return sum(x == y for x, y in zip(sig_a, sig_b)) / len(sig_a)
+
+
+def choose_bands(num_perm, threshold):
+    """``(bands, rows)`` whose LSH S-curve midpoint (1/b)^(1/r) is closest to ``threshold``."""
+    options = [(b, num_perm // b) for b in range(1, num_perm + 1) if num_perm % b == 0]
+    return min(options, key=lambda br: abs((1 / br[0]) ** (1 / br[1]) - threshold))
+
+
+class _DisjointSet:
+    def __init__(self, size):
+        self.parent = list(range(size))
+
+    def find(self, i):
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, i, j):
+        root_i, root_j = self.find(i), self.find(j)
+        if root_i != root_j:
+            self.parent[max(root_i, root_j)] = min(root_i, root_j)
+
+
+def cluster(texts, threshold=DEFAULT_THRESHOLD, num_perm=NUM_PERM):
+    """
+    Clusters of near-duplicate ``texts`` as lists of indices (singletons
+    left out). Identical texts share one signature; the rest is LSH.
+    """
+    hasher = MinHasher(num_perm)
+    distinct = {}
+    for i, text in enumerate(texts):
+        distinct.setdefault(_SPACES.sub(" ", fold(text)).strip(), []).append(i)
+    keys = list(distinct)
+    signatures = [hasher.signature(shingles(key)) for key in keys]
+
+    bands, rows = choose_bands(num_perm, threshold)
+    sets = _DisjointSet(len(keys))
+    for band in range(bands):
+        buckets = defaultdict(list)
+        for i, sig in enumerate(signatures):
+            buckets[sig[band * rows:(band + 1) * rows]].append(i)
+        for members in buckets.values():
+            first = members[0]
+            for other in members[1:]:
+                if sets.find(first) != sets.find(other) and similarity(signatures[first], signatures[other]) >= threshold:
+                    sets.union(first, other)
+
+    groups = defaultdict(list)
+    for i, key in enumerate(keys):
+        groups[sets.find(i)].extend(distinct[key])
+    return [sorted(group) for group in groups.values() if len(group) > 1]
+
+
+def find_drift(records, clusters):
+    """Scenario ids whose copies differ between sources."""
+    cluster_of = {}
+    for n, members in enumerate(clusters):
+        for i in members:
+            cluster_of[i] = n
+    by_id = defaultdict(list)
+    for i, record in enumerate(records):
+        by_id[record.id].append(i)
+
+    drift = []
+    for sid, members in by_id.items():
+        if len({records[i].text for i in members}) < 2:
+            continue
+        # Copies outside the cluster of the majority have drifted past the threshold
+        clusters_seen = defaultdict(list)
+        for i in members:
+            clusters_seen[cluster_of.get(i, -1 - i)].append(records[i].source)
+        drift.append({"id": sid, "copies": len(members), "variants": len({records[i].text for i in members}),
+                      "groups": sorted(clusters_seen.values(), key=len, reverse=True)})
+    return sorted(drift, key=lambda d: (-len(d["groups"]), -d["variants"], int(d["id"]) if d["id"].isdigit() else 0))
+
+
+def field_drift(sources):
+    """``{id: {field: {value: [sources]}}}`` for the fields that differ between copies."""
+    values = defaultdict(lambda: defaultdict(lambda: defaultdict(list)))
+    for source, scenarios in sources.items():
+        for scenario in scenarios:
+            fields = values[scenario_id(scenario)]
+            for field in _DRIFT_FIELDS:
+                fields[field][json.dumps(scenario.get(field), ensure_ascii=False)].append(source)
+    return {sid: {field: dict(variants) for field, variants in fields.items() if len(variants) > 1}
+            for sid, fields in values.items()}
+
+
+def analyze(sources, threshold=DEFAULT_THRESHOLD, num_perm=NUM_PERM):
+    records = list(iter_records(sources))
+    scenario_records = [r for r in records if r.kind == "scenario"]
+    line_records = [r for r in records if r.kind == "line"]
+
+    scenario_clusters = cluster([r.text for r in scenario_records], threshold, num_perm)
+    line_clusters = cluster([r.text for r in line_records], threshold, num_perm)
+
+    drift = find_drift(scenario_records, scenario_clusters)
+    fields = field_drift(sources)
+    for entry in drift:
+        entry["fields"] = fields[entry["id"]]
+
+    cross_id = []
+    for members in scenario_clusters:
+        ids = sorted({scenario_records[i].id for i in members}, key=lambda s: (len(s), s))
+        if len(ids) > 1:
+            cross_id.append({"ids": ids, "records": [scenario_records[i].label() for i in members]})
+
+    repeated_lines = []
+    for members in line_clusters:
+        scenarios = {(line_records[i].source, line_records[i].id) for i in members}
+        if len({sid for _, sid in scenarios}) > 1:
+            texts = sorted({line_records[i].text for i in members}, key=len)
+            repeated_lines.append({"count": len(members), "scenarios": len(scenarios),
+                                   "variants": len(texts), "example": texts[0]})
+    repeated_lines.sort(key=lambda entry: -entry["count"])
+
+    return {
+        "threshold": threshold,
+        "records": {"scenarios": len(scenario_records), "lines": len(line_records)},
+        "drift": drift,
+        "duplicate_scenarios": cross_id,
+        "repeated_lines": repeated_lines,
+    }
+
+
+def print_report(report, sources, top=10):
+    counts = report["records"]
+    print(f"🔍 {len(sources)} sources, {counts['scenarios']} scenario copies, {counts['lines']} dialogue lines "
+          f"(threshold {report['threshold']})")
+
+    drift = report["drift"]
+    split = [entry for entry in drift if len(entry["groups"]) > 1]
+    print(f"\n⚠️  {len(drift)} scenario ids differ between sources, "
+          f"{len(split)} of them beyond the similarity threshold")
+    for entry in drift[:top]:
+        print(f"   #{entry['id']}: {entry['variants']} variants in {entry['copies']} copies, "
+              f"{len(entry['groups'])} cluster(s)")
+        for field, variants in entry["fields"].items():
+            for value, where in variants.items():
+                print(f"      {field}: {value[:70]}  ← {', '.join(where)}")
+
+    print(f"\n📋 {len(report['duplicate_scenarios'])} near-duplicate scenarios under different ids")
+    for entry in report["duplicate_scenarios"][:top]:
+        print(f"   ids {', '.join(entry['ids'])}: {'; '.join(entry['records'][:4])}")
+
+    print(f"\n🔁 {len(report['repeated_lines'])} dialogue lines reused across scenarios")
+    for entry in report["repeated_lines"][:top]:
+        print(f"   {entry['count']:>4}× in {entry['scenarios']:>3} scenarios ({entry['variants']} variants): "
+              f"{entry['example'][:70]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="Jaccard similarity (0-1)")
+    parser.add_argument("--num-perm", type=int, default=NUM_PERM)
+    parser.add_argument("--top", type=int, default=10, help="entries to print per section")
+    parser.add_argument("--json", help="also write the full report here")
+    args = parser.parse_args()
+
+    skipped = []
+    sources = all_sources(skipped)
+    for name, error in skipped:
+        print(f"⚠️  Skipping {name}: {error}")
+    report = analyze(sources, args.threshold, args.num_perm)
+    print_report(report, sources, args.top)
+
+    if args.json:
+        atomic_write(args.json, json.dumps(report, ensure_ascii=False, indent=2).encode("utf-8"))
+        print(f"\n📝 Saved to: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
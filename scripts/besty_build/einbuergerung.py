@@ -0,0 +1,256 @@
+"""
+Einbürgerungstest shards and precomputed mock exams.
+
+public/data/einbuergerungstest/questions.json holds the whole bank (300
+general questions, 10 per Bundesland) and every exam page downloads all of
+it. This stage splits it into public/data/einbuergerungstest/shards/:
+
+    index.json                 metadata, examStructure, shard and exam-page listing
+    general.json               the 300 general questions
+    laender/<slug>.json        the 10 questions of one Bundesland
+    kategorien/<slug>.json     the general questions of one category
+    fragen/<id>.json           one question
+    exams/<page>.json          ``--page-size`` mock exams as question references
+
+An exam is ``[g_1 … g_30, s_1 … s_3]``: 30 general question ids and 3
+positions (0-9) in the learner's laender/<slug>.json, so one exam list
+serves every Bundesland. Opening mock exam k means fetching its exam page,
+the 30 fragen/ files and the Bundesland shard instead of the full bank.
+
+Exams come from a seeded sampler that computes exam k directly, without
+generating the ones before it: the general questions of exams 10r … 10r+9
+are consecutive slices of one keyed pseudo-random permutation of the 300
+(a Feistel network, cycle-walked into range), so every block of ten exams
+covers the general catalog exactly once. The state questions are the
+first three of a permutation keyed by k. Every exam is checked against the
+exam structure and against all earlier exams before it is written.
+
+    python3 -m besty_build.einbuergerung
+    python3 -m besty_build.einbuergerung --exams 5000 --seed 7
+"""
+
+import argparse
+import gzip
+import json
+import time
+from pathlib import Path
+
+from .incremental import BuildManifest, write_artifact
+from .loader import load_json
+from .paths import DATA_DIR, relpath
+
+EINBUERGERUNG_DIR = DATA_DIR / "einbuergerungstest"
+QUESTIONS_PATH = EINBUERGERUNG_DIR / "questions.json"
+DEFAULT_SHARD_DIR = EINBUERGERUNG_DIR / "shards"
+DEFAULT_EXAMS = 2000
+DEFAULT_PAGE_SIZE = 50
+
+_MASK64 = (1 << 64) - 1
+_ROUNDS = 4
+_sampled = {}
+
+
+def slugify(name):
+    """File name for a Bundesland or category ("Baden-Württemberg" → "baden-wuerttemberg")."""
+    return (name.lower().replace("ä", "ae").replace("ö", "oe").replace("ü", "ue")
+            .replace("ß", "ss").replace(" ", "-"))
+
+
+def _mix(x):
+    """splitmix64 finalizer: a well-spread 64-bit hash of an integer."""
+    x = (x + 0x9E3779B97F4A7C15) & _MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+
+class Permutation:
+    """
+    Keyed pseudo-random permutation of ``range(n)`` with O(1) lookup.
+
+    A balanced Feistel network permutes the smallest even-bit power of two
+    that holds ``n``; values that land outside ``range(n)`` are fed through
+    again (cycle walking), which keeps it a bijection on ``range(n)``.
+    """
+
+    def __init__(self, n, key):
+        if n < 1:
+            raise ValueError("cannot permute an empty range")
+        self.n = n
+        self.half = max(1, ((n - 1).bit_length() + 1) // 2)
+        self.mask = (1 << self.half) - 1
+        self.keys = [_mix(key * _ROUNDS + r) for r in range(_ROUNDS)]
+
+    def _encrypt(self, x):
+        left, right = x >> self.half, x & self.mask
+        for k in self.keys:
+            left, right = right, left ^ (_mix(right ^ k) & self.mask)
+        return (left << self.half) | right
+
+    def __getitem__(self, i):
+        if not 0 <= i < self.n:
+            raise IndexError(i)
+        i = self._encrypt(i)
+        while i >= self.n:
+            i = self._encrypt(i)
+        return i
+
+    def __len__(self):
+        return self.n
+
+
+class ExamSampler:
+    """Exam ``k`` as ``(general positions, state positions)``, computed independently of other exams."""
+
+    def __init__(self, general_count, state_count, structure, seed=0):
+        self.general_count = general_count
+        self.state_count = state_count
+        self.general = structure["generalQuestions"]
+        self.state = structure["stateQuestions"]
+        if self.general > general_count or self.state > state_count:
+            raise ValueError("exam structure asks for more questions than the bank has")
+        self.seed = seed
+        self.per_round = general_count // self.general
+
+    def _key(self, kind, n):
+        return _mix(_mix(self.seed) ^ _mix(kind) ^ n)
+
+    def exam(self, k):
+        cycle, slot = divmod(k, self.per_round)
+        general = Permutation(self.general_count, self._key(1, cycle))
+        state = Permutation(self.state_count, self._key(2, k))
+        first = slot * self.general
+        return ([general[first + i] for i in range(self.general)],
+                [state[i] for i in range(self.state)])
+
+
+def split_bank(bank):
+    """``(general, {bundesland: questions}, {category: questions})`` in bank order."""
+    general = [q for q in bank["questions"] if q["type"] == "general"]
+    laender = {name: [] for name in bank["bundeslaender"]}
+    for q in bank["questions"]:
+        if q["type"] == "state":
+            laender[q["bundesland"]].append(q)
+    categories = {}
+    for q in general:
+        categories.setdefault(q["category"], []).append(q)
+    return general, laender, categories
+
+
+def generate_exams(sampler, count, general_ids):
+    """``count`` exams as ``[general ids…, state positions…]``; raises ValueError on an invalid or repeated exam."""
+    seen = set()
+    exams = []
+    for k in range(count):
+        general, state = sampler.exam(k)
+        if len(set(general)) != sampler.general or len(set(state)) != sampler.state:
+            raise ValueError(f"exam {k} repeats a question")
+        signature = (frozenset(general), frozenset(state))
+        if signature in seen:
+            raise ValueError(f"exam {k} repeats an earlier exam")
+        seen.add(signature)
+        exams.append([general_ids[i] for i in general] + state)
+    return exams
+
+
+def _compact(data):
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def shard_files(bank, exams, seed, page_size):
+    """``{relative path: bytes}`` of every file in the shard directory."""
+    general, laender, categories = split_bank(bank)
+    files = {"general.json": _compact({"name": "general", "questions": general})}
+    listing = {"general": {"file": "general.json", "questions": len(general)}, "laender": [], "kategorien": []}
+    for kind, groups in (("laender", laender), ("kategorien", categories)):
+        for name, questions in groups.items():
+            path = f"{kind}/{slugify(name)}.json"
+            files[path] = _compact({"name": name, "questions": questions})
+            listing[kind].append({"name": name, "file": path, "questions": len(questions)})
+    for q in bank["questions"]:
+        files[f"fragen/{q['id']}.json"] = _compact(q)
+
+    pages = [exams[i:i + page_size] for i in range(0, len(exams), page_size)]
+    for n, page in enumerate(pages):
+        files[f"exams/{n}.json"] = _compact({"first": n * page_size, "exams": page})
+    listing["exams"] = {"seed": seed, "count": len(exams), "pageSize": page_size, "pages": len(pages),
+                        "file": "exams/{page}.json", "layout": "general question ids, then positions in laender/<slug>.json"}
+
+    index = {"metadata": bank["metadata"], **listing}
+    files["index.json"] = json.dumps(index, ensure_ascii=False, indent=2).encode("utf-8")
+    return files
+
+
+def build(bank, out_dir=DEFAULT_SHARD_DIR, count=DEFAULT_EXAMS, seed=0, page_size=DEFAULT_PAGE_SIZE,
+          force=False, manifest=None):
+    """Write the shard directory; returns ``(files, exams, written)``."""
+    manifest = manifest or BuildManifest()
+    general, laender, _ = split_bank(bank)
+    state_counts = {len(questions) for questions in laender.values()}
+    if len(state_counts) != 1:
+        raise ValueError(f"Bundesländer have different numbers of questions: {sorted(state_counts)}")
+    sampler = ExamSampler(len(general), state_counts.pop(), bank["metadata"]["examStructure"], seed)
+    general_ids = tuple(q["id"] for q in general)
+    # Exams depend only on these, so a long-running process (watch.py) samples them once
+    key = (sampler.general_count, sampler.state_count, sampler.general, sampler.state, seed, count, general_ids)
+    if key not in _sampled:
+        _sampled[key] = generate_exams(sampler, count, general_ids)
+    exams = _sampled[key]
+    files = shard_files(bank, exams, seed, page_size)
+
+    written = 0
+    for name, data in files.items():
+        path = out_dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        written += write_artifact(manifest, path, data, {}, force, publish=name == "index.json")
+
+    # Drop files of a previous build that are no longer produced (e.g. fewer exam pages)
+    prefix = relpath(out_dir) + "/"
+    live = {prefix + name for name in files}
+    for artifact in [a for a in manifest.artifacts if a.startswith(prefix) and a not in live]:
+        stale = out_dir / artifact[len(prefix):]
+        if stale.exists():
+            stale.unlink()
+        manifest.forget(stale)
+    manifest.save()
+    return files, exams, written
+
+
+def exam_download(files, exams, k, page_size, land_file, general=30):
+    """Bytes a learner fetches to open exam ``k``: its page, its general questions, the Bundesland shard."""
+    paths = [f"exams/{k // page_size}.json", land_file] + [f"fragen/{qid}.json" for qid in exams[k][:general]]
+    raw = sum(len(files[p]) for p in paths)
+    return raw, sum(len(gzip.compress(files[p], 6, mtime=0)) for p in paths)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--input", default=str(QUESTIONS_PATH))
+    parser.add_argument("--output-dir", default=str(DEFAULT_SHARD_DIR))
+    parser.add_argument("--exams", type=int, default=DEFAULT_EXAMS, help="number of mock exams to precompute")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE, help="exams per exam page")
+    parser.add_argument("--force", action="store_true", help="rewrite every file even if unchanged")
+    args = parser.parse_args()
+
+    bank = load_json(args.input)
+    start = time.perf_counter()
+    files, exams, written = build(bank, Path(args.output_dir), args.exams, args.seed, args.page_size, args.force)
+    elapsed = time.perf_counter() - start
+    print(f"✅ {len(exams)} mock exams (seed {args.seed}) and {len(files)} shard files in {elapsed * 1000:.0f} ms")
+    print(f"📝 {relpath(args.output_dir)}: {written} file(s) written")
+
+    bank_raw = Path(args.input).read_bytes()
+    land = json.loads(files["index.json"])["laender"][0]["file"]
+    sizes = [exam_download(files, exams, k, args.page_size, land,
+                           bank["metadata"]["examStructure"]["generalQuestions"]) for k in range(len(exams))]
+    raw = sum(s[0] for s in sizes) / len(sizes)
+    gz = sum(s[1] for s in sizes) / len(sizes)
+    print(f"\n📦 full bank: {len(bank_raw) / 1e3:.0f} KB ({len(gzip.compress(bank_raw, 6, mtime=0)) / 1e3:.0f} KB gzip)")
+    print(f"   one mock exam: {raw / 1e3:.1f} KB ({gz / 1e3:.1f} KB gzip per file) on average")
+    print(f"   general.json {len(files['general.json']) / 1e3:.0f} KB, "
+          f"{land} {len(files[land]) / 1e3:.1f} KB, exam page {len(files['exams/0.json']) / 1e3:.1f} KB")
+
+
+if __name__ == "__main__":
+    main()
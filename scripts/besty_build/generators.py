@@ -0,0 +1,296 @@
+"""
+The four Sprechen Teil 3 catalog generators.
+
+Their scenario sources (titles, aufgaben, Leitpunkte and the hand-written
+dialogues) live in data/scenario-sources.json, one section per generator;
+this module holds only what is code: the expansion and templating, and
+each generator's output defaults. The generate-*.py scripts in scripts/
+are thin wrappers around the ``main_*`` functions here, and
+``python3 -m besty_build <stage>`` runs them the same way.
+
+    catalog    generate-dialogues-catalog.py   Leitpunkt scenarios + Redemittel choices
+    all-59     generate-all-59-scenarios.py    Aufgabe and Leitpunkte only (AI trainer)
+    complete   generate-complete-dialogues.py  3 complete dialogues + templated ones
+    batch-1    generate-dialogues-batch-1.py   the first complete natural dialogues
+
+Sources are parsed once per process and re-read when the file changes, so
+watch mode picks up edits without re-executing anything.
+"""
+
+import argparse
+
+from .loader import load_json
+from .model import ChoiceSet, DialogueStep, Scenario
+from .output import add_output_args, emit_catalog
+from .paths import ROOT, SPRECHEN_DIR
+
+SOURCES_PATH = ROOT / "data" / "scenario-sources.json"
+
+# Stage -> default monolithic output (the scripts' historical defaults; batchgen's too)
+OUTPUTS = {
+    "catalog": SPRECHEN_DIR / "dialogues-catalog-complete.json",
+    "all-59": SPRECHEN_DIR / "dialogues-catalog.json",
+    "complete": SPRECHEN_DIR / "dialogues-catalog.json",
+    "batch-1": SPRECHEN_DIR / "dialogues-catalog.json",
+    "batchgen": SPRECHEN_DIR / "dialogues-catalog-generated.json",
+}
+LIVE_OUTPUT = SPRECHEN_DIR / "dialogues-catalog.json"
+
+# Stage -> default shard directory (the shared sprechen/catalog/ is written by shards.py only)
+SHARD_DIRS = {
+    "catalog": SPRECHEN_DIR / "catalog-complete",
+    "all-59": SPRECHEN_DIR / "catalog-all-59",
+    "complete": SPRECHEN_DIR / "catalog-complete-dialogues",
+    "batch-1": SPRECHEN_DIR / "catalog-batch-1",
+    "batchgen": SPRECHEN_DIR / "catalog-generated",
+}
+
+
+def staging_outputs():
+    """Default outputs that are git-ignored staging, never deployed: shard dirs and non-live catalog files."""
+    return sorted(set(SHARD_DIRS.values()) | {path for path in OUTPUTS.values() if path != LIVE_OUTPUT})
+
+_cache = {}
+
+
+def _reload(key, path, load):
+    """``load(path)``, memoized until the file's mtime or size changes."""
+    stat = path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _cache.get(key)
+    if cached is None or cached[0] != stamp:
+        cached = _cache[key] = (stamp, load(path))
+    return cached[1]
+
+
+def scenario_sources(section):
+    """One generator's section of data/scenario-sources.json (shared; don't mutate)."""
+    return _reload("sources", SOURCES_PATH, load_json)[section]
+
+
+def redemittel_engine():
+    from .redemittel import REDEMITTEL_PATH, RedemittelEngine
+    return _reload("redemittel", REDEMITTEL_PATH, lambda path: RedemittelEngine(load_json(path)))
+
+
+# --- catalog: generate-dialogues-catalog.py ---------------------------------
+
+def catalog_meta():
+    return scenario_sources("catalog")["meta"]
+
+
+def catalog_sources():
+    return scenario_sources("catalog")["scenarios"]
+
+
+def expand_scenario(data):
+    """Expand one catalog source entry into its catalog Scenario"""
+
+    def step(i, prompt, fallback):
+        # The examiner asks about the Leitpunkt; the answers are scenario-specific Redemittel
+        leitpunkt = data['leitpunkte'][i] if len(data['leitpunkte']) > i else fallback
+        choices = ChoiceSet.from_dict(redemittel_engine().choices(leitpunkt, data['number']))
+        return DialogueStep(prompt + leitpunkt, choices, id=i + 1)
+
+    return Scenario(
+        id=str(data["number"]),
+        number=data["number"],
+        title=data["title"],
+        theme=data["theme"],
+        aufgabe=data["aufgabe"],
+        leitpunkte=data["leitpunkte"],
+        greeting="Hallo! Wie geht's? Schön, dass wir Zeit haben, das zusammen zu planen.",
+        steps=[
+            step(0, "Also, lass uns überlegen: ", 'Was denkst du?'),
+            step(1, "Gut! Und ", 'was machen wir noch?'),
+            step(2, "Super! Jetzt noch: ", 'Haben wir alles?'),
+        ],
+        closing="Perfekt! Ich denke, wir haben jetzt einen guten Plan. Das wird bestimmt gut!"
+    )
+
+
+def catalog_recipe():
+    """
+    Cache recipe: only scenarios whose source, expander, model types (which
+    serialize the expanded scenarios) or Redemittel changed are re-expanded.
+    """
+    import inspect
+    from . import model
+    from .incremental import recipe_hash
+    return recipe_hash(expand_scenario, [inspect.getsource(model), redemittel_engine().fingerprint])
+
+
+def _expand_to_dict(data):
+    return expand_scenario(data).to_dict()
+
+
+def generate_catalog(jobs=1):
+    """
+    Generate complete catalog JSON: plain dicts, ready for json.dumps (jobs
+    > 1 expands scenarios in parallel). The build itself goes through
+    expand_scenario and emit_catalog, which keep the Scenario objects.
+    """
+    from .parallel import ordered_map
+    redemittel_engine()  # load before forking, so workers inherit it
+    return {
+        "meta": dict(catalog_meta()),
+        "scenarios": ordered_map(_expand_to_dict, catalog_sources(), jobs)
+    }
+
+
+# --- all-59: generate-all-59-scenarios.py -----------------------------------
+
+def create_all_59_scenarios():
+    """
+    All 59 DTZ Sprechen Teil 3 scenarios with Aufgabe and Leitpunkte.
+    AI will generate the actual conversations dynamically.
+    """
+    return scenario_sources("all-59")
+
+
+# --- complete: generate-complete-dialogues.py -------------------------------
+
+def templated_scenario(num, title, theme, aufgabe, leitpunkte):
+    """A scenario with the dialogue structure but generic turns, to be expanded by hand."""
+    return {
+        "id": str(num),
+        "number": num,
+        "title": title,
+        "theme": theme,
+        "aufgabe": aufgabe,
+        "leitpunkte": leitpunkte,
+        "dialogue": {
+            "greeting": "Hallo! Wie geht's? Lass uns das zusammen planen!",
+            "steps": [
+                {
+                    "speaker": "A",
+                    "text": f"Also, {leitpunkte[0] if leitpunkte else 'was meinst du?'} Was hältst du davon?",
+                    "choices": {
+                        "positive": "Ja, das ist eine gute Idee! Das passt gut.",
+                        "negative": "Hmm, ich weiß nicht. Vielleicht sollten wir etwas anderes machen?",
+                        "question": "Was denkst du? Hast du eine bessere Idee?",
+                        "suggestion": "Ich würde vorschlagen, dass wir das so machen. Einverstanden?"
+                    }
+                },
+                {
+                    "speaker": "B",
+                    "text": f"Gut! Und {leitpunkte[1] if len(leitpunkte) > 1 else 'was noch?'}",
+                    "choices": {
+                        "positive": "Perfekt! Das finde ich auch gut.",
+                        "negative": "Das geht leider nicht, weil ich da keine Zeit habe.",
+                        "question": "Sollen wir noch etwas anderes überlegen?",
+                        "suggestion": "Wie wäre es, wenn wir das kombinieren?"
+                    }
+                },
+                {
+                    "speaker": "A",
+                    "text": f"Super! Und {leitpunkte[2] if len(leitpunkte) > 2 else 'haben wir alles?'}",
+                    "choices": {
+                        "positive": "Ja, genau! Das ist wichtig.",
+                        "negative": "Nein, das brauchen wir nicht unbedingt.",
+                        "question": "Wer könnte das organisieren?",
+                        "suggestion": "Ich könnte das übernehmen, wenn du möchtest."
+                    }
+                }
+            ],
+            "closing": "Perfekt! Ich denke, wir haben jetzt einen guten Plan. Das wird bestimmt gut! Bis dann!"
+        }
+    }
+
+
+def generate_simplified_catalog():
+    """
+    Catalog with the complete dialogues followed by simplified templated
+    ones. You can then fill in the rest based on these templates.
+    """
+    source = scenario_sources("complete")
+    scenarios = list(source["dialogues"])
+    scenarios.extend(templated_scenario(*template) for template in source["templates"])
+    return {"meta": source["meta"], "scenarios": scenarios}
+
+
+# --- batch-1: generate-dialogues-batch-1.py ---------------------------------
+
+def create_all_dialogues():
+    return scenario_sources("batch-1")["scenarios"]
+
+
+def create_catalog_with_dialogues_1_to_10():
+    """Create catalog with the complete dialogues written so far"""
+    dialogues = create_all_dialogues()
+    meta = dict(scenario_sources("batch-1")["meta"], complete_dialogues=len(dialogues))
+    return {"meta": meta, "scenarios": dialogues}
+
+
+# --- command line -----------------------------------------------------------
+
+def _parse_args(stage, description, argv):
+    parser = argparse.ArgumentParser(description=description, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_output_args(parser, OUTPUTS[stage], SHARD_DIRS[stage])
+    return parser.parse_args(argv)
+
+
+def main_catalog(argv=None, description="Dialogue catalog generator: all 59 scenarios with Redemittel choices."):
+    args = _parse_args("catalog", description, argv)
+    sources = catalog_sources()
+    results = emit_catalog(args, catalog_meta(), sources, expand=expand_scenario, recipe=catalog_recipe())
+
+    print(f"✅ Generated complete catalog with {len(sources)} scenarios")
+    for output_path, result in results:
+        print(f"📝 Saved to: {output_path} ({result.summary()})")
+    print("\nNext steps:")
+    print("1. Review the generated catalog")
+    print("2. Replace the old catalog: mv dialogues-catalog-complete.json dialogues-catalog.json")
+    print("3. Test the interface")
+    print("4. Enhance individual dialogues with more natural conversation flows")
+
+
+def main_all_59(argv=None, description="All 59 scenarios with Aufgabe and Leitpunkte, for the AI trainer."):
+    args = _parse_args("all-59", description, argv)
+    print("🚀 Generating all 59 DTZ Sprechen Teil 3 scenarios...")
+
+    catalog = create_all_59_scenarios()
+
+    # Write to file (unchanged scenarios are reused from the build cache)
+    results = emit_catalog(args, catalog['meta'], catalog['scenarios'])
+
+    print(f"✅ Successfully generated {catalog['meta']['total_scenarios']} scenarios!")
+    for output_path, result in results:
+        print(f"📁 Saved to: {output_path} ({result.summary()})")
+    print("\n📊 Scenarios by theme:")
+
+    # Count by theme
+    themes = {}
+    for scenario in catalog['scenarios']:
+        theme = scenario['theme']
+        themes[theme] = themes.get(theme, 0) + 1
+
+    for theme, count in sorted(themes.items()):
+        print(f"   - {theme}: {count} scenarios")
+
+    print("\n🤖 All scenarios ready for AI-powered training!")
+    print("💡 No dialogues needed - AI generates conversations dynamically!")
+
+
+def main_complete(argv=None, description="Complete dialogues plus templated ones for the remaining scenarios."):
+    args = _parse_args("complete", description, argv)
+    catalog = generate_simplified_catalog()
+    results = emit_catalog(args, catalog["meta"], catalog["scenarios"])
+
+    print(f"✅ Generated catalog with {len(catalog['scenarios'])} scenarios")
+    print(f"   - {catalog['meta']['complete_dialogues']} complete dialogues")
+    print(f"   - {len(catalog['scenarios']) - catalog['meta']['complete_dialogues']} simplified templates")
+    for output_path, result in results:
+        print(f"📝 Saved to: {output_path} ({result.summary()})")
+    print("\n🎯 Next: Expand remaining dialogues with full conversation flows!")
+
+
+def main_batch_1(argv=None, description="Complete natural B1 dialogues written so far."):
+    args = _parse_args("batch-1", description, argv)
+    catalog = create_catalog_with_dialogues_1_to_10()
+    results = emit_catalog(args, catalog["meta"], catalog["scenarios"])
+
+    print(f"✅ Generated catalog with {len(catalog['scenarios'])} complete natural dialogues")
+    for output_path, result in results:
+        print(f"📝 Saved to: {output_path} ({result.summary()})")
+    print("\n🎯 Dialogues 1-4 are complete. Next: Continue with dialogues 5-10...")
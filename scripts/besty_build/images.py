@@ -0,0 +1,218 @@
+"""
+Image manifest for public/.
+
+For every PNG/JPEG under public/ this stage reads the dimensions from the
+file header alone (PNG IHDR, JPEG SOFn, plus the EXIF orientation, which
+swaps width and height for rotated photos) and hashes the bytes. Hashing
+runs across ``--jobs`` processes, and files whose size and mtime are unchanged
+since the last run come from the build cache without being read. It
+writes public/data/images.json:
+
+    images      {url: {width, height, bytes, sha256, src}}, where src is the URL
+                with a ``?v=<hash>`` cache-busting suffix
+    duplicates  groups of byte-identical files (the first URL is kept)
+    missing     images referenced from data/bild-beschreiben.json and the
+                Einbürgerungstest questions that are not in public/
+
+With the manifest the client can reserve the image box before it loads
+(no layout shift), and duplicate bytes can be dropped from the deploy.
+
+    python3 -m besty_build.images --jobs 4
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import struct
+import time
+from pathlib import Path
+
+from .incremental import BuildManifest, content_hash, write_artifact
+from .loader import load_json
+from .parallel import ordered_map
+from .paths import DATA_DIR, PUBLIC_DIR, ROOT, relpath
+
+DEFAULT_OUTPUT = DATA_DIR / "images.json"
+EXTENSIONS = (".png", ".jpg", ".jpeg")
+# Data files whose "file"/"image" fields point into public/
+REFERENCES = (
+    (ROOT / "data" / "bild-beschreiben.json", "file"),
+    (DATA_DIR / "einbuergerungstest" / "questions.json", "image"),
+)
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# SOF markers; C4 (DHT), C8 (JPG) and CC (DAC) share the range but are not frames
+_SOF = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+_EXIF_ORIENTATION = 0x0112
+
+
+class ImageFormatError(ValueError):
+    """A file whose header doesn't give its dimensions."""
+
+
+def png_size(buf):
+    if buf[:8] != _PNG_SIGNATURE or buf[12:16] != b"IHDR":
+        raise ImageFormatError("not a PNG (no IHDR chunk)")
+    return struct.unpack(">II", buf[16:24])
+
+
+def exif_orientation(segment):
+    """Orientation tag (1-8) of an APP1 Exif segment body, 1 if absent."""
+    if segment[:6] != b"Exif\0\0":
+        return 1
+    tiff = segment[6:]
+    order = {b"II": "<", b"MM": ">"}.get(bytes(tiff[:2]))
+    if order is None:
+        return 1
+    (ifd,) = struct.unpack(order + "I", tiff[4:8])
+    if ifd + 2 > len(tiff):
+        return 1
+    (count,) = struct.unpack(order + "H", tiff[ifd:ifd + 2])
+    for n in range(count):
+        entry = ifd + 2 + 12 * n
+        if entry + 12 > len(tiff):
+            break
+        tag, _, _, value = struct.unpack(order + "HHIH", tiff[entry:entry + 10])
+        if tag == _EXIF_ORIENTATION:
+            return value if 1 <= value <= 8 else 1
+    return 1
+
+
+def jpeg_size(buf):
+    """``(width, height)`` as displayed: from the SOF segment, swapped for EXIF orientations 5-8."""
+    if buf[:2] != b"\xff\xd8":
+        raise ImageFormatError("not a JPEG (no SOI marker)")
+    pos = 2
+    orientation = 1
+    while pos + 4 <= len(buf):
+        if buf[pos] != 0xFF:
+            raise ImageFormatError(f"no marker at byte {pos}")
+        marker = buf[pos + 1]
+        if marker == 0xFF:  # fill byte
+            pos += 1
+            continue
+        if marker == 0x01 or 0xD0 <= marker <= 0xD7:  # standalone markers
+            pos += 2
+            continue
+        (length,) = struct.unpack(">H", buf[pos + 2:pos + 4])
+        if marker == 0xE1:
+            orientation = exif_orientation(buf[pos + 4:pos + 2 + length])
+        elif marker in _SOF:
+            height, width = struct.unpack(">HH", buf[pos + 5:pos + 9])
+            return (height, width) if orientation >= 5 else (width, height)
+        elif marker == 0xDA:  # start of scan without a frame header
+            break
+        pos += 2 + length
+    raise ImageFormatError("no SOF segment before the image data")
+
+
+def image_size(buf, name):
+    return png_size(buf) if name.lower().endswith(".png") else jpeg_size(buf)
+
+
+def describe_file(path):
+    """``{width, height, bytes, sha256}`` of one image; runs in a worker."""
+    path = Path(path)
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        width, height = image_size(buf, path.name)
+        return {"width": width, "height": height, "bytes": len(buf), "sha256": hashlib.sha256(buf).hexdigest()}
+
+
+def url_of(path, public_dir=PUBLIC_DIR):
+    return "/" + Path(path).relative_to(public_dir).as_posix()
+
+
+def image_files(public_dir=PUBLIC_DIR):
+    return sorted(p for p in Path(public_dir).rglob("*") if p.suffix.lower() in EXTENSIONS and p.is_file())
+
+
+def _references(value, key):
+    if isinstance(value, dict):
+        for k, item in value.items():
+            if k == key and isinstance(item, str):
+                yield item
+            else:
+                yield from _references(item, key)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _references(item, key)
+
+
+def referenced_urls(references=REFERENCES):
+    urls = set()
+    for path, key in references:
+        urls.update(url for url in _references(load_json(path), key) if url.startswith("/"))
+    return urls
+
+
+def find_duplicates(images):
+    """Groups of URLs with identical bytes, each group and the list in URL order."""
+    by_hash = {}
+    for url, info in images.items():
+        by_hash.setdefault(info["sha256"], []).append(url)
+    return sorted(sorted(urls) for urls in by_hash.values() if len(urls) > 1)
+
+
+def build(public_dir=PUBLIC_DIR, output=DEFAULT_OUTPUT, jobs=1, force=False, manifest=None):
+    """Write the manifest; returns ``(document, files read, written)``."""
+    manifest = manifest or BuildManifest()
+    recipe = content_hash("images", Path(__file__).read_text(encoding="utf-8"))
+    paths = image_files(public_dir)
+
+    images, keys, missing = {}, {}, []
+    for path in paths:
+        digest = None if force else manifest.stat_digest(path)
+        cached = digest and manifest.get_fragment(content_hash(recipe, digest))
+        if cached:
+            images[url_of(path, public_dir)] = cached["summary"]
+        else:
+            missing.append(path)
+    for path, info in zip(missing, ordered_map(describe_file, missing, jobs)):
+        manifest.record(path, info["sha256"], {})
+        manifest.put_fragment(content_hash(recipe, info["sha256"]), "", info)
+        images[url_of(path, public_dir)] = info
+
+    images = dict(sorted(images.items()))
+    for url, info in images.items():
+        keys[url] = content_hash(recipe, info["sha256"])
+        info["src"] = f"{url}?v={info['sha256'][:10]}"
+    document = {
+        "format": "besty-images/1",
+        "images": images,
+        "duplicates": find_duplicates(images),
+        "missing": sorted(referenced_urls() - set(images)),
+    }
+    data = (json.dumps(document, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+    written = write_artifact(manifest, Path(output), data, keys, force, publish=True)
+    manifest.save()
+    return document, len(missing), written
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--public-dir", default=str(PUBLIC_DIR))
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT))
+    parser.add_argument("--jobs", type=int, default=1, metavar="N", help="hash with N processes (0 = one per CPU)")
+    parser.add_argument("--force", action="store_true", help="read every file even if unchanged")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    document, parsed, written = build(Path(args.public_dir), args.output, args.jobs, args.force)
+    elapsed = time.perf_counter() - start
+    images, duplicates = document["images"], document["duplicates"]
+
+    total = sum(info["bytes"] for info in images.values())
+    print(f"✅ {len(images)} images, {total / 1e6:.1f} MB in {elapsed * 1000:.0f} ms "
+          f"({parsed} read, {len(images) - parsed} unchanged)")
+    wasted = sum(images[url]["bytes"] for group in duplicates for url in group[1:])
+    print(f"🔁 {len(duplicates)} duplicate group(s), {wasted / 1e3:.0f} KB droppable")
+    for group in duplicates:
+        print(f"   {' = '.join(group)}")
+    for url in document["missing"]:
+        print(f"⚠️  {url} is referenced but not in {relpath(args.public_dir)}")
+    print(f"📝 {relpath(args.output)}: {'written' if written else 'unchanged'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+"""
+Incremental catalog builds.
+
+Every scenario gets a content hash computed from its source dict plus a
+"recipe" hash (the source code of the function that expands it). The
+serialized JSON fragment of each scenario is cached under that hash in
+.besty-build/fragments/, and .besty-build/manifest.json remembers, per
+output artifact, which scenario hashes went into it and the hash of the
+bytes that were written.
+
+A rebuild therefore only re-expands and re-serializes scenarios whose
+source (or expander) changed; the rest is a string join of cached
+fragments. The output is byte-identical to
+json.dump(catalog, f, ensure_ascii=False, indent=2).
+"""
+
+import hashlib
+import inspect
+import json
+import os
+from functools import partial
+
+from .jsonstream import encode_scenario, iter_catalog_text
+from .parallel import ordered_map
+from .paths import CACHE_DIR, relpath
+from .store import atomic_write, publish as publish_hashed
+
+MANIFEST_VERSION = 1
+
+
+def content_hash(*parts):
+    """sha256 over the canonical JSON encoding of ``parts``."""
+    canonical = json.dumps(parts, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def recipe_hash(expand=None, extra=None):
+    """Hash of the expander's source code, so editing it invalidates the cache."""
+    source = inspect.getsource(expand) if expand is not None else "identity"
+    return content_hash(source, extra)
+
+
+def scenario_id(source):
+    """Catalog id of a scenario source dict (``id`` or its ``number``)."""
+    return str(source["id"]) if "id" in source else str(source["number"])
+
+
+def summarize_scenario(scenario):
+    """Index entry for a scenario: what a menu needs to list it."""
+    if not isinstance(scenario, dict):
+        return scenario.summary()
+    return {
+        "id": str(scenario["id"]),
+        "number": scenario["number"],
+        "title": scenario["title"],
+        "theme": scenario["theme"],
+        "leitpunkte_count": len(scenario.get("leitpunkte", [])),
+    }
+
+
+def serialize_scenario(scenario):
+    """JSON text for one scenario (also the body of its shard file)."""
+    return encode_scenario(scenario)
+
+
+def assemble_catalog(meta, fragments):
+    """Join meta and scenario fragments exactly like json.dump(indent=2) would."""
+    return "".join(iter_catalog_text(meta, fragments))
+
+
+class Fragment:
+    """One serialized scenario plus the hash it was cached under."""
+
+    __slots__ = ("id", "key", "text", "summary", "rebuilt")
+
+    def __init__(self, id, key, text, summary, rebuilt):
+        self.id = id
+        self.key = key
+        self.text = text
+        self.summary = summary
+        self.rebuilt = rebuilt
+
+
+class BuildManifest:
+    """Per-artifact scenario hashes and output hashes from the last build."""
+
+    def __init__(self, path=None):
+        self.path = path or CACHE_DIR / "manifest.json"
+        self.fragments_dir = self.path.parent / "fragments"
+        self.artifacts = {}
+        self._fragments = {}  # already read or written this run
+        self._dirty = False  # a no-op build doesn't rewrite the manifest
+        if self.path.exists():
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == MANIFEST_VERSION:
+                self.artifacts = data.get("artifacts", {})
+
+    def get_fragment(self, key):
+        """Cached ``{"text", "summary"}`` record for ``key``, or None."""
+        if key in self._fragments:
+            return self._fragments[key]
+        try:
+            with open(self.fragments_dir / f"{key}.json", encoding="utf-8") as f:
+                record = json.load(f)
+        except FileNotFoundError:
+            return None
+        self._fragments[key] = record
+        return record
+
+    def put_fragment(self, key, text, summary):
+        record = {"text": text, "summary": summary}
+        atomic_write(self.fragments_dir / f"{key}.json", json.dumps(record, ensure_ascii=False).encode("utf-8"))
+        self._fragments[key] = record
+
+    def stat_digest(self, path):
+        """Recorded sha256 of ``path`` if its size and mtime are unchanged, else None."""
+        entry = self.artifacts.get(relpath(path))
+        if not entry:
+            return None
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        if stat.st_size != entry["size"] or stat.st_mtime_ns != entry["mtime_ns"]:
+            return None
+        return entry["sha256"]
+
+    def is_current(self, output_path, digest):
+        """True if ``output_path`` on disk is still what we wrote with ``digest``."""
+        return self.stat_digest(output_path) == digest
+
+    def forget(self, output_path):
+        if self.artifacts.pop(relpath(output_path), None) is not None:
+            self._dirty = True
+
+    def record(self, output_path, digest, scenarios):
+        stat = os.stat(output_path)
+        entry = {
+            "sha256": digest,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "scenarios": scenarios,
+        }
+        key = relpath(output_path)
+        if self.artifacts.get(key) != entry:
+            self.artifacts[key] = entry
+            self._dirty = True
+
+    def save(self):
+        if not self._dirty:
+            return
+        data = json.dumps({"version": MANIFEST_VERSION, "artifacts": self.artifacts}, indent=2, sort_keys=True)
+        atomic_write(self.path, data.encode("utf-8"))
+        self._dirty = False
+        self._prune()
+
+    def _prune(self):
+        """Drop cached fragments no artifact refers to any more."""
+        if not self.fragments_dir.exists():
+            return
+        live = {key for entry in self.artifacts.values() for key in entry["scenarios"].values()}
+        for name in os.listdir(self.fragments_dir):
+            key = name[:-len(".json")]
+            if key not in live:
+                os.remove(self.fragments_dir / name)
+                self._fragments.pop(key, None)
+
+
+class BuildResult:
+    def __init__(self, output_path, rebuilt, reused, files_written):
+        self.output_path = output_path
+        self.rebuilt = rebuilt
+        self.reused = reused
+        self.files_written = files_written
+
+    @property
+    def written(self):
+        return self.files_written > 0
+
+    def summary(self):
+        return (f"{len(self.rebuilt)} rebuilt, {self.reused} reused from cache, "
+                f"{self.files_written} file(s) written")
+
+
+def expand_and_encode(expand, source):
+    """Expand one source and return ``(json_text, index_summary)``."""
+    scenario = expand(source) if expand else source
+    return serialize_scenario(scenario), summarize_scenario(scenario)
+
+
+def expand_fragments(sources, manifest, expand=None, recipe=None, force=False, jobs=1):
+    """
+    Serialize every scenario in ``sources``, reusing cached fragments.
+
+    ``expand`` turns one source dict into its catalog entry (``None`` keeps the
+    source as-is). The index summary of each entry is cached alongside it.
+    Cache misses are expanded across ``jobs`` processes (see parallel.py);
+    results keep the order of ``sources``.
+    """
+    recipe = recipe or recipe_hash(expand)
+    fragments = []
+    missing = []
+    for source in sources:
+        key = content_hash(recipe, source)
+        cached = None if force else manifest.get_fragment(key)
+        if cached is None:
+            missing.append((len(fragments), source))
+            fragments.append(Fragment(scenario_id(source), key, None, None, True))
+        else:
+            fragments.append(Fragment(scenario_id(source), key, cached["text"], cached["summary"], False))
+
+    encoded = ordered_map(partial(expand_and_encode, expand), [source for _, source in missing], jobs)
+    for (position, _), (text, summary) in zip(missing, encoded):
+        fragment = fragments[position]
+        fragment.text = text
+        fragment.summary = summary
+        manifest.put_fragment(fragment.key, text, summary)
+    return fragments
+
+
+def write_artifact(manifest, output_path, data, scenarios, force=False, publish=False):
+    """
+    Write ``data`` (bytes) atomically unless the file already holds exactly
+    these bytes. Records the artifact in the manifest; returns True if the
+    file was written. ``publish`` also keeps a content-hashed copy and the
+    pointer manifest up to date (see store.py).
+    """
+    digest = hashlib.sha256(data).hexdigest()
+    written = force or not manifest.is_current(output_path, digest)
+    if written:
+        atomic_write(output_path, data)
+    manifest.record(output_path, digest, scenarios)
+    if publish:
+        publish_hashed(output_path, data, digest)
+    return written
+
+
+def build_catalog(meta, sources, output_path, expand=None, recipe=None, force=False, manifest=None, jobs=1,
+                  publish=False):
+    """
+    Build a monolithic catalog file from scenario ``sources``.
+
+    Only scenarios whose hash is missing from the fragment cache are
+    expanded; the file is only rewritten when its bytes change. ``publish``
+    also keeps a content-hashed copy (see store.py).
+    """
+    manifest = manifest or BuildManifest()
+    fragments = expand_fragments(sources, manifest, expand=expand, recipe=recipe, force=force, jobs=jobs)
+    text = assemble_catalog(meta, [fragment.text for fragment in fragments])
+    written = write_artifact(manifest, output_path, text.encode("utf-8"),
+                             {fragment.id: fragment.key for fragment in fragments}, force, publish=publish)
+    manifest.save()
+
+    rebuilt = [fragment.id for fragment in fragments if fragment.rebuilt]
+    return BuildResult(output_path, rebuilt, len(fragments) - len(rebuilt), int(written))
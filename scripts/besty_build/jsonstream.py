@@ -0,0 +1,117 @@
+"""
+Streaming JSON writer for generated catalogs.
+
+Writes ``{"meta": ..., "scenarios": [...]}`` while pulling scenarios one at
+a time from any iterable (typically a generator), so memory stays flat no
+matter how many variants are produced. Two formats:
+
+* indented: byte-identical to json.dump(catalog, f, ensure_ascii=False, indent=2)
+* compact:  no whitespace at all; identical bytes for identical input, so
+  the output can be hashed and diffed between runs
+"""
+
+import hashlib
+import json
+
+from .store import atomic_open
+
+# One encoder per format, built once instead of per json.dumps() call
+_INDENTED = json.JSONEncoder(ensure_ascii=False, indent=2)
+_COMPACT = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+BUFFER_SIZE = 1 << 16
+
+
+def indent_block(text, prefix):
+    """Prefix every line of ``text`` (JSON strings never contain raw newlines)."""
+    return prefix + text.replace("\n", "\n" + prefix)
+
+
+def encode_scenario(scenario, compact=False):
+    """JSON text for one scenario on its own (the shard-file form): a dict or a model.Scenario."""
+    if isinstance(scenario, dict):
+        return (_COMPACT if compact else _INDENTED).encode(scenario)
+    return scenario.to_json(compact)
+
+
+def iter_catalog_text(meta, fragments, compact=False):
+    """
+    Yield the catalog text chunk by chunk from already-encoded scenario
+    ``fragments`` (as returned by encode_scenario).
+    """
+    if compact:
+        yield '{"meta":%s,"scenarios":[' % _COMPACT.encode(meta)
+        first = True
+        for fragment in fragments:
+            yield fragment if first else "," + fragment
+            first = False
+        yield "]}"
+        return
+
+    meta_text = _INDENTED.encode(meta).replace("\n", "\n  ")
+    head = '{\n  "meta": %s,\n  "scenarios": [' % meta_text
+    first = True
+    for fragment in fragments:
+        yield (head + "\n" if first else ",\n") + indent_block(fragment, "    ")
+        first = False
+    yield head + "]\n}" if first else "\n  ]\n}"
+
+
+def iter_catalog(meta, scenarios, compact=False):
+    """Like iter_catalog_text, but encodes each scenario dict as it arrives."""
+    return iter_catalog_text(meta, (encode_scenario(s, compact) for s in scenarios), compact)
+
+
+class StreamStats:
+    def __init__(self):
+        self.scenarios = 0
+        self.bytes = 0
+        self.sha256 = hashlib.sha256()
+
+    @property
+    def digest(self):
+        return self.sha256.hexdigest()
+
+
+def write_catalog(f, meta, scenarios, compact=False, buffer_size=BUFFER_SIZE):
+    """
+    Stream a catalog into the binary file object ``f``.
+
+    ``scenarios`` may be any iterable; it is consumed exactly once and no
+    more than ``buffer_size`` bytes of output are held at a time. Returns
+    StreamStats (scenario count, bytes written, sha256 of the output).
+    """
+    stats = StreamStats()
+
+    def counted():
+        for scenario in scenarios:
+            stats.scenarios += 1
+            yield scenario
+
+    pending = []
+    pending_size = 0
+    for chunk in iter_catalog(meta, counted(), compact):
+        data = chunk.encode("utf-8")
+        pending.append(data)
+        pending_size += len(data)
+        if pending_size >= buffer_size:
+            _flush(f, pending, stats)
+            pending = []
+            pending_size = 0
+    _flush(f, pending, stats)
+    return stats
+
+
+def _flush(f, pending, stats):
+    if not pending:
+        return
+    block = b"".join(pending)
+    f.write(block)
+    stats.sha256.update(block)
+    stats.bytes += len(block)
+
+
+def dump_catalog(path, meta, scenarios, compact=False):
+    """write_catalog() to a file path, replacing it atomically once complete."""
+    with atomic_open(path) as f:
+        return write_catalog(f, meta, scenarios, compact)
@@ -0,0 +1,227 @@
+"""
+Fault-tolerant JSON loading for the data directory.
+
+Some files under public/data are not a single clean JSON document:
+sprechen/dialogues.json is several comma-separated documents concatenated
+(json.load fails with "Extra data"), dialogues-catalog.broken.json is truncated by a bad
+quote, and bild-beschreiben-exercises.json is empty. iter_documents()
+reads a file in chunks and pulls documents out one at a time with
+JSONDecoder.raw_decode, so it
+
+* recovers every top-level document, with its byte offsets
+* reports the exact corruption point (byte offset, line, column) and
+  resynchronizes at the next line that opens a document at the same
+  indentation as the top-level ones
+* never needs more memory than the largest document (a corrupt document
+  is buffered up to the end of the file)
+
+load_json() is the strict entry point for build stages: it returns the one
+document in a file or raises DataFileError with the location. load_tree()
+loads the whole public/data tree in parallel.
+
+    python3 -m besty_build.loader                 # report on public/data
+    python3 -m besty_build.loader path/to/file.json
+"""
+
+import argparse
+import codecs
+import json
+import os
+import re
+import time
+from pathlib import Path
+
+from .paths import DATA_DIR, relpath
+
+CHUNK_SIZE = 1 << 20
+
+# Whitespace and stray commas between documents (dialogues.json is array
+# elements without the surrounding brackets)
+_SEPARATOR = re.compile(r"[ \t\r\n,]*")
+_DOCUMENT_START = re.compile(r"\n([ \t]*)[\[{]")
+
+
+class DataFileError(ValueError):
+    """A data file is missing, empty, corrupt or holds more than one document."""
+
+
+class Document:
+    __slots__ = ("value", "start", "end")
+
+    def __init__(self, value, start, end):
+        self.value = value
+        self.start = start  # byte offsets into the file
+        self.end = end
+
+
+class Corruption:
+    __slots__ = ("message", "offset", "line", "column", "start", "resume")
+
+    def __init__(self, message, offset, line, column, start, resume):
+        self.message = message
+        self.offset = offset  # byte offset of the error
+        self.line = line
+        self.column = column
+        self.start = start  # byte offset where the broken document began
+        self.resume = resume  # byte offset where parsing picked up again (or EOF)
+
+    def __str__(self):
+        return f"{self.message} at line {self.line} column {self.column} (byte {self.offset})"
+
+
+class _Buffer:
+    """Decoded text of a file, read chunk by chunk, with byte/line bookkeeping."""
+
+    def __init__(self, f, chunk_size):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self.text = ""
+        self.eof = False
+        self.base_byte = 0  # bytes dropped from the front of ``text``
+        self.base_line = 1  # line number of text[0]
+
+    def fill(self):
+        chunk = self.f.read(self.chunk_size)
+        self.eof = not chunk
+        self.text += self.decoder.decode(chunk, final=self.eof)
+
+    def byte_offset(self, i):
+        return self.base_byte + len(self.text[:i].encode("utf-8"))
+
+    def location(self, i):
+        line_start = self.text.rfind("\n", 0, i) + 1
+        return self.base_line + self.text.count("\n", 0, i), i - line_start + 1
+
+    def trim(self, i):
+        """Drop consumed text up to the start of the line containing ``i``."""
+        cut = self.text.rfind("\n", 0, i) + 1
+        if cut:
+            self.base_byte = self.byte_offset(cut)
+            self.base_line += self.text.count("\n", 0, cut)
+            self.text = self.text[cut:]
+        return i - cut
+
+
+def iter_documents(path, chunk_size=CHUNK_SIZE):
+    """Yield Document and Corruption objects for ``path`` in file order."""
+    decoder = json.JSONDecoder()
+    with open(path, "rb") as f:
+        buf = _Buffer(f, chunk_size)
+        buf.fill()
+        pos = 0
+        top_indent = None
+        while True:
+            pos = _SEPARATOR.match(buf.text, pos).end()
+            if pos >= len(buf.text):
+                if buf.eof:
+                    return
+                buf.fill()
+                continue
+
+            try:
+                value, end = decoder.raw_decode(buf.text, pos)
+            except json.JSONDecodeError as err:
+                if not buf.eof:
+                    buf.fill()  # probably just a document split across chunks
+                    continue
+                line, column = buf.location(err.pos)
+                indent = top_indent if top_indent is not None else buf.location(pos)[1] - 1
+                resume = _next_document(buf.text, pos, indent)
+                yield Corruption(err.msg, buf.byte_offset(err.pos), line, column,
+                                 buf.byte_offset(pos), buf.byte_offset(resume))
+                pos = resume
+                continue
+
+            if end == len(buf.text) and not buf.eof:
+                buf.fill()  # a bare number at the chunk edge may continue
+                continue
+            if top_indent is None:
+                top_indent = buf.location(pos)[1] - 1
+            yield Document(value, buf.byte_offset(pos), buf.byte_offset(end))
+            pos = buf.trim(end)
+
+
+def _next_document(text, start, indent):
+    """Start of the next line that opens ``{``/``[`` at most ``indent`` deep."""
+    for match in _DOCUMENT_START.finditer(text, start):
+        if len(match.group(1)) <= indent:
+            return match.end() - 1
+    return len(text)
+
+
+class LoadResult:
+    def __init__(self, path, documents, errors, size):
+        self.path = path
+        self.documents = documents
+        self.errors = errors
+        self.size = size
+
+    @property
+    def ok(self):
+        return len(self.documents) == 1 and not self.errors
+
+    def describe(self):
+        if self.ok:
+            return "ok"
+        if not self.documents and not self.errors:
+            return "empty"
+        parts = [f"{len(self.documents)} document(s)"]
+        parts += [str(error) for error in self.errors]
+        return "; ".join(parts)
+
+
+def load(path):
+    """Every document and corruption in ``path``."""
+    documents, errors = [], []
+    for item in iter_documents(path):
+        (documents if isinstance(item, Document) else errors).append(item)
+    return LoadResult(Path(path), documents, errors, os.path.getsize(path))
+
+
+def load_json(path):
+    """The single JSON document in ``path``; DataFileError with the location otherwise."""
+    result = load(path)
+    if not result.ok:
+        raise DataFileError(f"{relpath(path)}: {result.describe()}")
+    return result.documents[0].value
+
+
+def is_data_file(path):
+    return ".json" in path.name
+
+
+def load_tree(root=DATA_DIR, jobs=8):
+    """``{relpath: LoadResult}`` for every JSON file under ``root``, loaded in parallel."""
+    paths = sorted(p for p in Path(root).rglob("*") if p.is_file() and is_data_file(p))
+    # Largest first so one big file doesn't end up as the tail of the run
+    paths.sort(key=lambda p: p.stat().st_size, reverse=True)
+    from concurrent.futures import ThreadPoolExecutor  # ~8 ms to import; most stages never need it
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        results = list(pool.map(load, paths))
+    return {relpath(result.path): result for result in sorted(results, key=lambda r: r.path)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("paths", nargs="*", help="files to check (default: all of public/data)")
+    parser.add_argument("--jobs", type=int, default=8)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.paths:
+        results = {relpath(p): load(p) for p in args.paths}
+    else:
+        results = load_tree(jobs=args.jobs)
+    elapsed = time.perf_counter() - start
+
+    total = sum(result.size for result in results.values())
+    for name, result in results.items():
+        if not result.ok:
+            print(f"⚠️  {name}: {result.describe()}")
+    bad = sum(not result.ok for result in results.values())
+    print(f"📦 {len(results)} files, {total / 1e6:.1f} MB in {elapsed * 1000:.0f} ms ({bad} with problems)")
+
+
+if __name__ == "__main__":
+    main()
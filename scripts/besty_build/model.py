@@ -0,0 +1,214 @@
+"""
+Compact scenario objects with a direct JSON encoder.
+
+A generated scenario as nested dicts carries a hash table per scenario,
+per step and per choice set, and every one of them stores its keys again
+("positive", "negative", ... in each step). Scenario, DialogueStep and
+ChoiceSet keep the same fields in ``__slots__`` instead, and leitpunkte
+and steps in tuples.
+
+to_json() writes the text straight from the fields with the key strings
+precomputed, byte-identical to what jsonstream.encode_scenario() gives
+for to_dict() (indented or compact), so the objects can go anywhere a
+scenario dict goes in the build: shards, catalogs, the fragment cache.
+generators.expand_scenario() and the synthetic catalogs produce them.
+
+Both catalog layouts are covered:
+
+    flat      greeting/steps/closing on the scenario, steps {id, examinerPrompt, choices}
+              (generate-dialogues-catalog.py)
+    nested    dialogue {greeting, steps, closing}, steps {speaker, text, choices}
+              (the hand-written and synthetic dialogues)
+"""
+
+from json.encoder import encode_basestring as _quote  # C-accelerated, ensure_ascii=False
+
+CHOICE_KINDS = ("positive", "negative", "question", "suggestion")
+SCENARIO_FIELDS = ("id", "number", "title", "theme", "aufgabe", "leitpunkte")
+DIALOGUE_FIELDS = ("greeting", "steps", "closing")
+
+# Newline + indentation per nesting level (json.dumps(indent=2))
+_NL = ["\n" + "  " * level for level in range(8)]
+
+
+def _text(value):
+    return "null" if value is None else _quote(value)
+
+
+def _list(out, items, level, compact):
+    if not items:
+        out.append("[]")
+    elif compact:
+        out.append("[" + ",".join(map(_quote, items)) + "]")
+    else:
+        nl = _NL[level + 1]
+        out.append("[" + nl + ("," + nl).join(map(_quote, items)) + _NL[level] + "]")
+
+
+def _steps(out, steps, level, compact):
+    if not steps:
+        out.append("[]")
+        return
+    nl = "" if compact else _NL[level + 1]
+    out.append("[" + nl)
+    for i, step in enumerate(steps):
+        if i:
+            out.append("," + nl)
+        step._json(out, level + 1, compact)
+    out.append("]" if compact else _NL[level] + "]")
+
+
+class ChoiceSet:
+    """The four answer choices of one step."""
+
+    __slots__ = CHOICE_KINDS
+
+    def __init__(self, positive, negative, question, suggestion):
+        self.positive = positive
+        self.negative = negative
+        self.question = question
+        self.suggestion = suggestion
+
+    @classmethod
+    def from_dict(cls, data):
+        if tuple(data) != CHOICE_KINDS:
+            raise ValueError(f"choices must have exactly {', '.join(CHOICE_KINDS)} in that order, got {list(data)}")
+        return cls(*data.values())
+
+    def to_dict(self):
+        return {"positive": self.positive, "negative": self.negative,
+                "question": self.question, "suggestion": self.suggestion}
+
+    def _json(self, out, level, compact):
+        if compact:
+            out.append('{"positive":%s,"negative":%s,"question":%s,"suggestion":%s}' % (
+                _quote(self.positive), _quote(self.negative), _quote(self.question), _quote(self.suggestion)))
+        else:
+            nl = _NL[level + 1]
+            out.append('{%s"positive": %s,%s"negative": %s,%s"question": %s,%s"suggestion": %s%s}' % (
+                nl, _quote(self.positive), nl, _quote(self.negative), nl, _quote(self.question),
+                nl, _quote(self.suggestion), _NL[level]))
+
+
+class DialogueStep:
+    """
+    One turn. Flat-layout steps have a numeric ``id`` and the text is the
+    examiner prompt; nested-layout steps have a ``speaker`` instead.
+    """
+
+    __slots__ = ("id", "speaker", "text", "choices")
+
+    def __init__(self, text, choices, id=None, speaker=None):
+        self.id = id
+        self.speaker = speaker
+        self.text = text
+        self.choices = choices
+
+    @classmethod
+    def from_dict(cls, data):
+        keys = tuple(data)
+        if keys == ("id", "examinerPrompt", "choices"):
+            return cls(data["examinerPrompt"], ChoiceSet.from_dict(data["choices"]), id=data["id"])
+        if keys == ("speaker", "text", "choices"):
+            return cls(data["text"], ChoiceSet.from_dict(data["choices"]), speaker=data["speaker"])
+        raise ValueError(f"unknown step layout {list(keys)}")
+
+    def to_dict(self):
+        if self.id is not None:
+            return {"id": self.id, "examinerPrompt": self.text, "choices": self.choices.to_dict()}
+        return {"speaker": self.speaker, "text": self.text, "choices": self.choices.to_dict()}
+
+    def _json(self, out, level, compact):
+        nl = "" if compact else _NL[level + 1]
+        colon = ":" if compact else ": "
+        if self.id is not None:
+            head = '{%s"id"%s%d,%s"examinerPrompt"%s%s' % (nl, colon, self.id, nl, colon, _quote(self.text))
+        else:
+            head = '{%s"speaker"%s%s,%s"text"%s%s' % (nl, colon, _quote(self.speaker), nl, colon, _quote(self.text))
+        out.append(head + ',%s"choices"%s' % (nl, colon))
+        self.choices._json(out, level + 1, compact)
+        out.append("}" if compact else _NL[level] + "}")
+
+
+class Scenario:
+    """
+    One catalog scenario. Without steps, greeting and closing it is a bare
+    Aufgabe/Leitpunkte entry (the AI-trainer catalog).
+    """
+
+    __slots__ = SCENARIO_FIELDS + DIALOGUE_FIELDS + ("nested",)
+
+    def __init__(self, id, number, title, theme, aufgabe, leitpunkte,
+                 greeting=None, steps=(), closing=None, nested=False):
+        self.id = id
+        self.number = number
+        self.title = title
+        self.theme = theme
+        self.aufgabe = aufgabe
+        self.leitpunkte = tuple(leitpunkte)
+        self.greeting = greeting
+        self.steps = tuple(steps)
+        self.closing = closing
+        self.nested = nested
+
+    @property
+    def has_dialogue(self):
+        return self.greeting is not None or self.closing is not None or bool(self.steps)
+
+    @classmethod
+    def from_dict(cls, data):
+        keys = tuple(data)
+        fields = [data[key] for key in SCENARIO_FIELDS]
+        if keys == SCENARIO_FIELDS:
+            return cls(*fields)
+        if keys == SCENARIO_FIELDS + DIALOGUE_FIELDS:
+            dialogue, nested = data, False
+        elif keys == SCENARIO_FIELDS + ("dialogue",) and tuple(data["dialogue"]) == DIALOGUE_FIELDS:
+            dialogue, nested = data["dialogue"], True
+        else:
+            raise ValueError(f"unknown scenario layout {list(keys)}")
+        steps = [DialogueStep.from_dict(step) for step in dialogue["steps"]]
+        return cls(*fields, greeting=dialogue["greeting"], steps=steps, closing=dialogue["closing"], nested=nested)
+
+    def to_dict(self):
+        data = {"id": self.id, "number": self.number, "title": self.title, "theme": self.theme,
+                "aufgabe": self.aufgabe, "leitpunkte": list(self.leitpunkte)}
+        if self.has_dialogue:
+            dialogue = {"greeting": self.greeting, "steps": [step.to_dict() for step in self.steps],
+                        "closing": self.closing}
+            if self.nested:
+                data["dialogue"] = dialogue
+            else:
+                data.update(dialogue)
+        return data
+
+    def summary(self):
+        """Index entry (incremental.summarize_scenario)."""
+        return {"id": str(self.id), "number": self.number, "title": self.title, "theme": self.theme,
+                "leitpunkte_count": len(self.leitpunkte)}
+
+    def to_json(self, compact=False):
+        """Same text as jsonstream.encode_scenario(self.to_dict(), compact)."""
+        nl = "" if compact else _NL[1]
+        colon = ":" if compact else ": "
+        comma = "," + nl
+        out = ['{%s"id"%s%s%s"number"%s%d%s"title"%s%s%s"theme"%s%s%s"aufgabe"%s%s%s"leitpunkte"%s' % (
+            nl, colon, _quote(self.id), comma, colon, self.number, comma, colon, _quote(self.title),
+            comma, colon, _quote(self.theme), comma, colon, _quote(self.aufgabe), comma, colon)]
+        _list(out, self.leitpunkte, 1, compact)
+        if self.has_dialogue:
+            level = 1
+            if self.nested:
+                level = 2
+                out.append('%s"dialogue"%s{' % (comma, colon))
+                nl = "" if compact else _NL[2]
+                comma = "," + nl
+            else:
+                out.append(",")
+            out.append('%s"greeting"%s%s%s"steps"%s' % (nl, colon, _text(self.greeting), comma, colon))
+            _steps(out, self.steps, level, compact)
+            out.append('%s"closing"%s%s' % (comma, colon, _text(self.closing)))
+            if self.nested:
+                out.append("}" if compact else _NL[1] + "}")
+        out.append("}" if compact else "\n}")
+        return "".join(out)
@@ -0,0 +1,49 @@
+"""
+Command-line output options shared by the generate-*.py scripts.
+
+    --layout sharded      index.json + scenarios/<id>.json (see shards.py)
+    --layout monolithic   the legacy single dialogues-catalog.json
+    --layout both         both of the above (default while the frontend
+                          still reads the monolithic file)
+
+Every stage has its own shard directory (``default_shard_dir``), as it has
+its own monolithic file, so one stage never rewrites another's index or
+removes its shards. The shared one, sprechen/catalog/, is written from the
+live dialogues-catalog.json by ``python3 -m besty_build shards``. Only
+that index and the live dialogues-catalog.json itself are published under
+content-hashed names; staging outputs get no hashed copy or pointer.
+"""
+
+from pathlib import Path
+
+from .incremental import BuildManifest, build_catalog
+from .shards import DEFAULT_SHARD_DIR, LIVE_CATALOG, build_shards
+
+LAYOUTS = ("both", "sharded", "monolithic")
+
+
+def add_output_args(parser, default_output, default_shard_dir=DEFAULT_SHARD_DIR):
+    parser.add_argument("--force", action="store_true", help="ignore the build cache and rewrite everything")
+    parser.add_argument("--layout", choices=LAYOUTS, default="both", help="which catalog outputs to write")
+    parser.add_argument("--output", default=str(default_output), help="legacy monolithic catalog file")
+    parser.add_argument("--jobs", type=int, default=1, metavar="N",
+                        help="expand scenarios across N processes (0 = one per CPU)")
+    parser.add_argument("--shard-dir", default=str(default_shard_dir), help="directory for index.json + scenarios/")
+
+
+def emit_catalog(args, meta, sources, expand=None, recipe=None, manifest=None):
+    """Write the outputs selected by ``args``; returns [(path, BuildResult)]."""
+    manifest = manifest or BuildManifest()
+    results = []
+    if args.layout in ("both", "sharded"):
+        shard_dir = Path(args.shard_dir)
+        live = shard_dir.resolve() == DEFAULT_SHARD_DIR.resolve()
+        results.append((shard_dir, build_shards(meta, sources, shard_dir, expand=expand, recipe=recipe,
+                                                force=args.force, manifest=manifest, jobs=args.jobs,
+                                                publish=live)))
+    if args.layout in ("both", "monolithic"):
+        live = Path(args.output).resolve() == LIVE_CATALOG.resolve()
+        results.append((args.output, build_catalog(meta, sources, args.output, expand=expand, recipe=recipe,
+                                                   force=args.force, manifest=manifest, jobs=args.jobs,
+                                                   publish=live)))
+    return results
@@ -0,0 +1,38 @@
+"""
+Parallel scenario expansion.
+
+ordered_map() spreads a per-scenario function over a process pool in
+chunks and returns results in input order, so the output of a --jobs N
+run is byte-identical to the serial run. With jobs <= 1 (the default)
+everything stays in-process and no pool is started.
+
+The mapped function must be picklable, i.e. defined at module level
+(generators.expand_scenario is).
+"""
+
+import os
+
+
+def resolve_jobs(jobs):
+    """``0`` means one worker per CPU."""
+    if jobs == 0:
+        return os.cpu_count() or 1
+    return max(1, jobs)
+
+
+def default_chunksize(count, jobs):
+    # ~4 chunks per worker: big enough to amortize pickling, small enough
+    # to keep workers busy when scenarios differ in cost
+    return max(1, count // (jobs * 4))
+
+
+def ordered_map(fn, items, jobs=1, chunksize=None):
+    """``[fn(item) for item in items]``, optionally across ``jobs`` processes."""
+    items = list(items)
+    jobs = min(resolve_jobs(jobs), len(items))
+    if jobs <= 1:
+        return [fn(item) for item in items]
+    # Imported here: multiprocessing costs ~10 ms of startup that serial runs don't need
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(fn, items, chunksize=chunksize or default_chunksize(len(items), jobs)))
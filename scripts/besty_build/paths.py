@@ -0,0 +1,30 @@
+"""Repository paths used by the build stages (independent of the cwd)."""
+
+import os
+from functools import lru_cache
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+PUBLIC_DIR = ROOT / "public"
+DATA_DIR = PUBLIC_DIR / "data"
+SPRECHEN_DIR = DATA_DIR / "sprechen"
+
+# Local build state (manifests, cached fragments). Ignored by git.
+CACHE_DIR = ROOT / ".besty-build"
+
+
+@lru_cache(maxsize=None)
+def _real_dir(directory):
+    # Resolving symlinks costs an lstat per path component; a build asks for
+    # the same few directories hundreds of times
+    return Path(os.path.realpath(directory))
+
+
+def relpath(path):
+    """Path relative to the repo root, as a stable posix string."""
+    directory, name = os.path.split(os.path.abspath(path))
+    path = _real_dir(directory) / name
+    try:
+        return path.relative_to(ROOT).as_posix()
+    except ValueError:
+        return path.as_posix()
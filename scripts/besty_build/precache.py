@@ -0,0 +1,195 @@
+"""
+Precache manifest for the service worker.
+
+Walks public/data, public/audio and public/images and writes
+public/precache-manifest.json: every file the app may need offline, with
+its URL, revision (content hash prefix), byte size and priority tier, in
+the order a service worker should fetch them:
+
+    index     catalog index, the monolithic catalog, other index.json files
+              and the pointer manifest (what the menus render from)
+    shards    every other data file: scenario shards, Einbürgerungstest
+              questions, quiz themes, ...
+    audio     the Hören tracks
+    images    Bild-beschreiben photos and Einbürgerungstest images
+
+``install`` tiers are precached when the service worker installs, so their
+budgets together bound the first download; the others are fetched in the
+background afterwards, in tier order. Every tier has a byte budget, and
+the build fails (and leaves the old manifest in place) when one is over,
+listing the largest files of that tier.
+
+Not listed: content-hashed copies (store.py; the fixed URL is listed, with
+the same revision) unless an index.json points to them, as the catalog
+index does to its shards (shards.py), so superseded shards are left out
+too; the generators' staging outputs (generators.staging_outputs(): the
+catalog-*/ shard directories, dialogues-catalog-complete.json, ...), which
+are git-ignored and never deployed; backups (-OLD, .backup, .broken, .bak, PLACEHOLDER), empty files and
+data files that are not JSON (the Klett quiz HTML sources).
+Files whose size and mtime are unchanged since the last run are not hashed
+again. Those digests live in their own cache (.besty-build/precache/), not
+in the build manifest: most of the walked files are other stages' outputs,
+whose manifest entries (and the fragments they keep alive) are theirs.
+
+    python3 -m besty_build.precache
+    python3 -m besty_build.precache --budget audio=20
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import re
+import sys
+import time
+from pathlib import Path
+
+from .incremental import BuildManifest, write_artifact
+from .parallel import ordered_map
+from .generators import staging_outputs
+from .paths import CACHE_DIR, PUBLIC_DIR, relpath
+from .shards import indexed_shards
+from .store import HASH_LENGTH
+
+DEFAULT_OUTPUT = PUBLIC_DIR / "precache-manifest.json"
+DIGEST_CACHE = CACHE_DIR / "precache" / "manifest.json"
+ROOTS = ("data", "audio", "images")
+MB = 1024 * 1024
+
+# name -> (budget in bytes, precached on install)
+TIERS = {
+    "index": (MB // 8, True),
+    "shards": (2 * MB, True),
+    "audio": (16 * MB, False),
+    "images": (32 * MB, False),
+}
+INDEX_NAMES = ("index.json", "manifest.json", "dialogues-catalog.json")
+
+_HASHED_COPY = re.compile(r"\.[0-9a-f]{%d}\.[^.]+$" % HASH_LENGTH)
+_BACKUP = re.compile(r"-OLD\.|\.backup\.|\.broken\.|\.bak$|PLACEHOLDER")
+
+
+def file_digest(path):
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        return hashlib.sha256(buf).hexdigest()
+
+
+def tier_of(url):
+    root, name = url.split("/")[1], url.rsplit("/", 1)[1]
+    if root == "data":
+        return "index" if name in INDEX_NAMES else "shards"
+    return root
+
+
+def precache_files(public_dir=PUBLIC_DIR):
+    """``[(url, path)]`` of every file to precache, sorted by URL."""
+    public_dir = Path(public_dir)
+    staging = [public_dir / path.relative_to(PUBLIC_DIR) for path in staging_outputs()]
+    indexed = {index.parent / shard for index in (public_dir / "data").rglob("index.json")
+               for shard in indexed_shards(index.parent)}
+    files = []
+    for root in ROOTS:
+        for path in (public_dir / root).rglob("*"):
+            name = path.name
+            if (not path.is_file() or (_HASHED_COPY.search(name) and path not in indexed) or _BACKUP.search(name)
+                    or any(path == out or out in path.parents for out in staging)
+                    or (root == "data" and path.suffix != ".json") or path.stat().st_size == 0):
+                continue
+            files.append(("/" + path.relative_to(public_dir).as_posix(), path))
+    return sorted(files)
+
+
+def over_budget(tiers):
+    """Tier names whose bytes exceed their budget."""
+    return [name for name, tier in tiers.items() if tier["bytes"] > tier["budget"]]
+
+
+def build(public_dir=PUBLIC_DIR, output=DEFAULT_OUTPUT, budgets=None, jobs=1, force=False, manifest=None):
+    """
+    Returns ``(document, files hashed, written)``; the file is not written
+    when a tier is over budget.
+    """
+    manifest = manifest or BuildManifest(DIGEST_CACHE)
+    budgets = dict({name: budget for name, (budget, _) in TIERS.items()}, **(budgets or {}))
+    files = precache_files(public_dir)
+
+    digests, missing = {}, []
+    for url, path in files:
+        digest = None if force else manifest.stat_digest(path)
+        if digest:
+            digests[url] = digest
+        else:
+            missing.append((url, path))
+    for (url, path), digest in zip(missing, ordered_map(file_digest, [path for _, path in missing], jobs)):
+        manifest.record(path, digest, {})
+        digests[url] = digest
+
+    order = list(TIERS)
+    tiers = {name: {"install": install, "budget": budgets[name], "bytes": 0, "files": 0}
+             for name, (_, install) in TIERS.items()}
+    entries = []
+    for url, path in sorted(files, key=lambda file: (order.index(tier_of(file[0])), file[0])):
+        tier = tier_of(url)
+        size = path.stat().st_size
+        tiers[tier]["bytes"] += size
+        tiers[tier]["files"] += 1
+        entries.append({"url": url, "revision": digests[url][:HASH_LENGTH], "size": size, "tier": tier})
+    document = {
+        "format": "besty-precache/1",
+        "installBytes": sum(tier["bytes"] for tier in tiers.values() if tier["install"]),
+        "tiers": tiers,
+        "entries": entries,
+    }
+
+    written = False
+    if not over_budget(tiers):
+        data = (json.dumps(document, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
+        written = write_artifact(manifest, Path(output), data, {}, force)
+    manifest.save()
+    return document, len(missing), written
+
+
+def parse_budget(text):
+    name, _, megabytes = text.partition("=")
+    if name not in TIERS or not megabytes:
+        raise argparse.ArgumentTypeError(f"expected TIER=MB with TIER one of {', '.join(TIERS)}, got {text!r}")
+    return name, int(float(megabytes) * MB)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--public-dir", default=str(PUBLIC_DIR))
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT))
+    parser.add_argument("--budget", type=parse_budget, action="append", default=[], metavar="TIER=MB",
+                        help="override one tier's budget")
+    parser.add_argument("--jobs", type=int, default=1, metavar="N", help="hash with N processes (0 = one per CPU)")
+    parser.add_argument("--force", action="store_true", help="hash every file even if unchanged")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    document, hashed, written = build(Path(args.public_dir), args.output, dict(args.budget), args.jobs, args.force)
+    elapsed = time.perf_counter() - start
+    tiers, entries = document["tiers"], document["entries"]
+
+    print(f"✅ {len(entries)} files in {elapsed * 1000:.0f} ms ({hashed} hashed, {len(entries) - hashed} unchanged)")
+    for name, tier in tiers.items():
+        flag = "❌" if tier["bytes"] > tier["budget"] else "  "
+        when = "install" if tier["install"] else "later"
+        print(f"{flag} {name:<7} {when:<8} {tier['files']:>4} files {tier['bytes'] / MB:>6.2f} MB "
+              f"(budget {tier['budget'] / MB:.2f} MB)")
+    print(f"📦 first download (install tiers): {document['installBytes'] / MB:.2f} MB")
+
+    over = over_budget(tiers)
+    for name in over:
+        largest = sorted((entry for entry in entries if entry["tier"] == name), key=lambda e: -e["size"])[:5]
+        print(f"❌ {name} is {(tiers[name]['bytes'] - tiers[name]['budget']) / MB:.2f} MB over budget; largest:")
+        for entry in largest:
+            print(f"   {entry['size'] / MB:6.2f} MB {entry['url']}")
+    if over:
+        print(f"⚠️  {relpath(args.output)} not written")
+        sys.exit(1)
+    print(f"📝 {relpath(args.output)}: {'written' if written else 'unchanged'}")
+
+
+if __name__ == "__main__":
+    main()
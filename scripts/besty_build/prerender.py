@@ -0,0 +1,214 @@
+"""
+Pre-rendered HTML for the Sprechen catalog listing.
+
+DialogueCatalogPage and DialogueMenu render nothing until the browser has
+fetched and parsed dialogues-catalog.json. This stage renders the listing
+ahead of time, grouped by theme (sorted, as the all-59 generator counts
+them), into public/data/sprechen/listing/:
+
+    index.html      the critical index inlined as
+                    <script type="application/json" id="catalog-index">,
+                    then the theme navigation and every theme section
+    <theme>.html    one theme section on its own (e.g. arbeit-beruf.html)
+
+The inlined index holds only what the listing shows: {meta: {total_scenarios,
+themes: {theme: count}}, scenarios: [{id, number, title, theme, aufgabe,
+leitpunkte_count}]}, the scenarios in number order like
+dialogues-catalog.json (only the HTML is grouped by theme), so the pages
+list them the same way whichever one they read. readInlineCatalog() in
+src/features/sprechen/dialoguesCatalog.js picks it up, so with the
+fragment in the page the catalog renders without a request. The cards use
+the same Tailwind classes as DialogueCatalogPage, so the pre-rendered
+listing looks like the rendered one until React replaces it.
+
+With ``--page dist/index.html`` (after ``vite build``) the index script and
+the listing are also placed in the app shell and written to
+dist/tests/sprechen/trainer/index.html, which the host serves for that
+route before falling back to the SPA rewrite.
+
+Files are only rewritten when their bytes change; fragments of themes that
+no longer exist are removed.
+
+    python3 -m besty_build.prerender
+    python3 -m besty_build.prerender --page ../dist/index.html
+    npm run build:prerender          vite build, then the above
+"""
+
+import argparse
+import gzip
+import json
+import re
+import time
+from html import escape
+from pathlib import Path
+
+from .incremental import BuildManifest, write_artifact
+from .loader import load_json
+from .paths import SPRECHEN_DIR, relpath
+
+DEFAULT_CATALOG = SPRECHEN_DIR / "dialogues-catalog.json"
+DEFAULT_OUT_DIR = SPRECHEN_DIR / "listing"
+TRAINER_ROUTE = "tests/sprechen/trainer"
+INDEX_ID = "catalog-index"
+
+CARD_CLASS = ("group bg-white/80 dark:bg-white/5 backdrop-blur-md rounded-2xl p-6 shadow-sm border border-purple-100 "
+              "dark:border-purple-500/20 hover:shadow-xl hover:-translate-y-2 hover:scale-105 transition-all "
+              "duration-300 cursor-pointer")
+BADGE_CLASS = ("bg-gradient-to-r from-purple-600 to-indigo-600 text-white w-12 h-12 rounded-xl flex items-center "
+               "justify-center font-bold text-lg shadow-lg")
+TAG_CLASS = ("inline-block px-3 py-1 bg-purple-100 dark:bg-purple-900/30 text-purple-700 dark:text-purple-300 "
+             "rounded-lg text-xs font-medium mb-3")
+TITLE_CLASS = "text-lg font-bold text-gray-900 dark:text-dark-text-primary mb-2 leading-snug"
+AUFGABE_CLASS = "text-sm text-gray-600 dark:text-dark-text-secondary line-clamp-2 mb-3"
+COUNT_CLASS = "flex items-center text-xs text-purple-600 dark:text-purple-400"
+THEME_CLASS = ("flex-shrink-0 px-5 py-2.5 rounded-xl font-medium whitespace-nowrap bg-white dark:bg-white/10 "
+               "text-purple-700 dark:text-purple-400 border border-purple-200 dark:border-purple-500/30")
+
+
+def theme_slug(theme):
+    """``"Reisen & Ausflüge"`` → ``"reisen-ausfluege"``."""
+    name = theme.lower().replace("ä", "ae").replace("ö", "oe").replace("ü", "ue").replace("ß", "ss")
+    return re.sub(r"[^a-z0-9]+", "-", name).strip("-")
+
+
+def group_by_theme(scenarios):
+    """``{theme: [scenario, ...]}``, themes sorted by name and scenarios by number."""
+    themes = {}
+    for scenario in scenarios:
+        themes.setdefault(scenario["theme"], []).append(scenario)
+    return {theme: sorted(themes[theme], key=lambda s: s["number"]) for theme in sorted(themes)}
+
+
+def catalog_index(groups):
+    """The critical index: only the fields the listing renders, scenarios by number."""
+    ordered = sorted((s for scenarios in groups.values() for s in scenarios), key=lambda s: s["number"])
+    return {
+        "meta": {"total_scenarios": len(ordered),
+                 "themes": {theme: len(scenarios) for theme, scenarios in groups.items()}},
+        "scenarios": [{"id": str(s["id"]), "number": s["number"], "title": s["title"], "theme": s["theme"],
+                       "aufgabe": s["aufgabe"], "leitpunkte_count": len(s.get("leitpunkte", []))}
+                      for s in ordered],
+    }
+
+
+def inline_json(document):
+    """JSON safe inside <script>: no "</script>" or "<!--" can close or confuse the element."""
+    text = json.dumps(document, ensure_ascii=False, separators=(",", ":"))
+    return text.replace("<", "\\u003c")
+
+
+def render_card(s):
+    count = len(s.get("leitpunkte", []))
+    return (
+        f'<a href="/{TRAINER_ROUTE}/{escape(str(s["id"]))}" class="{CARD_CLASS}">'
+        f'<div class="flex items-center justify-between mb-4"><div class="{BADGE_CLASS}">{s["number"]}</div></div>'
+        f'<div class="{TAG_CLASS}">{escape(s["theme"])}</div>'
+        f'<h3 class="{TITLE_CLASS}">{escape(s["title"])}</h3>'
+        f'<p class="{AUFGABE_CLASS}">{escape(s["aufgabe"])}</p>'
+        f'<div class="{COUNT_CLASS}"><span>{count} Diskussionspunkte</span></div>'
+        "</a>"
+    )
+
+
+def render_theme(theme, scenarios):
+    cards = "\n".join(render_card(s) for s in scenarios)
+    label = "Dialog" if len(scenarios) == 1 else "Dialoge"
+    return (
+        f'<section id="theme-{theme_slug(theme)}" data-theme="{escape(theme)}" class="mb-10">\n'
+        f'<h2 class="text-2xl font-bold text-gray-900 dark:text-dark-text-primary mb-6">{escape(theme)} '
+        f'<span class="text-sm font-medium text-gray-600 dark:text-dark-text-secondary">'
+        f'{len(scenarios)} {label}</span></h2>\n'
+        f'<div class="grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-3 gap-6">\n{cards}\n</div>\n'
+        "</section>\n"
+    )
+
+
+def render_script(groups):
+    return f'<script type="application/json" id="{INDEX_ID}">{inline_json(catalog_index(groups))}</script>\n'
+
+
+def render_listing(groups, sections):
+    nav = "".join(f'<a href="#theme-{theme_slug(theme)}" class="{THEME_CLASS}">{escape(theme)}</a>'
+                  for theme in groups)
+    return (
+        '<div class="max-w-7xl mx-auto px-4 py-6" data-prerendered="sprechen-catalog">\n'
+        f'<nav class="flex gap-3 overflow-x-auto mb-6" aria-label="Themen">{nav}</nav>\n'
+        + "".join(sections.values()) +
+        "</div>\n"
+    )
+
+
+def render_page(shell, script, listing):
+    """
+    The app shell with ``listing`` inside its (otherwise empty) #root. The
+    index script goes just before #root, where React's first render, which
+    replaces the listing, doesn't remove it.
+    """
+    page, found = re.subn(r'<div id="root">\s*</div>', lambda _: f'{script}<div id="root">\n{listing}</div>', shell,
+                          count=1)
+    if not found:
+        raise ValueError('no empty <div id="root"></div> in the page shell')
+    return page
+
+
+def build(catalog=DEFAULT_CATALOG, out_dir=DEFAULT_OUT_DIR, page=None, force=False, manifest=None):
+    """Write the fragments (and the page); returns ``(groups, {path: bytes}, files written)``."""
+    manifest = manifest or BuildManifest()
+    out_dir = Path(out_dir)
+    groups = group_by_theme(load_json(catalog)["scenarios"])
+    sections = {theme: render_theme(theme, scenarios) for theme, scenarios in groups.items()}
+    script, listing = render_script(groups), render_listing(groups, sections)
+
+    outputs = {out_dir / f"{theme_slug(theme)}.html": text for theme, text in sections.items()}
+    outputs[out_dir / "index.html"] = script + listing
+    if page:
+        page = Path(page)
+        outputs[page.parent / TRAINER_ROUTE / "index.html"] = render_page(page.read_text(encoding="utf-8"), script, listing)
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    written = 0
+    for path, text in outputs.items():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        written += write_artifact(manifest, path, text.encode("utf-8"), {}, force)
+
+    # Drop fragments of themes that are gone (only the ones we wrote ourselves)
+    prefix = relpath(out_dir) + "/"
+    live = {relpath(path) for path in outputs}
+    for artifact in [a for a in manifest.artifacts if a.startswith(prefix) and a not in live]:
+        stale = out_dir / artifact[len(prefix):]
+        if stale.exists():
+            stale.unlink()
+        manifest.forget(stale)
+    manifest.save()
+    return groups, {path: len(text.encode("utf-8")) for path, text in outputs.items()}, written
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--catalog", default=str(DEFAULT_CATALOG))
+    parser.add_argument("--out-dir", default=str(DEFAULT_OUT_DIR))
+    parser.add_argument("--page", help="built app shell (dist/index.html) to pre-render the trainer route into")
+    parser.add_argument("--force", action="store_true", help="rewrite every file even if unchanged")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    groups, sizes, written = build(args.catalog, args.out_dir, args.page, args.force)
+    elapsed = time.perf_counter() - start
+
+    index_path = Path(args.out_dir) / "index.html"
+    inlined = len(inline_json(catalog_index(groups)).encode("utf-8"))
+    catalog_bytes = Path(args.catalog).stat().st_size
+    print(f"✅ {sum(map(len, groups.values()))} scenarios in {len(groups)} themes rendered in "
+          f"{elapsed * 1000:.0f} ms ({written} of {len(sizes)} files written)")
+    compressed = len(gzip.compress(index_path.read_bytes()))
+    print(f"📦 {relpath(index_path)}: {sizes[index_path] / 1024:.1f} KB ({compressed / 1024:.1f} KB gzipped), "
+          f"inlined index {inlined / 1024:.1f} KB (dialogues-catalog.json {catalog_bytes / 1024:.1f} KB)")
+    print("\n📊 Scenarios by theme:")
+    for theme, scenarios in groups.items():
+        print(f"   - {theme}: {len(scenarios)} scenarios → {theme_slug(theme)}.html")
+    if args.page:
+        print(f"\n📝 {relpath(Path(args.page).parent / TRAINER_ROUTE / 'index.html')}")
+
+
+if __name__ == "__main__":
+    main()
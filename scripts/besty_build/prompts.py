@@ -0,0 +1,137 @@
+"""
+Precompiled per-scenario system prompts for the Sprechen tutor.
+
+The prompt text stays in one place, createSystemPrompt() in
+src/services/aiChatService.js. This stage reads that template literal and
+splits it into:
+
+* ``prefix``: everything that is the same for every scenario (role, B1
+  rules, Redemittel, conversation rules), emitted once
+* ``suffix`` per scenario: AUFGABE / THEMA / DISKUSSIONSPUNKTE followed by
+  the closing instruction
+
+so the system prompt is ``prefix + suffix[id]``. Putting all scenario
+specific text last keeps a long identical prefix across scenarios, which is
+what provider-side prompt caching keys on. Each entry carries an estimated
+token count and a content hash, so prompt size (latency, cost) can be
+budgeted per scenario.
+
+    python3 -m besty_build.prompts --budget 2500
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import re
+import sys
+
+from .incremental import BuildManifest, scenario_id, write_artifact
+from .loader import load_json
+from .paths import ROOT, SPRECHEN_DIR
+
+PROMPT_SOURCE = ROOT / "src" / "services" / "aiChatService.js"
+DEFAULT_OUTPUT = ROOT / "data" / "sprechen-system-prompts.json"
+
+SCENARIO_BLOCK_START = "AUFGABE:"
+CLOSING_INSTRUCTION = "Beginne jetzt die Konversation!"
+
+_TEMPLATE = re.compile(r"function createSystemPrompt\(aufgabe, leitpunkte, theme\) \{\s*return `(.*?)`;\s*\}", re.S)
+_TOKEN_PIECES = re.compile(r"\w+|[^\w\s]", re.U)
+
+
+def load_template(path=PROMPT_SOURCE):
+    with open(path, encoding="utf-8") as f:
+        match = _TEMPLATE.search(f.read())
+    if not match:
+        raise ValueError(f"createSystemPrompt() template not found in {path}")
+    return match.group(1)
+
+
+def split_template(template):
+    """``(prefix, closing)``: the template without its scenario block."""
+    start = template.index(SCENARIO_BLOCK_START)
+    end = template.index("\n", template.index("${leitpunkte", start))
+    prefix = template[:start].rstrip() + "\n\n" + template[end:].strip()
+    if "${" in prefix:
+        raise ValueError("createSystemPrompt() has placeholders outside the AUFGABE block")
+    closing = ""
+    if prefix.endswith(CLOSING_INSTRUCTION):
+        prefix = prefix[:-len(CLOSING_INSTRUCTION)].rstrip()
+        closing = CLOSING_INSTRUCTION
+    return prefix + "\n\n", closing
+
+
+def render_suffix(scenario, closing):
+    """Scenario block in the same wording createSystemPrompt() uses."""
+    leitpunkte = "\n".join(f"{i}. {punkt}" for i, punkt in enumerate(scenario["leitpunkte"], start=1))
+    block = (f"AUFGABE:\n{scenario['aufgabe']}\n\n"
+             f"THEMA: {scenario['theme']}\n\n"
+             f"DISKUSSIONSPUNKTE (alle systematisch abdecken):\n{leitpunkte}")
+    return f"{block}\n\n{closing}" if closing else block
+
+
+def estimate_tokens(text):
+    """
+    Rough BPE token estimate without a tokenizer: one token per punctuation
+    mark, about four characters per token for words (German compounds split
+    into several tokens).
+    """
+    return sum(math.ceil(len(piece) / 4) if piece[0].isalnum() else 1
+               for piece in _TOKEN_PIECES.findall(text))
+
+
+def sha256(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def compile_prompts(scenarios, template=None):
+    template = template or load_template()
+    prefix, closing = split_template(template)
+    prefix_tokens = estimate_tokens(prefix)
+    compiled = {}
+    for scenario in scenarios:
+        suffix = render_suffix(scenario, closing)
+        tokens = estimate_tokens(suffix)
+        compiled[scenario_id(scenario)] = {
+            "suffix": suffix,
+            "tokens": tokens,
+            "total_tokens": prefix_tokens + tokens,
+            "sha256": sha256(prefix + suffix),
+        }
+    return {
+        "prefix": {"text": prefix, "tokens": prefix_tokens, "sha256": sha256(prefix)},
+        "scenarios": compiled,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--input", default=str(SPRECHEN_DIR / "dialogues-catalog.json"))
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT))
+    parser.add_argument("--budget", type=int, help="fail if any system prompt is estimated above N tokens")
+    args = parser.parse_args()
+
+    scenarios = load_json(args.input)["scenarios"]
+    prompts = compile_prompts(scenarios)
+
+    data = json.dumps(prompts, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    manifest = BuildManifest()
+    written = write_artifact(manifest, args.output, data, {})
+    manifest.save()
+
+    totals = sorted(((p["total_tokens"], sid) for sid, p in prompts["scenarios"].items()), reverse=True)
+    print(f"🧠 {len(totals)} system prompts, shared prefix ≈ {prompts['prefix']['tokens']} tokens")
+    print(f"   largest: scenario {totals[0][1]} ≈ {totals[0][0]} tokens, smallest ≈ {totals[-1][0]} tokens")
+    print(f"📝 {'Saved' if written else 'Unchanged'}: {args.output} ({len(data)} bytes)")
+
+    if args.budget:
+        over = [(tokens, sid) for tokens, sid in totals if tokens > args.budget]
+        for tokens, sid in over:
+            print(f"❌ Scenario {sid}: ≈ {tokens} tokens > budget {args.budget}")
+        if over:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+"""
+Ingestion of the Klett quiz HTML files into public/data/themes/.
+
+Python counterpart of scripts/parse-quiz-html.js with the same output
+(byte-identical theme files and index.json). Each of the 20 quiz pages is
+~500 KB, almost all of it the same embedded jQuery runtime, styles and a
+base64 PNG; the questions are one ``var questions = [...]`` array near the
+end. Instead of running a regex over the whole page, every file is
+memory-mapped, the marker is found with mmap.find() and only the array
+itself is decoded and parsed.
+
+Files are parsed in parallel (--jobs), and a file whose size and mtime (or
+else content hash) are unchanged since the last run is not parsed again:
+its theme JSON comes from the build cache, the same way catalog fragments do
+(see incremental.py).
+
+The report shows how much of the HTML is the questions payload and how many
+bytes are runtime blocks repeated verbatim in every file. The app only
+fetches the theme JSON, so the HTML pages are all droppable from public/.
+
+    python3 -m besty_build.quiz --jobs 4
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import re
+import time
+from pathlib import Path
+
+from .incremental import BuildManifest, content_hash, write_artifact
+from .parallel import ordered_map
+from .paths import DATA_DIR, relpath
+
+QUIZ_DIR = DATA_DIR / "dtz" / "Britta Weber et al - Mit Erfolg zum Deutsch-Test für Zuwanderer - 2023 Quiz"
+OUTPUT_DIR = DATA_DIR / "themes"
+FILE_PREFIX = "676863_MEzDTZ_Quiz_"
+
+QUESTIONS_MARKER = b"var questions = "
+ARRAY_END = b"];"
+# Blocks that make up the embedded runtime: (start marker, end marker)
+_BLOCKS = ((b"<script", b"</script>"), (b"<style", b"</style>"))
+_BASE64_START = b";base64,"
+_BASE64_BODY = re.compile(rb"[A-Za-z0-9+/=]*")
+
+
+class QuizFormatError(ValueError):
+    """A quiz page without a parseable questions array."""
+
+
+def find_questions(buf):
+    """
+    ``(start, end, questions)`` for the questions array in ``buf`` (bytes or
+    mmap). Tries each ``];`` after the marker in turn, so one inside a
+    question string doesn't cut the array short.
+    """
+    marker = buf.find(QUESTIONS_MARKER)
+    if marker < 0:
+        raise QuizFormatError("no 'var questions = ' in file")
+    start = marker + len(QUESTIONS_MARKER)
+    end = buf.find(ARRAY_END, start)
+    while end >= 0:
+        try:
+            return start, end + 1, json.loads(bytes(buf[start:end + 1]).decode("utf-8"))
+        except ValueError:
+            end = buf.find(ARRAY_END, end + 1)
+    raise QuizFormatError("questions array is not valid JSON")
+
+
+def runtime_blocks(buf):
+    """
+    ``[(sha1, length)]`` of the script/style blocks and base64 payloads in
+    ``buf``, scanned left to right so nested markers (a "<style" string in
+    a script, base64 inside a style) are not counted twice.
+    """
+    markers = [open_tag for open_tag, _ in _BLOCKS] + [_BASE64_START]
+    closers = dict(_BLOCKS)
+    upcoming = {marker: buf.find(marker) for marker in markers}
+    blocks = []
+    pos = 0
+    while True:
+        for marker, found in upcoming.items():
+            if 0 <= found < pos:
+                upcoming[marker] = buf.find(marker, pos)
+        found = [(at, marker) for marker, at in upcoming.items() if at >= 0]
+        if not found:
+            return blocks
+        start, marker = min(found)
+        if marker == _BASE64_START:
+            body = _BASE64_BODY.match(buf, start + len(marker))
+            start, end = body.start(), body.end()
+        else:
+            end = buf.find(closers[marker], start)
+            end = len(buf) if end < 0 else end + len(closers[marker])
+        blocks.append((hashlib.sha1(buf[start:end]).hexdigest(), end - start))
+        pos = max(end, start + 1)
+
+
+def theme_info(filename):
+    """``(id, name)`` from a quiz file name, exactly like getThemeInfo() in parse-quiz-html.js."""
+    name = (filename.replace(FILE_PREFIX, "", 1).replace(".html", "", 1)
+            .replace("ae", "ä").replace("oe", "ö").replace("ue", "ü"))
+    theme_id = (name.lower().replace("ä", "ae").replace("ö", "oe").replace("ü", "ue")
+                .replace("ß", "ss").replace(" ", "-"))
+    return theme_id, name
+
+
+def convert(filename, raw_questions):
+    theme_id, name = theme_info(filename)
+    questions = [{
+        "id": i,
+        "type": "fill-in-blank",
+        "question": q["Q"],
+        "options": q["C"],
+        "correctAnswer": q["A"] - 1,  # 1-based in the quiz pages
+    } for i, q in enumerate(raw_questions, start=1)]
+    return {
+        "id": theme_id,
+        "name": name,
+        "description": f"Wortschatz und Grammatik zum Thema: {name}",
+        "questionCount": len(questions),
+        "questions": questions,
+    }
+
+
+def ingest_file(path):
+    """``(theme_json_text, summary)`` for one quiz page; runs in a worker."""
+    path = Path(path)
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        start, end, raw_questions = find_questions(buf)
+        blocks = runtime_blocks(buf)
+        size = len(buf)
+    theme = convert(path.name, raw_questions)
+    summary = {
+        "index": {"id": theme["id"], "name": theme["name"], "questionCount": theme["questionCount"]},
+        "size": size,
+        "questions_bytes": end - start,
+        "blocks": blocks,
+    }
+    return json.dumps(theme, ensure_ascii=False, indent=2), summary
+
+
+def file_digest(path):
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        return hashlib.sha256(buf).hexdigest()
+
+
+def quiz_files(quiz_dir=QUIZ_DIR):
+    return sorted(p for p in Path(quiz_dir).iterdir() if p.name.startswith(FILE_PREFIX) and p.name.endswith(".html"))
+
+
+class IngestResult:
+    def __init__(self, summaries, parsed, written):
+        self.summaries = summaries
+        self.parsed = parsed
+        self.written = written
+
+
+def ingest(quiz_dir=QUIZ_DIR, output_dir=OUTPUT_DIR, jobs=1, force=False, manifest=None):
+    """Write one theme file per quiz page plus index.json; unchanged pages are not parsed."""
+    manifest = manifest or BuildManifest()
+    recipe = content_hash("quiz", Path(__file__).read_text(encoding="utf-8"))
+    paths = quiz_files(quiz_dir)
+
+    keys, records, missing = [], [], []
+    for path in paths:
+        digest = manifest.stat_digest(path) or file_digest(path)
+        manifest.record(path, digest, {})
+        key = content_hash(recipe, digest)
+        keys.append(key)
+        records.append(None if force else manifest.get_fragment(key))
+        if records[-1] is None:
+            missing.append(path)
+
+    parsed = iter(ordered_map(ingest_file, missing, jobs))
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    summaries, written = [], 0
+    for key, record in zip(keys, records):
+        if record is None:
+            text, summary = next(parsed)
+            manifest.put_fragment(key, text, summary)
+            record = {"text": text, "summary": summary}
+        summary = record["summary"]
+        summaries.append(summary)
+        theme_id = summary["index"]["id"]
+        written += write_artifact(manifest, output_dir / f"{theme_id}.json", record["text"].encode("utf-8"),
+                                  {theme_id: key}, force)
+
+    index = json.dumps({"themes": [s["index"] for s in summaries]}, ensure_ascii=False, indent=2)
+    written += write_artifact(manifest, output_dir / "index.json", index.encode("utf-8"), {}, force, publish=True)
+    manifest.save()
+    return IngestResult(summaries, len(missing), written)
+
+
+def payload_report(summaries):
+    """Byte counts: total HTML, questions payload, and runtime blocks found in every file."""
+    total = sum(s["size"] for s in summaries)
+    questions = sum(s["questions_bytes"] for s in summaries)
+    seen = {}
+    for s in summaries:
+        for digest, length in {tuple(block) for block in s["blocks"]}:
+            count, _ = seen.get(digest, (0, length))
+            seen[digest] = (count + 1, length)
+    shared = [length for count, length in seen.values() if count == len(summaries)]
+    return {
+        "files": len(summaries),
+        "html_bytes": total,
+        "questions_bytes": questions,
+        "shared_block_bytes": sum(shared) * len(summaries),
+        "shared_block_bytes_once": sum(shared),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--input-dir", default=str(QUIZ_DIR))
+    parser.add_argument("--output-dir", default=str(OUTPUT_DIR))
+    parser.add_argument("--jobs", type=int, default=1, metavar="N", help="parse with N processes (0 = one per CPU)")
+    parser.add_argument("--force", action="store_true", help="parse every file even if unchanged")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    result = ingest(args.input_dir, args.output_dir, jobs=args.jobs, force=args.force)
+    elapsed = time.perf_counter() - start
+    questions = sum(s["index"]["questionCount"] for s in result.summaries)
+    print(f"✅ {len(result.summaries)} themes, {questions} questions in {elapsed * 1000:.0f} ms "
+          f"({result.parsed} parsed, {len(result.summaries) - result.parsed} unchanged)")
+    print(f"📝 {relpath(args.output_dir)}: {result.written} file(s) written")
+
+    report = payload_report(result.summaries)
+    html, payload = report["html_bytes"], report["questions_bytes"]
+    print(f"\n📦 {report['files']} quiz pages: {html / 1e6:.1f} MB of HTML, "
+          f"{payload / 1e3:.0f} KB of it questions ({payload / html:.1%})")
+    print(f"   runtime/styles/images repeated in every page: {report['shared_block_bytes'] / 1e6:.1f} MB "
+          f"({report['shared_block_bytes_once'] / 1e3:.0f} KB per copy)")
+    print(f"   droppable from public/: {html / 1e6:.1f} MB (the app only fetches {relpath(args.output_dir)}/*.json)")
+
+
+if __name__ == "__main__":
+    main()
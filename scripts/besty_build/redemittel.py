@@ -0,0 +1,192 @@
+"""
+Compiled Redemittel templates for scenario-specific answer choices.
+
+public/data/sprechen/redemittel.json holds phrase templates with slots
+("Wie wäre es, wenn wir {activity}?"). RedemittelEngine compiles every
+template once into a list of literal/slot parts, derives slot values from
+a scenario's Leitpunkte and fills the templates into the four catalog
+choice kinds:
+
+    positive    vorschlag_annehmen + meinung_äußern
+    negative    vorschlag_ablehnen (with an alternative)
+    question    the Leitpunkt + nachfragen
+    suggestion  vorschlag_machen
+
+Slot values are infinitive phrases ("die Kosten teilen"). Each slot is
+rendered in the word order its position in the template needs:
+"... wenn {alternative}" gets a subordinate clause ("wir die Kosten
+teilen"), "Meiner Meinung nach {opinion}" gets verb-second order
+("sollten wir die Kosten teilen").
+
+Variants are enumerated lazily and deduplicated, so a caller takes only
+as many as it needs.
+"""
+
+import hashlib
+import inspect
+import itertools
+import re
+import string
+import sys
+
+from .loader import load_json
+from .paths import SPRECHEN_DIR
+
+REDEMITTEL_PATH = SPRECHEN_DIR / "redemittel.json"
+
+# Infinitive phrases for common Leitpunkt topics, matched against the
+# lowercased Leitpunkt. The first phrase is the suggestion, the second the
+# alternative offered when a proposal is turned down.
+TOPIC_PHRASES = [
+    (("wie viele", "wer kommt", "gäste", "teilnehmer"), ("nur die engsten Freunde einladen", "alle aus dem Kurs einladen")),
+    (("geschenk",), ("einen Gutschein kaufen", "etwas Persönliches basteln")),
+    (("material", "bücher", "informationen"), ("in der Bibliothek Material suchen", "im Internet recherchieren")),
+    (("übernachtung", "unterkunft", "hotel"), ("eine Jugendherberge buchen", "eine Ferienwohnung mieten")),
+    (("essen", "trinken", "getränk", "kochen", "buffet"), ("ein Buffet machen, und jeder bringt etwas mit", "zusammen kochen")),
+    (("bezahl", "kosten", "geld", "teuer", "preis"), ("die Kosten durch alle teilen", "vorher einen festen Betrag sammeln")),
+    (("verkehrsmittel", "anreise"), ("mit dem Zug fahren", "Fahrgemeinschaften bilden")),
+    (("einladung", "einladen", "informieren"), ("die Einladungen per WhatsApp schicken", "Karten schreiben und verteilen")),
+    (("musik", "unterhaltung", "programm", "spiele", "dekoration"), ("eine Playlist zusammenstellen", "ein paar Spiele vorbereiten")),
+    # Plain question words last, so a topic in the same Leitpunkt wins
+    (("wohin",), ("an den See fahren", "in die Berge fahren")),
+    (("wie lange",), ("den ganzen Tag bleiben", "nur bis zum Nachmittag bleiben")),
+    (("wie oft",), ("uns zweimal pro Woche treffen", "uns einmal pro Woche treffen")),
+    (("wann",), ("uns am Samstagnachmittag treffen", "das auf Sonntag verschieben")),
+    (("wo?", "wo ", "wo/"), ("das bei mir zu Hause machen", "einen Raum im Gemeinschaftshaus mieten")),
+    (("wer ",), ("die Aufgaben fair aufteilen", "eine Liste machen und uns eintragen")),
+]
+
+_LEADING_LOWERCASE = {"mit", "beim", "bei", "zu", "zum", "zur", "die", "der", "das", "den", "dem",
+                      "ein", "eine", "einen", "im", "in", "am", "an", "auf", "für", "nach", "vor",
+                      "andere", "alle", "neue"}
+_QUESTION_WORDS = {"was", "wer", "wen", "wem", "wie", "wo", "wann", "wohin", "welche", "welches", "welcher"}
+_INFINITIVE = re.compile(r"^[^\W\d]*(?:en|ern|eln)$")
+
+
+class Slot:
+    """One slot value in the three word orders a template can ask for."""
+
+    __slots__ = ("main", "clause", "inverted")
+
+    def __init__(self, main, clause, inverted):
+        self.main = main  # "wir sollten {x}" / "lieber {x}"
+        self.clause = clause  # "..., dass {x}." (verb last)
+        self.inverted = inverted  # "Meiner Meinung nach {x}." (verb second)
+
+
+def activity_slot(phrase):
+    return Slot(phrase, f"wir {phrase}", phrase)
+
+
+def opinion_slot(phrase):
+    return Slot(f"wir sollten {phrase}", f"wir {phrase} sollten", f"sollten wir {phrase}")
+
+
+def reason_slot(phrase):
+    return Slot(f"wir müssen {phrase}", f"wir {phrase} müssen", f"müssen wir {phrase}")
+
+
+def _form(literal):
+    literal = literal.rstrip().lower()
+    if literal.endswith(("dass", "wenn", "ob", "weil")):
+        return "clause"
+    if literal.endswith("nach"):
+        return "inverted"
+    return "main"
+
+
+class Template:
+    """A Redemittel phrase parsed once into literal and slot parts."""
+
+    __slots__ = ("text", "parts", "fields")
+
+    def __init__(self, text):
+        self.text = text
+        self.parts = []
+        for literal, field, _, _ in string.Formatter().parse(text):
+            if literal:
+                self.parts.append((literal, None))
+            if field is not None:
+                self.parts.append((field, _form(literal or "")))
+        self.fields = frozenset(part for part, form in self.parts if form is not None)
+
+    def render(self, slots):
+        """Fill the template; ``slots`` maps field names to Slot objects."""
+        return "".join(part if form is None else getattr(slots[part], form) for part, form in self.parts)
+
+
+class RedemittelEngine:
+    def __init__(self, data=None):
+        data = data if data is not None else load_json(REDEMITTEL_PATH)
+        self.categories = {category: [Template(text) for text in phrases]
+                           for section in data.values() for category, phrases in section.items()}
+        canonical = repr(sorted((c, [t.text for t in ts]) for c, ts in self.categories.items()))
+        # Source of this module + the phrases: changes invalidate cached expansions
+        self.fingerprint = hashlib.sha256(
+            (canonical + inspect.getsource(sys.modules[__name__])).encode("utf-8")).hexdigest()
+
+    def templates(self, category, slots):
+        """Templates of ``category`` whose fields are all available in ``slots``."""
+        return [t for t in self.categories.get(category, []) if t.fields <= slots.keys()]
+
+    def iter_choice_sets(self, leitpunkt, rotation=0):
+        """
+        Lazily yield distinct ``{positive, negative, question, suggestion}``
+        dicts for one Leitpunkt. ``rotation`` shifts the starting templates
+        so neighbouring scenarios don't all open with the same phrase.
+        """
+        suggestion, alternative = slot_phrases(leitpunkt)
+        slots = {
+            "activity": activity_slot(suggestion),
+            "alternative": activity_slot(alternative),
+            "opinion": opinion_slot(suggestion),
+            "reason": reason_slot(alternative),
+        }
+        question = leitpunkt.strip()
+        if not question.endswith("?"):
+            question += "?"
+
+        def rotated(category):
+            options = self.templates(category, slots)
+            shift = rotation % len(options) if options else 0
+            return options[shift:] + options[:shift]
+
+        combos = itertools.product(
+            rotated("vorschlag_machen"), rotated("vorschlag_ablehnen"),
+            rotated("vorschlag_annehmen"), rotated("meinung_äußern"), rotated("nachfragen"),
+        )
+        seen = set()
+        for machen, ablehnen, annehmen, meinung, nachfragen in combos:
+            choice_set = {
+                "positive": f"{annehmen.render(slots)} {meinung.render(slots)}",
+                "negative": ablehnen.render(slots),
+                "question": f"{question} {nachfragen.render(slots)}",
+                "suggestion": machen.render(slots),
+            }
+            key = tuple(choice_set.values())
+            if key not in seen:
+                seen.add(key)
+                yield choice_set
+
+    def choices(self, leitpunkt, rotation=0):
+        """First choice set for ``leitpunkt`` (what the generators use)."""
+        return next(self.iter_choice_sets(leitpunkt, rotation))
+
+
+def slot_phrases(leitpunkt):
+    """``(suggestion, alternative)`` infinitive phrases for a Leitpunkt."""
+    text = leitpunkt.strip().rstrip("?").strip()
+    words = text.replace(":", " ").split()
+    is_question = any(word.lower() in _QUESTION_WORDS for word in words)
+    if len(words) >= 2 and not is_question and _INFINITIVE.match(words[-1]) and words[-1].islower():
+        # Already an action: "Nachbarn einladen?", "Mit dem Nachbarn reden?"
+        if words[0].lower() in _LEADING_LOWERCASE:
+            words[0] = words[0].lower()
+        phrase = " ".join(words)
+        return phrase, f"erst noch einmal darüber sprechen, ob wir {phrase}"
+    lowered = text.lower() + "?"
+    for keywords, phrases in TOPIC_PHRASES:
+        if any(keyword in lowered for keyword in keywords):
+            return phrases
+    topic = text.split(":")[0].strip()
+    return f"zuerst über „{topic}“ sprechen", f"„{topic}“ später besprechen"
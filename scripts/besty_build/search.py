@@ -0,0 +1,339 @@
+"""
+Full-text search index over the Sprechen scenarios.
+
+Builds a static inverted index (public/data/sprechen/search-index.json) over
+title, theme, aufgabe, Leitpunkte and dialogue text of every catalog
+scenario, so the catalog page can search without a server:
+
+    {
+      "format": "besty-search/1",
+      "fields": ["title", "theme", "aufgabe", "leitpunkte", "dialogue"],
+      "docs": [{"id": "1", "title": "...", "theme": "...", "fields": [0, 6, 10, 31, 45]}],
+      "idf": {"hausfest": 3.4, ...},
+      "postings": {"hausfest": [[0, 0, 17], [12, 3]], ...}   # [doc, position, ...]
+    }
+
+``fields`` of a doc holds the position where each field starts, so a
+position tells which field a hit is in (title hits count more).
+
+German normalization: lowercase, ä/ö/ü folded to a/o/u and ß to ss (so
+"Gaste", "Gäste" and "GÄSTE" match), stopwords dropped and a light suffix
+stemmer (after CISTEM) so "Einladungen" finds "Einladung". Positions are
+kept across stopwords, which makes "phrase queries" work.
+
+``--query`` searches the written index and builds it only when it is
+missing or older than its inputs; a lookup doesn't rewrite build outputs.
+
+    python3 -m besty_build.search                      # build the index
+    python3 -m besty_build.search --query "Essen Gäste"
+"""
+
+import argparse
+import bisect
+import heapq
+import json
+import math
+import os
+import re
+import unicodedata
+
+from .incremental import BuildManifest, scenario_id, write_artifact
+from .loader import Document, iter_documents, load_json
+from .paths import SPRECHEN_DIR, relpath
+
+FORMAT = "besty-search/1"
+DEFAULT_INPUT = SPRECHEN_DIR / "dialogues-catalog.json"
+DEFAULT_OUTPUT = SPRECHEN_DIR / "search-index.json"
+EXTRA_DIALOGUES = SPRECHEN_DIR / "dialogues.json"
+
+FIELDS = ("title", "theme", "aufgabe", "leitpunkte", "dialogue")
+FIELD_WEIGHTS = (3.0, 1.5, 1.0, 2.0, 0.5)
+K1 = 1.2
+
+# Already folded (see fold())
+STOPWORDS = frozenset("""
+    aber als am an auch auf aus bei bin bis da das dass dem den der des die du
+    ein eine einem einen einer eines er es fur hat ich ihr ihre im in ist ja
+    mit nicht noch oder sich sie sind so uber um und uns von vor war was wie
+    wir zu zum zur
+""".split())
+
+_FOLD = str.maketrans({"ä": "a", "ö": "o", "ü": "u", "ß": "ss"})
+_WORD = re.compile(r"\w+")
+_PHRASE = re.compile(r'"([^"]*)"')
+# Keys whose strings are dialogue text, in the expanded catalog (dialogue)
+# and in dialogues.json (greeting, dialogueFlow)
+_DIALOGUE_KEYS = ("dialogue", "greeting", "closing", "dialogueFlow")
+
+
+def fold(text):
+    """Lowercase, fold umlauts/ß and strip any other accents."""
+    text = text.lower().translate(_FOLD)
+    if text.isascii():
+        return text
+    return "".join(c for c in unicodedata.normalize("NFKD", text) if not unicodedata.combining(c))
+
+
+def stem(word):
+    """
+    Light German suffix stemmer on a folded word, after CISTEM's suffix
+    rules without the ge- prefix and -t removal (those merged "Gast" with
+    "Gas" and "Geburtstag" with "burtstag" on the catalog vocabulary).
+    """
+    while len(word) > 3:
+        if len(word) > 5 and word[-2:] in ("em", "er", "nd"):
+            word = word[:-2]
+        elif word[-1] in "ens":
+            word = word[:-1]
+        else:
+            break
+    return word
+
+
+def tokenize(text):
+    """``[(offset, term)]``: offsets count every word, stopwords included."""
+    return [(i, stem(word)) for i, word in enumerate(_WORD.findall(fold(text))) if word not in STOPWORDS]
+
+
+def _strings(value):
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _strings(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _strings(item)
+
+
+def field_texts(scenario):
+    """Texts of each field in FIELDS order; each field is a list of strings."""
+    return [
+        [scenario.get("title", "")],
+        [scenario.get("theme", "")],
+        [scenario.get("aufgabe", "")],
+        list(scenario.get("leitpunkte", [])),
+        [text for key in _DIALOGUE_KEYS for text in _strings(scenario.get(key))],
+    ]
+
+
+def build_index(scenarios):
+    docs = []
+    postings = {}
+    for doc, scenario in enumerate(scenarios):
+        position = 0
+        starts = []
+        for texts in field_texts(scenario):
+            starts.append(position)
+            for text in texts:
+                words = 0
+                for offset, term in tokenize(text):
+                    hits = postings.setdefault(term, [])
+                    if not hits or hits[-1][0] != doc:
+                        hits.append([doc])
+                    hits[-1].append(position + offset)
+                    words = offset + 1
+                position += words + 1  # gap: phrases never span two strings
+        docs.append({"id": scenario_id(scenario), "title": scenario.get("title", ""),
+                     "theme": scenario.get("theme", ""), "fields": starts})
+
+    count = len(docs)
+    idf = {term: round(math.log(1 + (count - len(hits) + 0.5) / (len(hits) + 0.5)), 3)
+           for term, hits in postings.items()}
+    return {
+        "format": FORMAT,
+        "fields": list(FIELDS),
+        "docs": docs,
+        "idf": dict(sorted(idf.items())),
+        "postings": dict(sorted(postings.items())),
+    }
+
+
+def with_dialogues(scenarios, extra):
+    """Scenarios with dialogue text from ``extra`` documents merged in by id."""
+    by_id = {}
+    for document in extra:
+        if "id" in document or "number" in document:
+            by_id[scenario_id(document)] = document
+    merged = []
+    for scenario in scenarios:
+        other = by_id.get(scenario_id(scenario))
+        if other:
+            scenario = dict(scenario, **{key: other[key] for key in _DIALOGUE_KEYS
+                                         if key in other and key not in scenario})
+        merged.append(scenario)
+    return merged
+
+
+class SearchIndex:
+    """Query side of the index. Loading does the per-term scoring up front."""
+
+    def __init__(self, data):
+        if data.get("format") != FORMAT:
+            raise ValueError(f"not a {FORMAT} document")
+        self.docs = data["docs"]
+        self.idf = data["idf"]
+        self.terms = sorted(data["postings"])
+        self._starts = [doc["fields"] for doc in self.docs]
+        # term -> {doc: (score, positions)}
+        self.postings = {term: self._score(term, hits) for term, hits in data["postings"].items()}
+        self._ranked = {}
+
+    @classmethod
+    def load(cls, path=DEFAULT_OUTPUT):
+        return cls(load_json(path))
+
+    def _score(self, term, hits):
+        idf = self.idf[term]
+        scored = {}
+        for doc, *positions in hits:
+            starts = self._starts[doc]
+            tf = sum(FIELD_WEIGHTS[bisect.bisect_right(starts, p) - 1] for p in positions)
+            scored[doc] = (idf * tf * (K1 + 1) / (tf + K1), positions)
+        return scored
+
+    def _expand(self, term):
+        """Index terms starting with ``term`` (type-ahead on the last word)."""
+        start = bisect.bisect_left(self.terms, term)
+        end = bisect.bisect_left(self.terms, term + "￿", start)
+        return self.terms[start:end]
+
+    def _prefix_postings(self, term):
+        return _Union([self.postings[match] for match in self._expand(term)])
+
+    def search(self, query, limit=10, prefix=False):
+        """
+        ``[(score, doc)]`` for docs containing every query term, best first.
+        Quoted parts must occur as a phrase; with ``prefix`` the last word
+        also matches longer terms.
+        """
+        phrases = [phrase for phrase in map(tokenize, _PHRASE.findall(query)) if phrase]
+        words = tokenize(_PHRASE.sub(" ", query))
+        terms = [term for _, term in words] + [term for phrase in phrases for _, term in phrase]
+        if not terms:
+            return []
+
+        lists = []
+        for i, term in enumerate(terms):
+            if prefix and i == len(words) - 1 and not query.rstrip().endswith('"'):
+                lists.append(self._prefix_postings(term))
+            else:
+                lists.append(self.postings.get(term, {}))
+        if len(lists) == 1 and not phrases and not prefix:
+            return self._top(terms[0], limit)
+
+        # Walk the rarest term, look the others up
+        lists.sort(key=len)
+        candidates = []
+        for doc, (score, _) in lists[0].items():
+            for other in lists[1:]:
+                hit = other.get(doc)
+                if hit is None:
+                    break
+                score += hit[0]
+            else:
+                candidates.append((-score, doc))
+        if not phrases:
+            return [(-score, self.docs[doc]) for score, doc in heapq.nsmallest(limit, candidates)]
+
+        # Phrase checks are the expensive part: do them best-first, only until ``limit`` pass
+        heapq.heapify(candidates)
+        results = []
+        while candidates and len(results) < limit:
+            score, doc = heapq.heappop(candidates)
+            if all(self._has_phrase(doc, phrase) for phrase in phrases):
+                results.append((-score, self.docs[doc]))
+        return results
+
+    def _top(self, term, limit):
+        ranked = self._ranked.get(term)
+        if ranked is None:
+            ranked = sorted(((score, doc) for doc, (score, _) in self.postings.get(term, {}).items()), reverse=True)
+            self._ranked[term] = ranked
+        return [(score, self.docs[doc]) for score, doc in ranked[:limit]]
+
+    def _has_phrase(self, doc, phrase):
+        first_offset, first = phrase[0]
+        starts = self.postings.get(first, {}).get(doc, (0, ()))[1]
+        rest = [(offset - first_offset, set(self.postings.get(term, {}).get(doc, (0, ()))[1]))
+                for offset, term in phrase[1:]]
+        return any(all(start + shift in positions for shift, positions in rest) for start in starts)
+
+
+class _Union:
+    """Postings of several terms seen as one (best score per doc), merged lazily."""
+
+    def __init__(self, postings):
+        self.postings = postings
+
+    def __len__(self):
+        return sum(len(p) for p in self.postings)
+
+    def get(self, doc):
+        hits = [hit for hit in (p.get(doc) for p in self.postings) if hit is not None]
+        return max(hits, key=lambda hit: hit[0]) if hits else None
+
+    def items(self):
+        merged = {}
+        for postings in self.postings:
+            for doc, hit in postings.items():
+                if doc not in merged or merged[doc][0] < hit[0]:
+                    merged[doc] = hit
+        return merged.items()
+
+
+def load_extra_dialogues(path=EXTRA_DIALOGUES):
+    """Every dialogue document in dialogues.json (it holds several)."""
+    if not path.exists():
+        return []
+    return [item.value for item in iter_documents(path)
+            if isinstance(item, Document) and isinstance(item.value, dict)]
+
+
+def build(input_path=DEFAULT_INPUT, output=DEFAULT_OUTPUT, manifest=None):
+    """Build and write the index; returns ``(index, data, written)``."""
+    manifest = manifest or BuildManifest()
+    scenarios = with_dialogues(load_json(input_path)["scenarios"], load_extra_dialogues())
+    index = build_index(scenarios)
+    data = json.dumps(index, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    written = write_artifact(manifest, output, data, {}, publish=True)
+    manifest.save()
+    return index, data, written
+
+
+def written_index(output=DEFAULT_OUTPUT, inputs=(DEFAULT_INPUT, EXTRA_DIALOGUES)):
+    """The index in ``output``, or None when it is missing, unreadable or older than one of ``inputs``."""
+    try:
+        built = os.stat(output).st_mtime_ns
+        with open(output, encoding="utf-8") as f:
+            index = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+    newest = max((os.stat(path).st_mtime_ns for path in inputs if os.path.exists(path)), default=0)
+    if newest > built or index.get("format") != FORMAT:
+        return None
+    return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--input", default=str(DEFAULT_INPUT))
+    parser.add_argument("--output", default=str(DEFAULT_OUTPUT))
+    parser.add_argument("--query", help="search the written index (built first only if missing or stale)")
+    args = parser.parse_args()
+
+    index = written_index(args.output, (args.input, EXTRA_DIALOGUES)) if args.query else None
+    if index is None:
+        index, data, written = build(args.input, args.output)
+        if args.query and not written:
+            os.utime(args.output)  # same bytes from newer inputs: current, so the next --query won't rebuild
+        print(f"🔎 {len(index['docs'])} scenarios, {len(index['postings'])} terms")
+        print(f"📝 {'Saved' if written else 'Unchanged'}: {relpath(args.output)} ({len(data)} bytes)")
+
+    if args.query:
+        for score, doc in SearchIndex(index).search(args.query, prefix=True):
+            print(f"   {score:6.2f}  {doc['id']:>3}  {doc['title']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Sharded catalog output.
+
+Instead of one dialogues-catalog.json that every page downloads in full,
+the generators can emit
+
+    <out_dir>/index.json                   meta + {id, number, title, theme, leitpunkte_count, shard}
+    <out_dir>/scenarios/<id>.<hash>.json   one file per scenario (aufgabe, steps, choices, ...)
+
+so the menu payload stays the same size however large the dialogues get.
+Shards go through the same fragment cache as the monolithic catalog
+(see incremental.py): unchanged scenarios are not re-serialized and
+unchanged shard files are not rewritten.
+
+Shard names carry their content hash (store.hashed_name), and each index
+entry's ``shard`` is the file's path relative to the index, so shards are
+served immutable (vercel.json) and a client finds them only through the
+index. Shards the previous index pointed to are kept for one more build,
+for clients that still hold it (the published index keeps its previous
+hashed copy the same way).
+
+The shared index the app and the precache manifest read,
+sprechen/catalog/, is the live dialogues-catalog.json sharded; only this
+module's own command writes it. The generators stage theirs in their own
+directories (see output.py), as they stage their monolithic files.
+
+    python3 -m besty_build.shards
+    python3 -m besty_build.shards --catalog /tmp/catalog.json --shard-dir /tmp/catalog
+"""
+
+import argparse
+import hashlib
+import json
+from pathlib import Path
+
+from .incremental import BuildManifest, BuildResult, expand_fragments, write_artifact
+from .loader import load_json
+from .paths import SPRECHEN_DIR, relpath
+from .store import hashed_name
+
+DEFAULT_SHARD_DIR = SPRECHEN_DIR / "catalog"
+LIVE_CATALOG = SPRECHEN_DIR / "dialogues-catalog.json"
+
+
+def shard_path(out_dir, scenario_id, data):
+    """``<out_dir>/scenarios/<id>.<hash>.json`` for shard contents ``data`` (bytes)."""
+    return hashed_name(out_dir / "scenarios" / f"{scenario_id}.json", hashlib.sha256(data).hexdigest())
+
+
+def indexed_shards(out_dir):
+    """Relative paths of the shards the current index.json in ``out_dir`` points to."""
+    try:
+        index = json.loads((out_dir / "index.json").read_text(encoding="utf-8"))
+        return {entry["shard"] for entry in index["scenarios"] if "shard" in entry}
+    except (FileNotFoundError, ValueError, KeyError, TypeError):
+        return set()
+
+
+def build_index(meta, summaries):
+    """The index document: catalog meta plus one summary per scenario."""
+    return {
+        "meta": dict(meta, total_scenarios=len(summaries)),
+        "scenarios": summaries,
+    }
+
+
+def build_shards(meta, sources, out_dir=DEFAULT_SHARD_DIR, expand=None, recipe=None, force=False, manifest=None, jobs=1,
+                 publish=True):
+    """
+    Write index.json plus one file per scenario into ``out_dir``.
+
+    Shards that neither this index nor the previous one points to (deleted
+    scenarios, older versions) are removed. ``publish`` also keeps a
+    content-hashed copy of the index (see store.py).
+    """
+    manifest = manifest or BuildManifest()
+    fragments = expand_fragments(sources, manifest, expand=expand, recipe=recipe, force=force, jobs=jobs)
+
+    (out_dir / "scenarios").mkdir(parents=True, exist_ok=True)
+    previous = {relpath(out_dir / shard) for shard in indexed_shards(out_dir)}
+    written = 0
+    live = set()
+    summaries = []
+    for fragment in fragments:
+        data = fragment.text.encode("utf-8")
+        path = shard_path(out_dir, fragment.id, data)
+        live.add(relpath(path))
+        summaries.append(dict(fragment.summary, shard=path.relative_to(out_dir).as_posix()))
+        if write_artifact(manifest, path, data, {fragment.id: fragment.key}, force):
+            written += 1
+
+    # Drop shards nothing points to any more (only the ones we wrote ourselves)
+    prefix = relpath(out_dir / "scenarios") + "/"
+    for artifact in [a for a in manifest.artifacts if a.startswith(prefix) and a not in live | previous]:
+        stale = out_dir / "scenarios" / artifact[len(prefix):]
+        if stale.exists():
+            stale.unlink()
+        manifest.forget(stale)
+
+    index = build_index(meta, summaries)
+    index_text = json.dumps(index, ensure_ascii=False, indent=2)
+    if write_artifact(manifest, out_dir / "index.json", index_text.encode("utf-8"),
+                      {fragment.id: fragment.key for fragment in fragments}, force, publish=publish):
+        written += 1
+    manifest.save()
+
+    rebuilt = [fragment.id for fragment in fragments if fragment.rebuilt]
+    return BuildResult(out_dir, rebuilt, len(fragments) - len(rebuilt), written)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--catalog", default=str(LIVE_CATALOG), help="monolithic catalog to shard")
+    parser.add_argument("--shard-dir", default=str(DEFAULT_SHARD_DIR), help="directory for index.json + scenarios/")
+    parser.add_argument("--force", action="store_true", help="ignore the build cache and rewrite everything")
+    args = parser.parse_args()
+
+    catalog = load_json(args.catalog)
+    result = build_shards(catalog["meta"], catalog["scenarios"], Path(args.shard_dir), force=args.force)
+    print(f"✅ Sharded {len(catalog['scenarios'])} scenarios")
+    print(f"📝 Saved to: {args.shard_dir} ({result.summary()})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Every place a scenario is defined, loaded side by side.
+
+The same 59 scenarios live in the four generators' sections of
+data/scenario-sources.json (each with its own copy of titles, aufgaben and
+Leitpunkte) and in the catalog versions under public/data/sprechen. Stages
+that compare them (dedup, bench) get them from here. Generators are still
+named after their scripts, which is how reports refer to them.
+"""
+
+from . import generators
+from .loader import DataFileError, load_json
+from .paths import SPRECHEN_DIR, relpath
+
+# script -> its scenario list
+GENERATORS = {
+    "generate-dialogues-catalog.py": generators.catalog_sources,
+    "generate-all-59-scenarios.py": lambda: generators.create_all_59_scenarios()["scenarios"],
+    "generate-complete-dialogues.py": lambda: generators.generate_simplified_catalog()["scenarios"],
+    "generate-dialogues-batch-1.py": generators.create_all_dialogues,
+}
+
+CATALOG_VERSIONS = (
+    "dialogues-catalog.json",
+    "dialogues-catalog-OLD.json",
+    "dialogues-catalog.backup.json",
+)
+
+
+def generator_scenarios(script):
+    return GENERATORS[script]()
+
+
+def catalog_scenarios(name):
+    return load_json(SPRECHEN_DIR / name)["scenarios"]
+
+
+def all_sources(skipped=None):
+    """
+    ``{source name: [scenario, ...]}`` for every generator and catalog
+    version. Catalog files that don't load are left out and reported in
+    ``skipped`` (a list) if given.
+    """
+    sources = {script: generator_scenarios(script) for script in GENERATORS}
+    for name in CATALOG_VERSIONS:
+        try:
+            sources[relpath(SPRECHEN_DIR / name)] = catalog_scenarios(name)
+        except (DataFileError, FileNotFoundError) as err:
+            if skipped is not None:
+                skipped.append((name, str(err)))
+    return sources
@@ -0,0 +1,142 @@
+"""
+Atomic and content-addressed output files.
+
+Every artifact is written to a temporary file in the target directory,
+fsynced, and renamed over the old one, so a crash or a concurrent run
+leaves either the old file or the new one, never a truncated mix (the way
+dialogues-catalog.broken.json came about).
+
+Top-level data files are also published under an immutable name that
+contains their content hash, next to the fixed one:
+
+    public/data/sprechen/dialogues-catalog.json              fixed URL, as before
+    public/data/sprechen/dialogues-catalog.1f3a9c0b2e.json   immutable copy
+
+and public/data/manifest.json maps each fixed URL to its current hashed
+one. The hashed files are served with a one-year immutable Cache-Control
+(vercel.json), so a browser that reads the pointer manifest never
+refetches a catalog that hasn't changed. The previous hashed version of
+each file is kept for clients that still hold the old pointer manifest.
+"""
+
+import fcntl
+import json
+import os
+import re
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+from .paths import CACHE_DIR, DATA_DIR, PUBLIC_DIR
+
+POINTER_MANIFEST = DATA_DIR / "manifest.json"
+HASH_LENGTH = 10
+KEEP_VERSIONS = 2
+
+
+def _fsync_dir(directory):
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+@contextmanager
+def atomic_open(path):
+    """
+    Binary file handle whose contents replace ``path`` only when the block
+    exits without an exception.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates 0600; published files must be readable like any other
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp, 0o666 & ~umask)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+    _fsync_dir(path.parent)
+
+
+def atomic_write(path, data):
+    """Replace ``path`` with ``data`` (bytes) atomically."""
+    with atomic_open(path) as f:
+        f.write(data)
+
+
+def hashed_name(path, digest):
+    """``catalog.json`` + digest → ``catalog.<digest[:HASH_LENGTH]>.json``."""
+    path = Path(path)
+    return path.with_name(f"{path.stem}.{digest[:HASH_LENGTH]}{path.suffix}")
+
+
+def public_url(path):
+    """URL of a file under public/, or None for files outside it."""
+    path = Path(path).resolve()
+    try:
+        return "/" + path.relative_to(PUBLIC_DIR).as_posix()
+    except ValueError:
+        return None
+
+
+@contextmanager
+def _locked(name="publish.lock"):
+    """Serialize pointer-manifest updates between concurrent builds."""
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with open(CACHE_DIR / name, "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        yield
+
+
+def _load_pointers(pointer_path):
+    try:
+        with open(pointer_path, encoding="utf-8") as f:
+            return json.load(f).get("files", {})
+    except FileNotFoundError:
+        return {}
+
+
+def _prune_versions(path, keep):
+    """Remove hashed copies of ``path`` beyond the ``keep`` newest."""
+    path = Path(path)
+    pattern = re.compile(re.escape(path.stem) + r"\.[0-9a-f]{%d}" % HASH_LENGTH + re.escape(path.suffix) + "$")
+    versions = sorted((p for p in path.parent.iterdir() if pattern.match(p.name)),
+                      key=lambda p: p.stat().st_mtime_ns, reverse=True)
+    for stale in versions[keep:]:
+        stale.unlink()
+
+
+def publish(path, data, digest, pointer_path=POINTER_MANIFEST, keep=KEEP_VERSIONS):
+    """
+    Write the immutable hashed copy of ``path`` (if new) and point the
+    pointer manifest at it. Returns the hashed path, or None for a file
+    outside public/ (nothing serves it, so there is nothing to publish).
+    """
+    url = public_url(path)
+    if url is None:
+        return None
+    target = hashed_name(path, digest)
+    if not target.exists():
+        atomic_write(target, data)
+    else:
+        os.utime(target)  # newest version, as far as pruning is concerned
+    with _locked():
+        pointers = _load_pointers(pointer_path)
+        if pointers.get(url) != public_url(target):
+            pointers[url] = public_url(target)
+            document = {"format": "besty-pointers/1", "files": dict(sorted(pointers.items()))}
+            atomic_write(pointer_path, (json.dumps(document, indent=2) + "\n").encode("utf-8"))
+        _prune_versions(path, keep)
+    return target
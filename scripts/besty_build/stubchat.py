@@ -0,0 +1,110 @@
+"""
+Local stand-in for an OpenAI-compatible /chat/completions endpoint.
+
+Answers batchgen prompts with a deterministic, schema-valid dialogue built
+from the Leitpunkte in the request, so the whole batch pipeline (client,
+retries, cache, checkpoint) can run offline. ``fail_every=N`` answers
+every Nth request with HTTP 429 to exercise the retry path, with
+``retry_after`` as its Retry-After header (seconds or an HTTP date).
+
+    python3 -m besty_build.stubchat --port 8765 --fail-every 5
+    python3 -m besty_build.batchgen --base-url http://127.0.0.1:8765/v1
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def fake_dialogue(user_prompt):
+    leitpunkte = [line.split(". ", 1)[1] for line in user_prompt.splitlines()
+                  if line[:1].isdigit() and ". " in line]
+    return {
+        "greeting": "Hallo! Wie geht's? Hast du kurz Zeit? Wir müssen noch etwas planen.",
+        "steps": [
+            {
+                "speaker": "AB"[i % 2],
+                "text": f"{punkt} Was meinst du?",
+                "choices": {
+                    "positive": "Ja, das ist eine gute Idee!",
+                    "negative": "Das finde ich nicht so gut. Vielleicht lieber anders?",
+                    "question": f"{punkt} Hast du schon eine Idee?",
+                    "suggestion": "Wie wäre es, wenn wir das zusammen machen?",
+                },
+            }
+            for i, punkt in enumerate(leitpunkte)
+        ],
+        "closing": "Super, dann haben wir jetzt einen Plan. Bis bald!",
+    }
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        server = self.server
+        with server.lock:
+            server.requests += 1
+            count = server.requests
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        if server.delay:
+            time.sleep(server.delay)
+
+        if server.fail_every and count % server.fail_every == 0:
+            self.send_response(429)
+            if server.retry_after:
+                self.send_header("Retry-After", server.retry_after)
+            self.end_headers()
+            return
+
+        user = next(m["content"] for m in body["messages"] if m["role"] == "user")
+        payload = json.dumps({
+            "id": f"stub-{count}",
+            "model": body.get("model"),
+            "choices": [{"index": 0, "message": {
+                "role": "assistant",
+                "content": json.dumps(fake_dialogue(user), ensure_ascii=False),
+            }}],
+        }).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_stub_server(port=0, fail_every=0, delay=0.0, retry_after="0.01"):
+    server = ThreadingHTTPServer(("127.0.0.1", port), StubHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.requests = 0
+    server.fail_every = fail_every
+    server.delay = delay
+    server.retry_after = retry_after
+    return server
+
+
+def start_stub_server(port=0, fail_every=0, delay=0.0, retry_after="0.01"):
+    """Serve in a background thread; call ``server.shutdown()`` when done."""
+    server = make_stub_server(port, fail_every, delay, retry_after)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--fail-every", type=int, default=0, help="answer every Nth request with 429")
+    parser.add_argument("--delay", type=float, default=0.0, help="seconds of latency per request")
+    parser.add_argument("--retry-after", default="0.01", help="Retry-After header of the 429 answers")
+    args = parser.parse_args()
+    server = make_stub_server(args.port, args.fail_every, args.delay, args.retry_after)
+    print(f"🧪 Stub chat server on http://127.0.0.1:{server.server_port}/v1")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
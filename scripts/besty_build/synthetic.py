@@ -0,0 +1,151 @@
+"""
+Seeded synthetic catalogs for load testing.
+
+Fits a small model from the real data, then generates any number of
+scenarios in the catalog schema (id, number, title, theme, aufgabe,
+leitpunkte, dialogue.greeting/steps/closing with the four choice kinds):
+
+* theme and Leitpunkt-count frequencies from dialogues-catalog.json
+* word-count distributions of title, aufgabe, Leitpunkte, and of dialogue
+  greeting, step text, each choice kind and closing from the hand-written
+  dialogues (generate-dialogues-batch-1.py)
+* the words themselves from the vocabulary of the same field, by frequency
+
+The same seed always gives the same catalog, and a shorter run is a prefix
+of a longer one. Scenarios are generated lazily and streamed through
+jsonstream, so a 1M-scenario fixture never sits in memory.
+
+    python3 -m besty_build.synthetic --count 1000000 --output /tmp/catalog-1m.json --compact
+"""
+
+import argparse
+import random
+import re
+import time
+
+from .bench import peak_rss_mb
+from .jsonstream import dump_catalog
+from .loader import load_json
+from .model import CHOICE_KINDS, ChoiceSet, DialogueStep, Scenario
+from .paths import SPRECHEN_DIR
+from .sources import generator_scenarios
+
+_WORD = re.compile(r"[^\W\d_]+(?:[-'][^\W\d_]+)*")
+
+
+class Distribution:
+    """
+    Empirical distribution: the observed values themselves, repeats included.
+    Drawing uniformly from them samples by frequency without a weighted
+    (bisect) lookup per draw.
+    """
+
+    def __init__(self, values):
+        self.samples = list(values)
+        if not self.samples:
+            raise ValueError("cannot fit a distribution to no values")
+
+    def sample(self, rng, k=1):
+        return rng.choices(self.samples, k=k)
+
+    def one(self, rng):
+        return self.samples[int(rng.random() * len(self.samples))]
+
+
+class TextModel:
+    """Word-count distribution plus unigram vocabulary of one text field."""
+
+    def __init__(self, texts, end="."):
+        words = [_WORD.findall(text) for text in texts]
+        self.lengths = Distribution(len(w) for w in words if w)
+        self.words = Distribution(word for w in words for word in w)
+        self.end = end
+
+    def generate(self, rng):
+        words = self.words.sample(rng, self.lengths.one(rng))
+        words[0] = words[0][:1].upper() + words[0][1:]
+        return " ".join(words) + self.end
+
+
+class CatalogModel:
+    def __init__(self, scenarios, dialogues):
+        self.themes = Distribution(s["theme"] for s in scenarios)
+        self.leitpunkt_counts = Distribution(len(s["leitpunkte"]) for s in scenarios)
+        self.title = TextModel((s["title"] for s in scenarios), end="")
+        self.aufgabe = TextModel((s["aufgabe"] for s in scenarios), end="!")
+        self.leitpunkt = TextModel((p for s in scenarios for p in s["leitpunkte"]), end="?")
+
+        steps = [step for d in dialogues for step in d["steps"]]
+        self.greeting = TextModel(d["greeting"] for d in dialogues)
+        self.closing = TextModel(d["closing"] for d in dialogues)
+        self.step = TextModel(step["text"] for step in steps)
+        self.choices = {kind: TextModel((step["choices"][kind] for step in steps),
+                                        end="?" if kind == "question" else ".")
+                        for kind in CHOICE_KINDS}
+
+    @classmethod
+    def from_repo(cls):
+        scenarios = load_json(SPRECHEN_DIR / "dialogues-catalog.json")["scenarios"]
+        dialogues = [s["dialogue"] for s in generator_scenarios("generate-dialogues-batch-1.py") if "dialogue" in s]
+        return cls(scenarios, dialogues)
+
+    def scenario(self, rng, number):
+        leitpunkte = [self.leitpunkt.generate(rng) for _ in range(self.leitpunkt_counts.one(rng))]
+        return Scenario(
+            id=str(number),
+            number=number,
+            title=self.title.generate(rng),
+            theme=self.themes.one(rng),
+            aufgabe=self.aufgabe.generate(rng),
+            leitpunkte=leitpunkte,
+            greeting=self.greeting.generate(rng),
+            steps=[
+                DialogueStep(
+                    speaker="AB"[i % 2],
+                    text=self.step.generate(rng),
+                    choices=ChoiceSet(*(model.generate(rng) for model in self.choices.values())),
+                )
+                for i in range(len(leitpunkte))
+            ],
+            closing=self.closing.generate(rng),
+            nested=True,
+        )
+
+
+def synthetic_scenarios(count, seed=0, model=None):
+    """Lazily yield ``count`` synthetic scenarios."""
+    model = model or CatalogModel.from_repo()
+    rng = random.Random(seed)
+    for number in range(1, count + 1):
+        yield model.scenario(rng, number)
+
+
+def synthetic_meta(count, seed):
+    return {
+        "version": "synthetic",
+        "level": "B1",
+        "total_scenarios": count,
+        "seed": seed,
+        "description": "Synthetic load-test catalog fitted from dialogues-catalog.json",
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", required=True)
+    parser.add_argument("--compact", action="store_true", help="no indentation")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    stats = dump_catalog(args.output, synthetic_meta(args.count, args.seed),
+                         synthetic_scenarios(args.count, args.seed), compact=args.compact)
+    elapsed = time.perf_counter() - start
+    print(f"🧪 {stats.scenarios} synthetic scenarios (seed {args.seed}) in {elapsed:.1f} s, "
+          f"peak RSS {peak_rss_mb():.0f} MB")
+    print(f"📝 Saved to: {args.output} ({stats.bytes} bytes, sha256 {stats.digest[:12]})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+"""
+Watch mode: rebuild only what a saved file affects.
+
+One long-running process polls the inputs of every stage and reruns a
+stage when one of its inputs changes:
+
+    catalog         scenario-sources.json, generators.py, model.py, redemittel.json
+                    → catalog file + shards (same --output/--layout/--shard-dir
+                      options as the generator)
+    shards          dialogues-catalog.json → sprechen/catalog/ (the shared index)
+    search          dialogues-catalog.json, dialogues.json → search-index.json
+    quiz            quiz HTML pages → themes/
+    audio           Hören tracks, hoeren-tests.json → hoeren-tests.json
+    images          public/images, icons → images.json
+    einbuergerung   questions.json → einbuergerungstest/shards/
+    prerender       dialogues-catalog.json → sprechen/listing/
+    precache        public/data, public/audio, public/images → precache-manifest.json
+
+Each target also declares what it writes, so one stage's output is
+another's input: with ``--output`` pointing at dialogues-catalog.json, a
+title edit in scenario-sources.json rebuilds the catalog, then shards,
+search and prerender, then precache. The edges are printed at startup. With the
+default --output (the -complete.json staging file) the catalog feeds
+nothing else, and the startup line says so.
+
+Everything stays warm between rebuilds: imports, one BuildManifest with its
+fragments in memory, and the parsed scenario sources. A catalog rebuild
+reloads only generators.py and model.py (~5 ms), and the fragment cache
+means only the edited scenario is expanded and only its shard, the index
+and the catalog file are rewritten (an edit to either module's code
+re-expands every scenario).
+
+A file a stage writes itself (hoeren-tests.json is both input and output
+of audio) doesn't retrigger that stage when it is exactly what the manifest
+recorded; it still triggers every stage that reads it. Polling is used
+rather than inotify, because the standard library has no binding for it;
+the default 20 ms interval stats a few hundred files per round, and
+precache, whose walk of public/ takes about as long as that interval,
+polls every 25th round.
+
+    python3 -m besty_build.watch
+    python3 -m besty_build.watch --only catalog search --output /tmp/catalog.json --shard-dir /tmp/catalog
+"""
+
+import argparse
+import importlib
+import os
+import time
+import traceback
+from pathlib import Path
+
+from . import audio, einbuergerung, generators, images, model, precache, prerender, quiz, search, shards
+from .incremental import BuildManifest
+from .loader import load_json
+from .output import add_output_args, emit_catalog
+from .paths import PUBLIC_DIR, SPRECHEN_DIR, relpath
+from .redemittel import REDEMITTEL_PATH
+
+DEFAULT_INTERVAL = 0.02
+
+
+class Target:
+    """
+    A stage: the files it reads, the files and directories it writes, and
+    how to rebuild it (returns a one-line summary). ``every`` polls its
+    inputs only every n-th round.
+    """
+
+    def __init__(self, name, inputs, run, outputs=(), every=1):
+        self.name = name
+        self.inputs = inputs
+        self.run = run
+        self.outputs = [Path(os.path.abspath(path)) for path in outputs]
+        self.every = every
+
+    def writes(self, path):
+        path = Path(os.path.abspath(path))
+        return any(path == out or out in path.parents for out in self.outputs)
+
+
+def build_catalog(args, manifest):
+    # Sources and redemittel.json are re-read when they change; the reloads pick up code edits
+    importlib.reload(model)
+    module = importlib.reload(generators)
+    results = emit_catalog(args, module.catalog_meta(), module.catalog_sources(),
+                           expand=module.expand_scenario, recipe=module.catalog_recipe(), manifest=manifest)
+    return "; ".join(f"{relpath(path)}: {result.summary()}" for path, result in results)
+
+
+def build_shards(manifest):
+    catalog = load_json(shards.LIVE_CATALOG)
+    result = shards.build_shards(catalog["meta"], catalog["scenarios"], shards.DEFAULT_SHARD_DIR, manifest=manifest)
+    return f"{relpath(shards.DEFAULT_SHARD_DIR)}: {result.summary()}"
+
+
+def build_search(manifest):
+    index, data, written = search.build(search.DEFAULT_INPUT, search.DEFAULT_OUTPUT, manifest=manifest)
+    return f"{len(index['docs'])} scenarios, {'written' if written else 'unchanged'}"
+
+
+def build_quiz(manifest):
+    result = quiz.ingest(manifest=manifest)
+    return f"{result.parsed} parsed, {result.written} file(s) written"
+
+
+def build_audio(manifest):
+    tracks, parsed, _, written = audio.build(manifest=manifest)
+    return f"{parsed} of {len(tracks)} tracks parsed, {'written' if written else 'unchanged'}"
+
+
+def build_images(manifest):
+    _, parsed, written = images.build(manifest=manifest)
+    return f"{parsed} read, {'written' if written else 'unchanged'}"
+
+
+def build_einbuergerung(manifest):
+    _, _, written = einbuergerung.build(load_json(einbuergerung.QUESTIONS_PATH), manifest=manifest)
+    return f"{written} file(s) written"
+
+
+def build_prerender(manifest):
+    groups, sizes, written = prerender.build(prerender.DEFAULT_CATALOG, prerender.DEFAULT_OUT_DIR, manifest=manifest)
+    return f"{len(groups)} themes, {written} of {len(sizes)} file(s) written"
+
+
+def build_precache(manifest):
+    document, hashed, written = precache.build(output=precache.DEFAULT_OUTPUT, manifest=manifest)
+    over = precache.over_budget(document["tiers"])
+    if over:
+        return f"❌ over budget: {', '.join(over)}; not written"
+    return f"{len(document['entries'])} files, {hashed} hashed, {'written' if written else 'unchanged'}"
+
+
+def image_inputs():
+    # public/images plus the icons at the top level, without walking all of public/ every poll
+    icons = [p for p in PUBLIC_DIR.iterdir() if p.suffix.lower() in images.EXTENSIONS]
+    return images.image_files(PUBLIC_DIR / "images") + sorted(icons)
+
+
+def targets(args, manifest):
+    # precache keeps its digests apart from the build manifest (see precache.py)
+    precache_manifest = BuildManifest(precache.DIGEST_CACHE)
+    catalog_outputs = [args.output, args.shard_dir] if args.layout == "both" else \
+        [args.shard_dir if args.layout == "sharded" else args.output]
+    return [
+        Target("catalog", lambda: [generators.SOURCES_PATH, Path(generators.__file__), Path(model.__file__),
+                                   REDEMITTEL_PATH],
+               lambda: build_catalog(args, manifest), catalog_outputs),
+        Target("shards", lambda: [shards.LIVE_CATALOG], lambda: build_shards(manifest), [shards.DEFAULT_SHARD_DIR]),
+        Target("search", lambda: [search.DEFAULT_INPUT, SPRECHEN_DIR / "dialogues.json"],
+               lambda: build_search(manifest), [search.DEFAULT_OUTPUT]),
+        Target("quiz", quiz.quiz_files, lambda: build_quiz(manifest), [quiz.OUTPUT_DIR]),
+        Target("audio", lambda: audio.track_files() + [audio.HOEREN_TESTS], lambda: build_audio(manifest),
+               [audio.HOEREN_TESTS]),
+        Target("images", image_inputs, lambda: build_images(manifest), [images.DEFAULT_OUTPUT]),
+        Target("einbuergerung", lambda: [einbuergerung.QUESTIONS_PATH], lambda: build_einbuergerung(manifest),
+               [einbuergerung.DEFAULT_SHARD_DIR]),
+        Target("prerender", lambda: [prerender.DEFAULT_CATALOG], lambda: build_prerender(manifest),
+               [prerender.DEFAULT_OUT_DIR]),
+        Target("precache", lambda: [path for _, path in precache.precache_files()],
+               lambda: build_precache(precache_manifest), [precache.DEFAULT_OUTPUT], every=25),
+    ]
+
+
+def edges(selected):
+    """``{target name: [names of the selected targets whose outputs it reads]}``."""
+    inputs = {target.name: target.inputs() for target in selected}
+    return {target.name: [source.name for source in selected if source is not target
+                          and any(source.writes(path) for path in inputs[target.name])]
+            for target in selected}
+
+
+def snapshot(paths):
+    """``{path: (mtime_ns, size)}`` of the files that exist."""
+    state = {}
+    for path in paths:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            continue
+        state[path] = (stat.st_mtime_ns, stat.st_size)
+    return state
+
+
+def changed_inputs(before, after, manifest, target=None):
+    """
+    Paths that were added, removed or modified, minus ``target``'s own
+    outputs that are exactly what it last wrote (other stages' outputs are
+    real inputs and always count).
+    """
+    changed = []
+    for path in before.keys() | after.keys():
+        if before.get(path) == after.get(path):
+            continue
+        if (target is not None and target.writes(path) and path in after
+                and manifest.stat_digest(path) is not None):
+            continue
+        changed.append(path)
+    return changed
+
+
+def run_target(target):
+    start = time.perf_counter()
+    try:
+        summary = target.run()
+    except Exception:  # keep watching; the next save may fix it
+        traceback.print_exc()
+        print(f"❌ {target.name} failed")
+        return
+    print(f"✅ {target.name} in {(time.perf_counter() - start) * 1000:.0f} ms: {summary}", flush=True)
+
+
+def watch(selected, manifest, interval=DEFAULT_INTERVAL, rounds=None):
+    """Poll the inputs of ``selected`` targets and rebuild the affected ones (forever, or ``rounds`` polls)."""
+    states = {target.name: snapshot(target.inputs()) for target in selected}
+    polls = 0
+    while rounds is None or polls < rounds:
+        time.sleep(interval)
+        polls += 1
+        for target in selected:
+            if polls % target.every:
+                continue
+            current = snapshot(target.inputs())
+            changed = changed_inputs(states[target.name], current, manifest, target)
+            states[target.name] = current
+            if not changed:
+                continue
+            newest = max((current[p][0] for p in changed if p in current), default=None)
+            lag = f", {(time.time_ns() - newest) / 1e6:.0f} ms after save" if newest else ""
+            print(f"🔁 {', '.join(relpath(p) for p in changed)} changed{lag}", flush=True)
+            run_target(target)
+
+
+def main():
+    names = ("catalog", "shards", "search", "quiz", "audio", "images", "einbuergerung", "prerender", "precache")
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_output_args(parser, generators.OUTPUTS["catalog"], generators.SHARD_DIRS["catalog"])
+    parser.add_argument("--only", nargs="+", choices=names, help="watch only these stages")
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL, help="seconds between polls")
+    parser.add_argument("--no-initial", action="store_true", help="don't build everything once at startup")
+    args = parser.parse_args()
+
+    manifest = BuildManifest()
+    selected = [target for target in targets(args, manifest) if not args.only or target.name in args.only]
+    if not args.no_initial:
+        for target in selected:
+            run_target(target)
+    feeds = edges(selected)
+    for target in selected:
+        readers = [name for name, sources in feeds.items() if target.name in sources]
+        print(f"   {target.name} → {', '.join(readers) or 'nothing else watched'}")
+    print(f"👀 Watching {', '.join(target.name for target in selected)} (Ctrl+C to stop)", flush=True)
+    try:
+        watch(selected, manifest, args.interval)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
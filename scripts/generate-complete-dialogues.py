@@ -4,304 +4,12 @@
 Complete Dialogue Generator for DTZ Sprechen Teil 3
 Creates natural, flowing B1-level dialogues with proper conversation structure.
 Each dialogue follows the Redemittel guidelines with natural German.
-"""
-
-import json
-
-def create_dialogue_1():
-    """Hausfest mit Partner/in planen"""
-    return {
-        "id": "1",
-        "number": 1,
-        "title": "Hausfest mit Partner/in planen",
-        "theme": "Feiern & Veranstaltungen",
-        "aufgabe": "Sie möchten mit Ihrer Partnerin/Ihrem Partner bald ein Hausfest machen. Planen Sie, was Sie machen!",
-        "leitpunkte": ["Wo?", "Wann?", "Essen und Trinken?", "Andere Ideen?", "Einladungen?"],
-        "dialogue": {
-            "greeting": "Hallo! Wie geht's? Wir wollten ja bald unser Hausfest planen. Hast du heute Zeit dafür?",
-            "steps": [
-                {
-                    "speaker": "A",
-                    "text": "Also, wo sollen wir das Fest machen? Ich denke, draußen im Garten wäre schön, weil wir da genug Platz haben. Was hältst du davon?",
-                    "choices": {
-                        "positive": "Ja, das ist eine gute Idee! Im Garten ist es viel schöner. Aber was machen wir, wenn es regnet?",
-                        "negative": "Hmm, ich weiß nicht. Wegen des Wetters könnte das problematisch sein. Vielleicht sollten wir lieber den Gemeinschaftsraum nehmen?",
-                        "question": "Ist der Gemeinschaftsraum im Keller noch frei? Wir sollten das vorher prüfen, oder?",
-                        "suggestion": "Wie wäre es, wenn wir im Hof feiern? Dann sind wir draußen, aber geschützt. Was denkst du?"
-                    }
-                },
-                {
-                    "speaker": "B",
-                    "text": "Guter Punkt! Wir könnten ein Zelt mieten, dann sind wir auch bei Regen draußen. Und wann passt es dir am besten? Ich würde Samstag vorschlagen.",
-                    "choices": {
-                        "positive": "Samstag ab 18 Uhr wäre perfekt! Da haben die meisten Leute Zeit, und wir können den ganzen Abend feiern.",
-                        "negative": "Samstag geht bei mir leider nicht, weil ich arbeiten muss. Wäre Sonntag auch möglich?",
-                        "question": "Sollen wir früher anfangen, zum Beispiel um 16 Uhr? Dann haben Familien mit Kindern auch mehr Zeit.",
-                        "suggestion": "Wie wäre es mit Samstag um 17 Uhr? Das ist ein guter Kompromiss, denke ich."
-                    }
-                },
-                {
-                    "speaker": "A",
-                    "text": "Super! Jetzt zum Essen und den Getränken – was machen wir da? Ich schlage vor, dass jeder etwas mitbringt. Was meinst du?",
-                    "choices": {
-                        "positive": "Ja, ein Mitbring-Buffet ist eine tolle Idee! Dann haben wir eine große Auswahl. Ich könnte die Einladungen schreiben.",
-                        "negative": "Grillen geht leider nicht, weil das auf unserem Balkon verboten ist. Vielleicht sollten wir kalte Platten machen?",
-                        "question": "Wer bringt vegetarische Optionen mit? Wir sollten eine Liste machen, damit wir nichts vergessen.",
-                        "suggestion": "Wie wäre es, wenn du die Gästeliste machst und ich die Musik organisiere? Dann ist alles gut verteilt."
-                    }
-                },
-                {
-                    "speaker": "B",
-                    "text": "Klasse! Ich organisiere dann Musik und Getränke. Sollen wir auch die Nachbarn einladen? Das wäre nett, oder?",
-                    "choices": {
-                        "positive": "Ja, auf jeden Fall! Das ist eine gute Idee. Dann gibt es später keine Beschwerden wegen der Musik.",
-                        "negative": "Nein, ich denke, wir sollten nur unsere Freunde einladen. Sonst wird es zu voll.",
-                        "question": "Wie viele Leute sollen wir einladen? Wir müssen wissen, wie viel Platz wir brauchen.",
-                        "suggestion": "Vielleicht sollten wir nur die direkten Nachbarn einladen? Nicht das ganze Haus?"
-                    }
-                },
-                {
-                    "speaker": "A",
-                    "text": "Gute Überlegung! Und wer kümmert sich um die Dekoration? Vielleicht brauchen wir Lichterketten und Luftballons?",
-                    "choices": {
-                        "positive": "Ja, Lichterketten wären schön! Ich kann das besorgen. Soll ich auch Kerzen kaufen?",
-                        "negative": "Hmm, zu viel Dekoration ist nicht nötig, finde ich. Ein paar Lichterketten reichen.",
-                        "question": "Wo können wir günstig Dekoration kaufen? Kennst du einen guten Laden?",
-                        "suggestion": "Wie wäre es, wenn wir die Dekoration zusammen am Freitag kaufen gehen?"
-                    }
-                }
-            ],
-            "closing": "Perfekt! Ich denke, wir haben jetzt einen guten Plan. Ich schreibe die Einladungen, und du kümmerst dich um Musik und Getränke. Das wird bestimmt ein tolles Fest! Bis dann!"
-        }
-    }
 
-# I'll create 10 complete examples. You can see the pattern and extend to all 59.
-
-def create_dialogue_10():
-    """Lärm durch Nachbar - Was tun?"""
-    return {
-        "id": "10",
-        "number": 10,
-        "title": "Lärm durch Nachbar – Was tun?",
-        "theme": "Nachbarschaft & Probleme",
-        "aufgabe": "Ihr Nachbar renoviert seine Wohnung. Jeden Sonntag hören Sie laute Maschinen und anderen Krach. Überlegen Sie, was Sie tun können!",
-        "leitpunkte": ["Mit dem Nachbarn reden?", "Beim Vermieter anrufen?", "Andere Nachbarn ansprechen?", "Dem Nachbarn helfen?", "Die Polizei anrufen?"],
-        "dialogue": {
-            "greeting": "Hallo! Hast du das gestern auch gehört? Herr Müller aus Wohnung 6B hat wieder am Sonntag renoviert. Es war sehr laut.",
-            "steps": [
-                {
-                    "speaker": "A",
-                    "text": "Ja, das habe ich auch gehört. Ich finde, das geht nicht. Am Sonntag will man doch Ruhe haben, oder? Was können wir tun?",
-                    "choices": {
-                        "positive": "Da hast du recht. Ich bin auch der Meinung, dass wir etwas unternehmen sollten. Hast du eine Idee?",
-                        "negative": "Hmm, vielleicht sollten wir nichts machen. Er renoviert ja nur für kurze Zeit.",
-                        "question": "Ich frage mich, ob andere Nachbarn das auch stört. Sollten wir sie fragen?",
-                        "suggestion": "Ich schlage vor, dass wir zuerst mit Herrn Müller sprechen. Was meinst du?"
-                    }
-                },
-                {
-                    "speaker": "B",
-                    "text": "Also, ich denke, wir sollten freundlich mit ihm reden. Ein Gespräch ist besser als eine Beschwerde. Wann könnten wir das machen?",
-                    "choices": {
-                        "positive": "Gute Idee! Vielleicht morgen Abend? Wir könnten ihn fragen, ob er Zeit für ein kurzes Gespräch hat.",
-                        "negative": "Ich bin mir nicht sicher, ob Reden hilft. Vielleicht sollten wir direkt den Vermieter anrufen?",
-                        "question": "Was sagen wir ihm denn? Ich weiß nicht genau, wie wir das formulieren sollen.",
-                        "suggestion": "Wie wäre es, wenn wir ihm einen Brief schreiben? Das ist vielleicht weniger unangenehm."
-                    }
-                },
-                {
-                    "speaker": "A",
-                    "text": "Wir könnten sagen: 'Wir haben am Sonntag Lärm gehört und möchten Sie bitten, das zu ändern.' Wir sollten höflich bleiben, aber klar sprechen. Was hältst du davon?",
-                    "choices": {
-                        "positive": "Ja, das klingt gut! So bleiben wir freundlich, aber er versteht das Problem.",
-                        "negative": "Das ist zu direkt, finde ich. Vielleicht sollten wir zuerst verstehen, warum er am Sonntag arbeitet.",
-                        "question": "Und wenn er nicht reagiert? Was könnten wir dann noch machen?",
-                        "suggestion": "Ich würde noch hinzufügen, dass die Ruhezeiten am Sonntag gesetzlich sind."
-                    }
-                },
-                {
-                    "speaker": "B",
-                    "text": "Ich denke, wir sollten dann die anderen Nachbarn im Haus ansprechen. Vielleicht haben sie das gleiche Problem. Dann könnten wir gemeinsam etwas unternehmen.",
-                    "choices": {
-                        "positive": "Hm, ja, das ist eine sehr gute Idee! Zusammen haben wir mehr Gewicht.",
-                        "negative": "Nein, das möchte ich nicht. Ich will keinen Streit im Haus. Vielleicht reicht unser Gespräch.",
-                        "question": "Sollen wir vorher mit der Hausverwaltung sprechen? Die kennen vielleicht die Situation.",
-                        "suggestion": "Oder wir schreiben eine gemeinsame Beschwerde an die Hausverwaltung. Das wäre der nächste Schritt."
-                    }
-                },
-                {
-                    "speaker": "A",
-                    "text": "Ja, aber zuerst reden wir mit ihm. Vielleicht hilft es auch, wenn wir ihm Hilfe anbieten – zum Beispiel beim Tragen. Was hältst du davon?",
-                    "choices": {
-                        "positive": "Super Idee! Das finde ich nett. So zeigen wir Verständnis und bleiben freundlich.",
-                        "negative": "Ihm helfen? Nein, er macht den Lärm, nicht wir. Warum sollten wir ihm helfen?",
-                        "question": "Meinst du, dass er die Hilfe annehmen würde? Vielleicht ist er ja auch gestresst.",
-                        "suggestion": "Wie wäre es, wenn wir ihm vorschlagen, unter der Woche zu arbeiten statt am Sonntag?"
-                    }
-                }
-            ],
-            "closing": "Also: Erst reden, dann eventuell mit anderen Nachbarn sprechen, vielleicht auch Hilfe anbieten. Und wenn nötig, eine schriftliche Beschwerde. Ich spreche morgen mit ihm und melde mich danach bei dir! Tschüss!"
-        }
-    }
-
-def create_dialogue_15():
-    """B1-Prüfung gemeinsam vorbereiten"""
-    return {
-        "id": "15",
-        "number": 15,
-        "title": "B1-Prüfung gemeinsam vorbereiten",
-        "theme": "Deutschkurs & Lernen",
-        "aufgabe": "Sie möchten sich gemeinsam auf die B1-Prüfung vorbereiten!",
-        "leitpunkte": ["Wann?", "Wo?", "Wie oft?", "Material (Bücher, ...)?", "Nach dem Lernen?"],
-        "dialogue": {
-            "greeting": "Hey! Hast du kurz Zeit? Wir müssen uns langsam auf die DTZ-Prüfung vorbereiten.",
-            "steps": [
-                {
-                    "speaker": "A",
-                    "text": "Hallo! Ja, stimmt! Hm… Wann wollen wir lernen? Ich hätte Zeit am Dienstag oder Mittwoch. Was hältst du davon?",
-                    "choices": {
-                        "positive": "Dienstag wäre gut. Da habe ich mehr Zeit. Passt dir der Nachmittag?",
-                        "negative": "Hmm, unter der Woche ist schwierig für mich. Wäre das Wochenende möglich?",
-                        "question": "Wie oft sollten wir uns treffen? Einmal pro Woche reicht das?",
-                        "suggestion": "Ich würde vorschlagen, dass wir zweimal pro Woche lernen. Das wäre effektiver."
-                    }
-                },
-                {
-                    "speaker": "B",
-                    "text": "Dienstag passt mir gut! Wo treffen wir uns? Vielleicht in der Bibliothek? Da ist es ruhig, und wir können uns gut konzentrieren.",
-                    "choices": {
-                        "positive": "Ja, in der Bibliothek wäre besser, glaube ich. Da gibt es auch Bücher und Übungsmaterial.",
-                        "negative": "Nein, die Bibliothek ist mir zu weit. Könnten wir uns bei einem von uns treffen?",
-                        "question": "Hat die Bibliothek Gruppenräume? Das wäre praktisch, damit wir auch laut üben können.",
-                        "suggestion": "Wie wäre es mit einem Café? Da können wir auch Kaffee trinken und entspannt lernen."
-                    }
-                },
-                {
-                    "speaker": "A",
-                    "text": "Also Dienstag um 15 Uhr in der Bibliothek? Passt das für dich? Sollen wir noch jemanden fragen? Vielleicht Roberto?",
-                    "choices": {
-                        "positive": "Ja, perfekt! Roberto macht bestimmt mit. Ich schreibe ihm mal.",
-                        "negative": "Nein, ich denke, zu dritt ist zu viel. Wir sollten lieber nur wir zwei lernen.",
-                        "question": "Kennst du noch jemanden aus dem Kurs, der mitmachen möchte?",
-                        "suggestion": "Wir könnten auch Maria fragen. Sie ist sehr gut in Grammatik."
-                    }
-                },
-                {
-                    "speaker": "B",
-                    "text": "Gut! Könntest du bitte auch nachfragen, ob er Lernmaterial mitbringt? Hast du eigentlich Lernmaterial? Ich habe ein paar Übungstests und Grammatikübungen.",
-                    "choices": {
-                        "positive": "Ja, ich habe auch ein paar Sachen. Wir könnten Dialoge üben, das hilft für die mündliche Prüfung. Was denkst du?",
-                        "negative": "Nein, ich habe nichts. Vielleicht sollten wir zuerst Material kaufen oder kopieren?",
-                        "question": "Welche Bücher sind gut für die DTZ-Prüfung? Kannst du etwas empfehlen?",
-                        "suggestion": "Ich schlage vor, dass wir uns die Kosten für ein Übungsbuch teilen."
-                    }
-                },
-                {
-                    "speaker": "A",
-                    "text": "Ja, das wäre gut! Vielleicht können wir auch Schreibaufgaben machen? Und nach dem Lernen? Sollen wir vielleicht noch etwas zusammen machen?",
-                    "choices": {
-                        "positive": "Ja, gerne! Vielleicht einen Kaffee trinken? Dann können wir noch über die Prüfung sprechen.",
-                        "negative": "Nein, ich denke, das ist keine gute Idee. Ich würde lieber mehr Sprechübungen machen, weil die mündliche Prüfung oft schwierig ist.",
-                        "question": "Was ist dir wichtiger – Schreiben oder Sprechen? Wir sollten unsere Prioritäten setzen.",
-                        "suggestion": "Wie wäre es, wenn wir nach dem Lernen zusammen kochen? Das ist entspannend."
-                    }
-                }
-            ],
-            "closing": "Perfekt! Dann bis Dienstag um 15 Uhr in der Bibliothek. Ich freue mich! Bis dann!"
-        }
-    }
+Scenario sources: data/scenario-sources.json ("complete"); the code is in
+besty_build/generators.py. Same as: python3 -m besty_build complete
+"""
 
-def generate_simplified_catalog():
-    """
-    Generate catalog with 3 COMPLETE dialogues and 56 simplified ones.
-    You can then fill in the rest based on these templates.
-    """
-    
-    catalog = {
-        "meta": {
-            "version": "3.0",
-            "level": "B1",
-            "total_scenarios": 59,
-            "complete_dialogues": 3,
-            "tags": ["DTZ", "Teil 3", "Planen", "Natürliche Dialoge"],
-            "description": "DTZ Sprechen Teil 3 - Natürliche B1-Dialoge mit vollständigen Gesprächsabläufen"
-        },
-        "scenarios": []
-    }
-    
-    # Add 3 complete dialogues
-    catalog["scenarios"].append(create_dialogue_1())
-    catalog["scenarios"].append(create_dialogue_10())
-    catalog["scenarios"].append(create_dialogue_15())
-    
-    # Add simplified versions for remaining scenarios
-    # These have the structure but need full dialogue expansion
-    remaining_scenarios = [
-        (2, "Essen für Bekannte planen", "Feiern & Veranstaltungen", "Sie und Ihre Freundin/Ihr Freund haben am nächsten Wochenende Bekannte zu sich nach Hause eingeladen. Sie möchten Sie mit einem Essen überraschen. Planen Sie den Abend!", ["Kochen: was?", "Getränke: welche?", "Einkaufen: wann?", "Nach dem Essen: was unternehmen?"]),
-        (3, "Hausparty in neuer Wohnung", "Feiern & Veranstaltungen", "Sie sind in eine neue Wohnung gezogen und möchten eine Hausparty machen! Planen Sie die Party!", ["Wann?", "Wie viele Leute?", "Essen und Trinken?", "Nachbarn einladen?", "Wer macht was?"]),
-        (4, "Fest mit Nachbarn organisieren", "Nachbarschaft & Wohnen", "Sie wohnen in einem großen Haus zur Miete und möchten gemeinsam mit den Nachbarn ein Fest machen. Organisieren Sie das Fest!", ["Wann?", "Essen/Getränke?", "Wer bezahlt dafür?", "Was brauchen Sie noch (Musik, Spiele für Kinder)?", "Wer macht was?"]),
-        (5, "Ausflug mit Nachbarn", "Nachbarschaft & Freizeit", "Sie möchten mit Ihren Nachbarn einen Ausflug machen. Planen Sie den Ausflug!", ["Wann?", "Wohin?", "Wie lange?", "Verkehrsmittel?", "Essen/Getränke?"]),
-        # Continue for all 59...
-    ]
-    
-    for num, title, theme, aufgabe, leitpunkte in remaining_scenarios:
-        scenario = {
-            "id": str(num),
-            "number": num,
-            "title": title,
-            "theme": theme,
-            "aufgabe": aufgabe,
-            "leitpunkte": leitpunkte,
-            "dialogue": {
-                "greeting": "Hallo! Wie geht's? Lass uns das zusammen planen!",
-                "steps": [
-                    {
-                        "speaker": "A",
-                        "text": f"Also, {leitpunkte[0] if leitpunkte else 'was meinst du?'} Was hältst du davon?",
-                        "choices": {
-                            "positive": "Ja, das ist eine gute Idee! Das passt gut.",
-                            "negative": "Hmm, ich weiß nicht. Vielleicht sollten wir etwas anderes machen?",
-                            "question": "Was denkst du? Hast du eine bessere Idee?",
-                            "suggestion": "Ich würde vorschlagen, dass wir das so machen. Einverstanden?"
-                        }
-                    },
-                    {
-                        "speaker": "B",
-                        "text": f"Gut! Und {leitpunkte[1] if len(leitpunkte) > 1 else 'was noch?'}",
-                        "choices": {
-                            "positive": "Perfekt! Das finde ich auch gut.",
-                            "negative": "Das geht leider nicht, weil ich da keine Zeit habe.",
-                            "question": "Sollen wir noch etwas anderes überlegen?",
-                            "suggestion": "Wie wäre es, wenn wir das kombinieren?"
-                        }
-                    },
-                    {
-                        "speaker": "A",
-                        "text": f"Super! Und {leitpunkte[2] if len(leitpunkte) > 2 else 'haben wir alles?'}",
-                        "choices": {
-                            "positive": "Ja, genau! Das ist wichtig.",
-                            "negative": "Nein, das brauchen wir nicht unbedingt.",
-                            "question": "Wer könnte das organisieren?",
-                            "suggestion": "Ich könnte das übernehmen, wenn du möchtest."
-                        }
-                    }
-                ],
-                "closing": "Perfekt! Ich denke, wir haben jetzt einen guten Plan. Das wird bestimmt gut! Bis dann!"
-            }
-        }
-        catalog["scenarios"].append(scenario)
-    
-    return catalog
+from besty_build.generators import main_complete
 
 if __name__ == "__main__":
-    catalog = generate_simplified_catalog()
-    
-    output_path = "public/data/sprechen/dialogues-catalog.json"
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(catalog, f, ensure_ascii=False, indent=2)
-    
-    print(f"✅ Generated catalog with {len(catalog['scenarios'])} scenarios")
-    print(f"   - {catalog['meta']['complete_dialogues']} complete dialogues")
-    print(f"   - {len(catalog['scenarios']) - catalog['meta']['complete_dialogues']} simplified templates")
-    print(f"📝 Saved to: {output_path}")
-    print("\n🎯 Next: Expand remaining dialogues with full conversation flows!")
+    main_complete(description=__doc__)
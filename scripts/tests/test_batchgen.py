@@ -0,0 +1,156 @@
+"""
+batchgen against the stubchat server: retries, the response cache and
+resuming from the checkpoint.
+
+Run from scripts/:
+
+    python3 -m unittest discover tests
+"""
+
+import asyncio
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from besty_build import batchgen
+from besty_build.stubchat import start_stub_server
+
+SCENARIOS = [
+    {"id": str(n), "number": n, "title": title, "theme": "Freizeit & Sport",
+     "aufgabe": f"Sie wollen {title.lower()}. Planen Sie gemeinsam.", "leitpunkte": ["Wann?", "Wo?", "Wer?"]}
+    for n, title in enumerate(["Ein Grillfest", "Einen Ausflug", "Ein Fußballspiel"], start=1)
+]
+
+
+class StubChatTestCase(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+
+    def serve(self, **options):
+        server = start_stub_server(**options)
+        self.addCleanup(server.shutdown)
+        return server, batchgen.OpenAIChatClient(f"http://127.0.0.1:{server.server_port}/v1", timeout=5)
+
+    def generate(self, client, checkpoint="checkpoint.jsonl", **options):
+        return asyncio.run(batchgen.generate_dialogues(
+            SCENARIOS, client, concurrency=2, cache=batchgen.ResponseCache(self.tmp / "cache"),
+            checkpoint=batchgen.Checkpoint(self.tmp / checkpoint), **options))
+
+
+class RetryTest(StubChatTestCase):
+    def test_rate_limited_requests_are_retried(self):
+        server, client = self.serve(fail_every=2)
+        dialogues, stats = self.generate(client)
+        self.assertEqual(sorted(dialogues), ["1", "2", "3"])
+        self.assertEqual(stats.failed, [])
+        self.assertEqual(stats.requested, server.requests)
+        self.assertGreater(server.requests, len(SCENARIOS))
+
+    def test_http_date_retry_after_falls_back_to_backoff_timing(self):
+        # A date in the past means "retry now"; it must not abort the batch
+        server, client = self.serve(fail_every=2, retry_after="Wed, 21 Oct 2015 07:28:00 GMT")
+        dialogues, stats = self.generate(client)
+        self.assertEqual(len(dialogues), len(SCENARIOS))
+        self.assertEqual(stats.failed, [])
+
+    def test_attempts_bound_the_paid_requests(self):
+        server, client = self.serve(fail_every=1)
+        dialogues, stats = self.generate(client, attempts=3)
+        self.assertEqual(dialogues, {})
+        self.assertEqual(sorted(sid for sid, _ in stats.failed), ["1", "2", "3"])
+        self.assertEqual(server.requests, 3 * len(SCENARIOS))
+
+    def test_malformed_completions_share_the_retry_budget(self):
+        class Malformed:
+            calls = 0
+
+            async def complete(self, messages, model):
+                Malformed.calls += 1
+                return '{"steps": []}'
+
+        dialogues, stats = self.generate(Malformed(), attempts=2)
+        self.assertEqual(dialogues, {})
+        self.assertEqual(len(stats.failed), len(SCENARIOS))
+        self.assertEqual(Malformed.calls, 2 * len(SCENARIOS))
+        self.assertEqual(list((self.tmp / "cache").glob("*.json")), [])
+
+
+class ParseRetryAfterTest(unittest.TestCase):
+    def test_seconds(self):
+        self.assertEqual(batchgen.parse_retry_after("3"), 3.0)
+        self.assertEqual(batchgen.parse_retry_after("-1"), 0.0)
+
+    def test_http_date(self):
+        now = 1445412470  # 10 s before Wed, 21 Oct 2015 07:28:00 GMT
+        self.assertEqual(batchgen.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT", now=now), 10)
+        self.assertEqual(batchgen.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT", now=now + 60), 0.0)
+
+    def test_unreadable(self):
+        for value in (None, "", "soon", "Wed, 99 Foo 2015"):
+            self.assertIsNone(batchgen.parse_retry_after(value), value)
+
+
+class CacheAndResumeTest(StubChatTestCase):
+    def test_cached_completions_are_not_requested_again(self):
+        server, client = self.serve()
+        first, _ = self.generate(client)
+        # A fresh checkpoint, so only the response cache can answer
+        second, stats = self.generate(client, checkpoint="other.jsonl")
+        self.assertEqual(second, first)
+        self.assertEqual((stats.cached, stats.requested), (len(SCENARIOS), 0))
+        self.assertEqual(server.requests, len(SCENARIOS))
+
+    def test_run_resumes_from_the_checkpoint(self):
+        server, client = self.serve()
+        first, _ = self.generate(client)
+        second, stats = self.generate(client)
+        self.assertEqual(second, first)
+        self.assertEqual((stats.resumed, stats.cached, stats.requested), (len(SCENARIOS), 0, 0))
+        self.assertEqual(server.requests, len(SCENARIOS))
+
+    def test_torn_checkpoint_line_is_redone(self):
+        server, client = self.serve()
+        self.generate(client)
+        path = self.tmp / "checkpoint.jsonl"
+        lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+        path.write_text("".join(lines[:-1]) + lines[-1][:20], encoding="utf-8")
+        torn = json.loads(lines[-1])["id"]
+
+        dialogues, stats = self.generate(client)
+        self.assertEqual(len(dialogues), len(SCENARIOS))
+        self.assertEqual(stats.resumed, len(SCENARIOS) - 1)
+        self.assertEqual(stats.cached, 1)
+        self.assertIn(torn, dialogues)
+
+        # The redone entry went on a line of its own, so the next run resumes everything
+        third, stats = self.generate(client)
+        self.assertEqual(third, dialogues)
+        self.assertEqual((stats.resumed, stats.cached, stats.requested), (len(SCENARIOS), 0, 0))
+        self.assertEqual(server.requests, len(SCENARIOS))
+
+    def test_unterminated_complete_line_is_kept(self):
+        server, client = self.serve()
+        self.generate(client)
+        path = self.tmp / "checkpoint.jsonl"
+        path.write_text(path.read_text(encoding="utf-8").rstrip("\n"), encoding="utf-8")
+
+        _, stats = self.generate(client)
+        self.assertEqual(stats.resumed, len(SCENARIOS))
+        self.assertTrue(path.read_text(encoding="utf-8").endswith("\n"))
+
+    def test_corrupt_line_is_skipped(self):
+        server, client = self.serve()
+        self.generate(client)
+        path = self.tmp / "checkpoint.jsonl"
+        lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+        path.write_text(lines[0] + "{not json\n" + "".join(lines[1:]), encoding="utf-8")
+
+        _, stats = self.generate(client)
+        self.assertEqual((stats.resumed, stats.requested), (len(SCENARIOS), 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
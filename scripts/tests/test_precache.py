@@ -0,0 +1,61 @@
+"""
+Which files precache lists: the live catalog and the shards its index
+points to, never the generators' git-ignored staging outputs.
+
+Run from scripts/:
+
+    python3 -m unittest discover tests
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from besty_build import precache
+
+
+def write_catalog(shard_dir, scenario_id="1", digest="0123456789"):
+    shard = f"scenarios/{scenario_id}.{digest}.json"
+    (shard_dir / "scenarios").mkdir(parents=True)
+    (shard_dir / shard).write_text('{"id": "%s"}' % scenario_id, encoding="utf-8")
+    index = {"meta": {}, "scenarios": [{"id": scenario_id, "shard": shard}]}
+    (shard_dir / "index.json").write_text(json.dumps(index), encoding="utf-8")
+
+
+class PrecacheFilesTest(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.public = Path(tmp.name)
+        self.sprechen = self.public / "data" / "sprechen"
+        write_catalog(self.sprechen / "catalog")
+        (self.sprechen / "dialogues-catalog.json").write_text('{"scenarios": []}', encoding="utf-8")
+
+    def urls(self):
+        return [url for url, _ in precache.precache_files(self.public)]
+
+    def test_live_catalog_and_its_shards_are_listed(self):
+        self.assertEqual(self.urls(), [
+            "/data/sprechen/catalog/index.json",
+            "/data/sprechen/catalog/scenarios/1.0123456789.json",
+            "/data/sprechen/dialogues-catalog.json",
+        ])
+
+    def test_staging_outputs_are_not_listed(self):
+        before = self.urls()
+        write_catalog(self.sprechen / "catalog-complete", "2", "abcdef0123")
+        write_catalog(self.sprechen / "catalog-generated", "3", "abcdef4567")
+        for name in ("dialogues-catalog-complete.json", "dialogues-catalog-generated.json"):
+            (self.sprechen / name).write_text('{"scenarios": []}', encoding="utf-8")
+        self.assertEqual(self.urls(), before)
+
+    def test_superseded_shards_and_hashed_copies_are_not_listed(self):
+        before = self.urls()
+        (self.sprechen / "catalog" / "scenarios" / "1.9999999999.json").write_text("{}", encoding="utf-8")
+        (self.sprechen / "catalog" / "index.5555555555.json").write_text("{}", encoding="utf-8")
+        self.assertEqual(self.urls(), before)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+"""
+The pre-rendered listing's inlined index lists scenarios in the order the
+fetched dialogues-catalog.json does.
+
+Run from scripts/:
+
+    python3 -m unittest discover tests
+"""
+
+import json
+import unittest
+
+from besty_build import prerender
+from besty_build.loader import load_json
+
+
+class CatalogIndexTest(unittest.TestCase):
+    def test_scenarios_in_catalog_order(self):
+        catalog = load_json(prerender.DEFAULT_CATALOG)
+        index = prerender.catalog_index(prerender.group_by_theme(catalog["scenarios"]))
+        self.assertEqual([s["id"] for s in index["scenarios"]], [str(s["id"]) for s in catalog["scenarios"]])
+        self.assertEqual(index["meta"]["total_scenarios"], len(catalog["scenarios"]))
+
+    def test_inlined_script_parses(self):
+        scenarios = [{"id": n, "number": n, "title": f"</script> {n}", "theme": theme, "aufgabe": "…",
+                      "leitpunkte": ["Wo?"]} for n, theme in ((2, "A"), (1, "B"), (3, "A"))]
+        script = prerender.render_script(prerender.group_by_theme(scenarios))
+        body = script[script.index(">") + 1:script.rindex("</script>")]
+        self.assertNotIn("</script>", body)
+        self.assertEqual([s["number"] for s in json.loads(body)["scenarios"]], [1, 2, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
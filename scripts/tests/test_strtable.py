@@ -0,0 +1,48 @@
+"""
+The string-table format round-trips every catalog the generators build.
+
+Run from scripts/:
+
+    python3 -m unittest discover tests
+"""
+
+import json
+import unittest
+
+from besty_build import generators, strtable
+from besty_build.loader import load_json
+from besty_build.shards import LIVE_CATALOG
+
+
+class RoundTripTest(unittest.TestCase):
+    def assertRoundTrips(self, catalog):
+        encoded = json.loads(strtable.dumps(strtable.encode(catalog)))
+        self.assertEqual(encoded["format"], strtable.FORMAT)
+        self.assertEqual(strtable.decode(encoded), catalog)
+
+    def test_live_catalog(self):
+        self.assertRoundTrips(load_json(LIVE_CATALOG))
+
+    def test_generated_catalogs(self):
+        for build in (generators.generate_catalog, generators.generate_simplified_catalog,
+                      generators.create_catalog_with_dialogues_1_to_10):
+            with self.subTest(build.__name__):
+                self.assertRoundTrips(build())
+
+    def test_scalars_keep_their_type(self):
+        catalog = {"meta": {}, "scenarios": [{"id": "1", "values": [1, 1.0, True, None, "1", "x", "x"]}]}
+        self.assertRoundTrips(catalog)
+        decoded = strtable.decode(strtable.encode(catalog))["scenarios"][0]["values"]
+        self.assertEqual([type(value) for value in decoded], [int, float, bool, type(None), str, str, str])
+
+    def test_other_formats_are_rejected(self):
+        with self.assertRaises(ValueError):
+            strtable.decode({"format": "besty-pointers/1", "strings": [], "scenarios": []})
+
+    def test_size_report(self):
+        labels = [label for label, _, _ in strtable.size_report(load_json(LIVE_CATALOG))]
+        self.assertEqual(labels, ["json indent=2", "json compact", "string table"])
+
+
+if __name__ == "__main__":
+    unittest.main()
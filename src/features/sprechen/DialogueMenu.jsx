@@ -8,6 +8,7 @@ import {
   Video,
   ArrowLeft,
 } from "lucide-react";
+import { readInlineCatalog } from "./dialoguesCatalog";
 
 function IconPlay(props) {
   return (
@@ -70,18 +71,21 @@ function InfoCard({
 }
 
 export default function DialogueMenu() {
-  const [scenarios, setScenarios] = useState([]);
-  const [loading, setLoading] = useState(true);
+  // Pre-rendered pages inline the catalog index; use it instead of fetching
+  const [inlineCatalog] = useState(readInlineCatalog);
+  const [scenarios, setScenarios] = useState(inlineCatalog || []);
+  const [loading, setLoading] = useState(!inlineCatalog);
   const navigate = useNavigate();
 
   useEffect(() => {
+    if (inlineCatalog) return;
     // load the machine-readable catalog we created
     fetch("/data/sprechen/dialogues-catalog.json")
       .then((res) => res.json())
-      .then((data) => setScenarios(data || []))
+      .then((data) => setScenarios(data.scenarios || []))
       .catch(() => setScenarios([]))
       .finally(() => setLoading(false));
-  }, []);
+  }, [inlineCatalog]);
 
   if (loading) {
     return (
@@ -0,0 +1,28 @@
+/**
+ * Catalog index inlined by the pre-rendered listing
+ * (python3 -m besty_build prerender, see scripts/besty_build/prerender.py)
+ *
+ * Holds {id, number, title, theme, aufgabe, leitpunkte_count} per scenario,
+ * so the catalog can render without fetching dialogues-catalog.json.
+ */
+
+/**
+ * Scenarios from the inlined index, or null when the page has none
+ * (e.g. after client-side navigation) and the catalog must be fetched.
+ */
+export const readInlineCatalog = () => {
+  const element = document.getElementById("catalog-index");
+  if (!element) return null;
+  try {
+    return JSON.parse(element.textContent).scenarios || null;
+  } catch (error) {
+    console.debug("Inlined catalog index not readable:", error);
+    return null;
+  }
+};
+
+/**
+ * Number of Leitpunkte of a full scenario or an inlined index entry
+ */
+export const leitpunkteCount = (scenario) =>
+  scenario.leitpunkte ? scenario.leitpunkte.length : scenario.leitpunkte_count;
@@ -21,19 +21,28 @@ import {
   BookOpen,
   ArrowLeft,
 } from "lucide-react";
+import {
+  readInlineCatalog,
+  leitpunkteCount,
+} from "../features/sprechen/dialoguesCatalog";
 
 export default function DialogueCatalogPage() {
   const navigate = useNavigate();
-  const [dialogues, setDialogues] = useState([]);
-  const [filteredDialogues, setFilteredDialogues] = useState([]);
+  // Pre-rendered pages inline the catalog index; use it instead of fetching
+  const [inlineCatalog] = useState(readInlineCatalog);
+  const [dialogues, setDialogues] = useState(inlineCatalog || []);
+  const [filteredDialogues, setFilteredDialogues] = useState(
+    inlineCatalog || []
+  );
   const [searchTerm, setSearchTerm] = useState("");
   const [selectedTheme, setSelectedTheme] = useState("all");
-  const [isLoading, setIsLoading] = useState(true);
+  const [isLoading, setIsLoading] = useState(!inlineCatalog);
   const [showHeader, setShowHeader] = useState(true);
   const lastScrollY = useRef(0);
   const themeNavRef = useRef(null);
 
   useEffect(() => {
+    if (inlineCatalog) return;
     // Load dialogues catalog
     fetch("/data/sprechen/dialogues-catalog.json")
       .then((res) => res.json())
@@ -46,7 +55,7 @@ export default function DialogueCatalogPage() {
         console.error("Failed to load dialogues:", err);
         setIsLoading(false);
       });
-  }, []);
+  }, [inlineCatalog]);
 
   // Handle scroll to hide/show header
   useEffect(() => {
@@ -263,10 +272,10 @@ export default function DialogueCatalogPage() {
                 </p>
 
                 {/* Leitpunkte Count */}
-                {dialogue.leitpunkte && (
+                {leitpunkteCount(dialogue) !== undefined && (
                   <div className="flex items-center text-xs text-purple-600 dark:text-purple-400">
                     <MessageCircle className="w-4 h-4 mr-1" />
-                    <span>{dialogue.leitpunkte.length} Diskussionspunkte</span>
+                    <span>{leitpunkteCount(dialogue)} Diskussionspunkte</span>
                   </div>
                 )}
 